@@ -0,0 +1,25 @@
+import time
+from typing import Any, Callable
+
+
+def measure(function: Callable[[], Any], seconds: float = 1.0) -> float:
+    """Call the function repeatedly for the given time and return the number of calls per second."""
+    function()
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        for _ in range(16):
+            function()
+        calls += 16
+        now = time.perf_counter()
+        if now >= deadline:
+            return calls / (now - started)
+
+
+def print_table(title: str, rows: list[tuple[str, float]], baseline: float | None = None) -> None:
+    print(title)
+    baseline = baseline or rows[0][1]
+    for name, rate in rows:
+        print(f'  {name:<40} {rate:>12,.0f} ops/s  x{rate / baseline:.2f}')
+    print()
@@ -0,0 +1,67 @@
+"""Throughput of HS256, RS256, ES256 and EdDSA on the same payload, with PyJWT and the native drivers.
+
+Every config is compiled, so asymmetric keys are parsed once and only the signing and the verification
+are measured.
+
+Run: python -m benchmarks.algorithms
+"""
+
+import time
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import QuickJWTConfig
+from quick_jwt.drivers import EdDSADriver, HSDriver
+
+PAYLOAD = {'sub': '73031704-0799-4c4e-8689-3b91d35c2d18', 'role': 'admin', 'exp': int(time.time()) + 3600}
+HMAC_KEY = 'Some1! Key with enough length for HS512'
+
+
+def compile_plans(algorithm: str, encode_key: Any, decode_key: Any, driver: Any = None) -> list[tuple[str, Any]]:
+    plans = [
+        (
+            'PyJWT',
+            QuickJWTConfig(
+                encode_key=encode_key, decode_key=decode_key, encode_algorithm=algorithm, decode_algorithms=[algorithm]
+            ).compile(),
+        )
+    ]
+    if driver is not None:
+        config = QuickJWTConfig(
+            encode_key=encode_key,
+            decode_key=decode_key,
+            encode_algorithm=algorithm,
+            decode_algorithms=[algorithm],
+            driver=driver,
+        )
+        plans.append((type(driver).__name__, config.compile()))
+    return plans
+
+
+def main() -> None:
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    ed_key = ed25519.Ed25519PrivateKey.generate()
+    cases = [
+        ('HS256', HMAC_KEY, HMAC_KEY, HSDriver()),
+        ('RS256', rsa_key, rsa_key.public_key(), None),
+        ('ES256', ec_key, ec_key.public_key(), None),
+        ('EdDSA', ed_key, ed_key.public_key(), EdDSADriver()),
+    ]
+
+    encode_rows = []
+    decode_rows = []
+    for algorithm, encode_key, decode_key, driver in cases:
+        for name, plan in compile_plans(algorithm, encode_key, decode_key, driver):
+            token = plan.encode(PAYLOAD)
+            encode_rows.append((f'{algorithm} {name}', measure(lambda: plan.encode(PAYLOAD))))
+            decode_rows.append((f'{algorithm} {name}', measure(lambda: plan.decode(token))))
+
+    print_table('encode', encode_rows)
+    print_table('decode', decode_rows)
+
+
+if __name__ == '__main__':
+    main()
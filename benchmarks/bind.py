@@ -0,0 +1,35 @@
+"""Per-request cost of binding a dependency copy to the request versus mutating the shared instance.
+
+Run: python -m benchmarks.bind
+"""
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import QuickJWTConfig
+from quick_jwt.authentication import AccessTokenCheck, CreateJWT
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def main() -> None:
+    config = QuickJWTConfig(encode_key='key', decode_key='key')
+    request = Request({'type': 'http', 'headers': [], 'state': {'quick_jwt_config': config}})
+    response = Response()
+
+    for depends in (CreateJWT(Payload, Payload), AccessTokenCheck(Payload)):
+        rows = [
+            (
+                'shared instance (not request-safe)',
+                measure(lambda: depends._setup_call_function_params(request, response)),
+            ),
+            ('bound copy', measure(lambda: depends._bind(request, response))),
+        ]
+        print_table(type(depends).__name__, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""End-to-end requests per second of a protected endpoint: regular versus lightweight access check.
+
+Requests are sent straight to the ASGI application, so the rates only contain the work of FastAPI,
+the middleware and the dependency. Tokens are verified once per request, as with a cold cache.
+
+Run: python -m benchmarks.dependency
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import jwt
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from benchmarks._utils import print_table
+from quick_jwt import HSDriver, QuickJWTConfig, QuickJWTMiddleware, access_check_depends
+
+KEY = 'Some1! Key'
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/public')
+    async def public() -> None:
+        return None
+
+    @app.get('/regular')
+    async def regular(payload: access_check_depends(Payload)) -> None:
+        return None
+
+    @app.get('/lightweight')
+    async def lightweight(payload: access_check_depends(Payload, lightweight=True)) -> None:
+        return None
+
+    app.add_middleware(QuickJWTMiddleware, QuickJWTConfig(encode_key=KEY, decode_key=KEY, driver=HSDriver()))
+    return app
+
+
+async def requests_per_second(app: FastAPI, path: str, headers: list[tuple[bytes, bytes]], seconds: float) -> float:
+    async def receive() -> dict[str, Any]:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message['type'] == 'http.response.start':
+            assert message['status'] == 200, message
+
+    def scope() -> dict[str, Any]:
+        return {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'root_path': '',
+            'query_string': b'',
+            'headers': headers,
+            'server': ('test', 80),
+            'client': ('test', 1234),
+        }
+
+    await app(scope(), receive, send)
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        for _ in range(16):
+            await app(scope(), receive, send)
+        calls += 16
+        now = time.perf_counter()
+        if now >= deadline:
+            return calls / (now - started)
+
+
+async def run() -> None:
+    app = build_app()
+    await app.router.startup()
+    headers = [(b'authorization', f'Bearer {jwt.encode({"sub": "user"}, KEY)}'.encode())]
+
+    rows = [
+        (name, await requests_per_second(app, path, headers, seconds=1.0))
+        for name, path in (
+            ('no dependency', '/public'),
+            ('access_check_depends', '/regular'),
+            ('access_check_depends(lightweight=True)', '/lightweight'),
+        )
+    ]
+    print_table('protected endpoint, end to end', rows, baseline=rows[1][1])
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Issuing tokens from payload models: model_dump and PyJWT versus direct serialization.
+
+Run: python -m benchmarks.encode_model
+"""
+
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import QuickJWTConfig
+
+KEY = 'Some1! Key for the encode_model benchmark'
+
+
+class Payload(BaseModel):
+    sub: UUID
+    created_at: datetime
+    name: str
+    roles: list[str]
+    permissions: dict[str, bool]
+
+
+def _peak_memory(function: Callable[[], Any]) -> int:
+    function()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    payload = Payload(
+        sub=uuid4(),
+        created_at=datetime.now(timezone.utc),
+        name='user',
+        roles=['admin', 'user', 'support'],
+        permissions={f'permission_{index}': index % 2 == 0 for index in range(20)},
+    )
+    dict_plan = QuickJWTConfig(encode_key=KEY, decode_key=KEY).compile()
+    direct_plan = QuickJWTConfig(encode_key=KEY, decode_key=KEY, encode_payload_json=True).compile()
+    assert dict_plan.encode_model(payload) == direct_plan.encode_model(payload)
+
+    print_table(
+        'encode a payload model',
+        [
+            ('model_dump + PyJWT', measure(lambda: dict_plan.encode_model(payload))),
+            ('encode_payload_json', measure(lambda: direct_plan.encode_model(payload))),
+        ],
+    )
+
+    print('peak traced memory per token')
+    for name, plan in (('model_dump + PyJWT', dict_plan), ('encode_payload_json', direct_plan)):
+        print(f'  {name:<40} {_peak_memory(lambda: plan.encode_model(payload)):>12,} bytes')
+
+
+if __name__ == '__main__':
+    main()
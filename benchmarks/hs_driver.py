@@ -0,0 +1,56 @@
+"""Throughput of the PyJWT driver versus the native HMAC driver, on their own and through a compiled plan.
+
+Run: python -m benchmarks.hs_driver
+"""
+
+import time
+
+import jwt
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import QuickJWTConfig
+from quick_jwt.drivers import HSDriver
+
+KEY = 'Some1! Key with enough length for HS512'
+PAYLOAD = {'sub': '73031704-0799-4c4e-8689-3b91d35c2d18', 'role': 'admin', 'exp': int(time.time()) + 3600}
+
+
+def run(algorithm: str) -> None:
+    driver = HSDriver()
+    token = jwt.encode(PAYLOAD, KEY, algorithm)
+    algorithms = [algorithm]
+
+    pyjwt_encode = measure(lambda: jwt.encode(PAYLOAD, KEY, algorithm))
+    native_encode = measure(lambda: driver.encode(PAYLOAD, KEY, algorithm))
+    pyjwt_decode = measure(lambda: jwt.decode(token, KEY, algorithms))
+    native_decode = measure(lambda: driver.decode(token, KEY, algorithms))
+
+    print_table(f'{algorithm} encode', [('PyJWT', pyjwt_encode), ('HSDriver', native_encode)])
+    print_table(f'{algorithm} decode', [('PyJWT', pyjwt_decode), ('HSDriver', native_decode)])
+
+
+def run_plan() -> None:
+    pyjwt_plan = QuickJWTConfig(encode_key=KEY, decode_key=KEY).compile()
+    native_plan = QuickJWTConfig(encode_key=KEY, decode_key=KEY, driver=HSDriver()).compile()
+    token = pyjwt_plan.encode(PAYLOAD)
+
+    print_table(
+        'plan encode',
+        [
+            ('PyJWT', measure(lambda: pyjwt_plan.encode(PAYLOAD))),
+            ('HSDriver', measure(lambda: native_plan.encode(PAYLOAD))),
+        ],
+    )
+    print_table(
+        'plan decode',
+        [
+            ('PyJWT', measure(lambda: pyjwt_plan.decode(token))),
+            ('HSDriver', measure(lambda: native_plan.decode(token))),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    for algorithm in ('HS256', 'HS384', 'HS512'):
+        run(algorithm)
+    run_plan()
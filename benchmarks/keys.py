@@ -0,0 +1,51 @@
+"""Throughput of RS256 and ES256 with PEM keys parsed on every call versus prepared key objects.
+
+Run: python -m benchmarks.keys
+"""
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import QuickJWTConfig
+
+PAYLOAD = {'sub': '73031704-0799-4c4e-8689-3b91d35c2d18', 'role': 'admin'}
+
+
+def _pem_pair(private_key: rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey) -> tuple[bytes, bytes]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+def run(algorithm: str, private_key: rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey) -> None:
+    private_pem, public_pem = _pem_pair(private_key)
+    config = QuickJWTConfig(
+        encode_key=private_pem,
+        decode_key=public_pem,
+        encode_algorithm=algorithm,
+        decode_algorithms=[algorithm],
+    )
+    plan = config.compile()
+    driver = config.driver
+    token = plan.encode(PAYLOAD)
+
+    before_encode = measure(lambda: driver.encode(PAYLOAD, **config.build_encode_params()))
+    after_encode = measure(lambda: plan.encode(PAYLOAD))
+    before_decode = measure(lambda: driver.decode(token, **config.build_decode_params()))
+    after_decode = measure(lambda: plan.decode(token))
+
+    print_table(f'{algorithm} encode', [('PEM parsed per call', before_encode), ('prepared key', after_encode)])
+    print_table(f'{algorithm} decode', [('PEM parsed per call', before_decode), ('prepared key', after_decode)])
+
+
+if __name__ == '__main__':
+    run('RS256', rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    run('ES256', ec.generate_private_key(ec.SECP256R1()))
@@ -0,0 +1,53 @@
+"""Per-request overhead of QuickJWTMiddleware: building a Request versus writing the scope state.
+
+Run: python -m benchmarks.middleware
+"""
+
+from typing import Any
+
+from fastapi import Request
+from starlette.types import Receive, Scope, Send
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+    pass
+
+
+class RequestMiddleware(QuickJWTMiddleware):
+    """The previous implementation, which built a Request for every HTTP scope."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] in ('http',):
+            request = Request(scope, receive)
+            request.state.quick_jwt_config = self.config
+            scope['request'] = request
+
+        await self.app(scope, receive, send)
+
+
+def run_once(middleware: Any) -> None:
+    # The application never suspends, so the coroutine finishes on the first step
+    coroutine = middleware({'type': 'http', 'headers': []}, None, None)
+    try:
+        coroutine.send(None)
+    except StopIteration:
+        pass
+
+
+def main() -> None:
+    config = QuickJWTConfig(encode_key='key', decode_key='key')
+    request_middleware = RequestMiddleware(app, config)
+    state_middleware = QuickJWTMiddleware(app, config)
+    rows = [
+        ('no middleware', measure(lambda: run_once(app))),
+        ('Request per scope', measure(lambda: run_once(request_middleware))),
+        ('scope state', measure(lambda: run_once(state_middleware))),
+    ]
+    print_table('middleware call', rows)
+
+
+if __name__ == '__main__':
+    main()
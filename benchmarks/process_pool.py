@@ -0,0 +1,64 @@
+"""RS256 verification throughput of the process pool engine depending on the number of worker processes.
+
+Run: python -m benchmarks.process_pool
+"""
+
+import asyncio
+import os
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from benchmarks._utils import print_table
+from quick_jwt import QuickJWTConfig
+
+TOKENS = 4000
+
+
+def _build_config(workers: int) -> QuickJWTConfig:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return QuickJWTConfig(
+        encode_key=private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+        decode_key=private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ),
+        encode_algorithm='RS256',
+        decode_algorithms=['RS256'],
+        decode_process_workers=workers,
+        decode_process_batch_size=64,
+    )
+
+
+async def _decode_concurrently(config: QuickJWTConfig, tokens: list[str]) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(config.plan.decode_async(token) for token in tokens))
+    return len(tokens) / (time.perf_counter() - started)
+
+
+def run() -> None:
+    cores = os.cpu_count() or 1
+    inline_config = _build_config(workers=0)
+    tokens = [inline_config.plan.encode({'sub': str(index)}) for index in range(TOKENS)]
+
+    rows = [('inline on the event loop', asyncio.run(_decode_concurrently(inline_config, tokens)))]
+    workers = 1
+    while workers <= cores:
+        config = QuickJWTConfig(**{**inline_config.model_dump(), 'decode_process_workers': workers})
+        process_pool = config.plan.decode_process_pool
+        assert process_pool is not None
+        process_pool.start()
+        rows.append((f'{workers} worker process(es)', asyncio.run(_decode_concurrently(config, tokens))))
+        process_pool.shutdown()
+        workers *= 2
+
+    print_table(f'RS256 decode of {TOKENS} tokens, {cores} CPU cores', rows)
+
+
+if __name__ == '__main__':
+    run()
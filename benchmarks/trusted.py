@@ -0,0 +1,72 @@
+"""Payload model construction for wide models: full validation versus the trusted mode.
+
+Run: python -m benchmarks.trusted
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field, create_model, field_validator
+
+from benchmarks._utils import measure, print_table
+from quick_jwt.core.drivers import validate_payload
+
+WIDTH = 50
+
+
+def _build_model(width: int, constrained: bool) -> type[BaseModel]:
+    fields: dict[str, Any] = {'sub': (UUID, ...), 'created_at': (datetime, ...)}
+    for index in range(width):
+        field_type = (str, int, float, bool, list[str])[index % 5]
+        if constrained and field_type is str:
+            fields[f'field_{index}'] = (field_type, Field(pattern=r'^[a-z]+$', max_length=64))
+        elif constrained and field_type in (int, float):
+            fields[f'field_{index}'] = (field_type, Field(ge=0))
+        else:
+            fields[f'field_{index}'] = (field_type, ...)
+
+    validators: dict[str, Any] = {}
+    if constrained:
+        validators['check_lists'] = field_validator(*(f'field_{i}' for i in range(4, width, 5)))(
+            lambda cls, value: [item.strip() for item in value]
+        )
+    return create_model('WidePayload', __validators__=validators, **fields)
+
+
+def _build_payload(width: int) -> dict[str, Any]:
+    now = int(time.time())
+    payload: dict[str, Any] = {'sub': str(uuid4()), 'created_at': datetime.now(timezone.utc).isoformat()}
+    for index in range(width):
+        payload[f'field_{index}'] = ('value', index, index / 3, index % 2 == 0, ['a', 'b'])[index % 5]
+    payload.update(iat=now, exp=now + 3600)
+    return payload
+
+
+def main() -> None:
+    payload = _build_payload(WIDTH)
+    raw_payload = json.dumps(payload).encode()
+
+    for constrained in (False, True):
+        model = _build_model(WIDTH, constrained)
+        title = f'{WIDTH + 2} fields' + (' with constraints and validators' if constrained else '')
+        print_table(
+            f'{title}, dict payload',
+            [
+                ('model_validate', measure(lambda: validate_payload(model, payload, {}))),
+                ('trusted', measure(lambda: validate_payload(model, payload, {}, trusted=True))),
+            ],
+        )
+        print_table(
+            f'{title}, JSON payload',
+            [
+                ('model_validate_json', measure(lambda: validate_payload(model, raw_payload, {}))),
+                ('trusted', measure(lambda: validate_payload(model, raw_payload, {}, trusted=True))),
+            ],
+        )
+
+
+if __name__ == '__main__':
+    main()
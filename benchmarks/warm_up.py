@@ -0,0 +1,62 @@
+"""First token round trip of a fresh config, cold versus after warm_up.
+
+The rates are the inverse of the latency of a single encode and decode, as seen by the first request.
+
+Run: python -m benchmarks.warm_up
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from pydantic import BaseModel
+
+from benchmarks._utils import print_table
+from benchmarks.keys import _pem_pair
+from quick_jwt import EdDSADriver, QuickJWTConfig, warm_up
+
+HMAC_KEY = 'Some1! Key with enough length for HS512'
+
+
+class Payload(BaseModel):
+    sub: str
+    role: str
+
+
+def first_round_trip(config: QuickJWTConfig) -> float:
+    started = time.perf_counter()
+    plan = config.plan
+    token = plan.encode_model(Payload(sub='73031704-0799-4c4e-8689-3b91d35c2d18', role='admin'))
+    Payload.model_validate(plan.decode(token))
+    return time.perf_counter() - started
+
+
+def run(algorithm: str, encode_key: Any, decode_key: Any, driver: Any = None) -> None:
+    def build() -> QuickJWTConfig:
+        params: dict[str, Any] = {'encode_algorithm': algorithm, 'decode_algorithms': [algorithm]}
+        if driver is not None:
+            params['driver'] = driver()
+        return QuickJWTConfig(encode_key=encode_key, decode_key=decode_key, **params)
+
+    cold = first_round_trip(build())
+    warmed_config = build()
+    report = asyncio.run(warm_up(warmed_config, Payload))
+    warm = first_round_trip(warmed_config)
+
+    print_table(
+        f'{algorithm} first round trip (warm_up took {report.total * 1000:.2f} ms)',
+        [('cold', 1 / cold), ('after warm_up', 1 / warm)],
+    )
+
+
+def main() -> None:
+    run('HS256', HMAC_KEY, HMAC_KEY)
+    run('RS256', *_pem_pair(rsa.generate_private_key(public_exponent=65537, key_size=2048)))
+    run('ES256', *_pem_pair(ec.generate_private_key(ec.SECP256R1())))
+    eddsa_key = ed25519.Ed25519PrivateKey.generate()
+    run('EdDSA', eddsa_key, eddsa_key.public_key(), EdDSADriver)
+
+
+if __name__ == '__main__':
+    main()
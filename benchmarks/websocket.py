@@ -0,0 +1,56 @@
+"""Cost of re-validating 50k open websockets: WebSocketWatcher versus scanning every connection.
+
+Run: python -m benchmarks.websocket
+"""
+
+import time
+from typing import Any
+
+from benchmarks._utils import measure, print_table
+from quick_jwt import WebSocketWatcher
+
+CONNECTIONS = 50_000
+
+
+class FakeWebSocket:
+    pass
+
+
+def run_once(coroutine: Any) -> None:
+    # Nothing expires and no revocation callback is set, so the check never suspends
+    try:
+        coroutine.send(None)
+    except StopIteration:
+        pass
+
+
+def main() -> None:
+    now = time.time()
+    payloads = [{'sub': str(i), 'jti': str(i), 'exp': now + 3600 + i} for i in range(CONNECTIONS)]
+    websockets: list[Any] = [FakeWebSocket() for _ in range(CONNECTIONS)]
+
+    watcher = WebSocketWatcher()
+    for websocket, payload in zip(websockets, payloads):
+        watcher.watch(websocket, payload)
+    revoked: set[str] = set()
+
+    def scan() -> int:
+        current = time.time()
+        return sum(1 for payload in payloads if payload['exp'] <= current or payload['jti'] in revoked)
+
+    rows = [
+        ('scan every connection', measure(scan)),
+        ('WebSocketWatcher.check', measure(lambda: run_once(watcher.check()))),
+    ]
+    print_table(f'check of {CONNECTIONS:,} connections', rows)
+
+    def churn() -> None:
+        websocket = websockets[0]
+        watcher.discard(websocket)
+        watcher.watch(websocket, payloads[0])
+
+    print_table('connection churn', [('discard + watch', measure(churn))])
+
+
+if __name__ == '__main__':
+    main()
@@ -8,12 +8,19 @@ from quick_jwt.depends import (
     logout_depends,
     access_check_optional_depends,
     refresh_check_optional_depends,
+    access_check_websocket_depends,
 )
-from quick_jwt.dto import JWTTokensDTO
+from quick_jwt.dto import JWTTokensDTO, TokenVerificationDTO, WarmUpDTO
+from quick_jwt.batch import verify_many, verify_many_async, mint_many, mint_many_async
+from quick_jwt.drivers import HSDriver, EdDSADriver
+from quick_jwt.websocket import WebSocketWatcher
+from quick_jwt.warmup import warm_up, quick_jwt_lifespan
 
 __all__ = (
     'QuickJWTConfig',
     'JWTTokensDTO',
+    'TokenVerificationDTO',
+    'WarmUpDTO',
     'QuickJWTMiddleware',
     'access_check_depends',
     'refresh_check_depends',
@@ -22,4 +29,14 @@ __all__ = (
     'logout_depends',
     'access_check_optional_depends',
     'refresh_check_optional_depends',
+    'access_check_websocket_depends',
+    'verify_many',
+    'verify_many_async',
+    'mint_many',
+    'mint_many_async',
+    'HSDriver',
+    'EdDSADriver',
+    'WebSocketWatcher',
+    'warm_up',
+    'quick_jwt_lifespan',
 )
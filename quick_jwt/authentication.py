@@ -1,36 +1,53 @@
-from typing import Type, Unpack, Self
+from datetime import timedelta
+from typing import AsyncIterator, Type, Unpack, Self
 
-from fastapi import Request, Response
+from fastapi import Request, Response, WebSocket, WebSocketException, status
+from fastapi.security import HTTPBearer
+from fastapi.security.base import SecurityBase
+from jwt import InvalidTokenError
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from quick_jwt.core._function_args import ModelValidateKwargs
-from quick_jwt.core.abc import BaseJWT
-from quick_jwt.core.drivers import PyJWTDecodeDriverJWT, PyJWTEncodeDriverJWT
-from quick_jwt.core.security import access_bearer_security, refresh_bearer_security
+from quick_jwt.core.abc import BaseJWT, get_config_from_scope
+from quick_jwt.core.cookies import read_cookie
+from quick_jwt.core.drivers import PyJWTDecodeDriverJWT, PyJWTEncodeDriverJWT, decode_once, validate_payload
+from quick_jwt.core.security import (
+    access_bearer_security,
+    refresh_bearer_security,
+    read_bearer_token,
+    read_websocket_token,
+)
+from quick_jwt.websocket import WebSocketWatcher
 
 
 class CreateJWT(PyJWTEncodeDriverJWT):
+    __slots__ = ()
+
     async def __call__(
         self,
         request: Request,
         response: Response,
     ) -> Self:
-        self._setup_call_function_params(request, response)
-        return self
+        return self._bind(request, response)
 
 
 class AccessTokenCheck(PyJWTDecodeDriverJWT):
     __slots__ = (
         '_payload_model',
+        '_trusted',
         '_model_validate_kwargs',
     )
 
     def __init__(
         self,
         payload_model: Type[BaseModel],
+        *,
+        trusted: bool = False,
         **model_validate_kwargs: Unpack[ModelValidateKwargs],
     ):
         self._payload_model = payload_model
+        self._trusted = trusted
         self._model_validate_kwargs = model_validate_kwargs
 
         super().__init__()
@@ -41,27 +58,31 @@ class AccessTokenCheck(PyJWTDecodeDriverJWT):
         response: Response,
         bearer_token: access_bearer_security,
     ) -> BaseModel:
-        self._setup_call_function_params(request, response)
-        config = self._get_config()
+        context = self._bind(request, response)
+        config = context._get_config()
 
-        cookie_token = request.cookies.get(config.access_token_name)
-        raw_payload = self._get_payload(bearer_token, cookie_token)
+        cookie_token = read_cookie(request.scope, config.access_token_name)
+        raw_payload = await context._get_payload(bearer_token, cookie_token)
 
-        return self._payload_model.model_validate(raw_payload, **self._model_validate_kwargs)
+        return validate_payload(self._payload_model, raw_payload, self._model_validate_kwargs, self._trusted)
 
 
 class RefreshTokenCheck(PyJWTDecodeDriverJWT):
     __slots__ = (
         '_payload_model',
+        '_trusted',
         '_model_validate_kwargs',
     )
 
     def __init__(
         self,
         payload_model: Type[BaseModel],
+        *,
+        trusted: bool = False,
         **model_validate_kwargs: Unpack[ModelValidateKwargs],
     ) -> None:
         self._payload_model = payload_model
+        self._trusted = trusted
         self._model_validate_kwargs = model_validate_kwargs
 
         super().__init__()
@@ -72,13 +93,13 @@ class RefreshTokenCheck(PyJWTDecodeDriverJWT):
         response: Response,
         bearer_token: refresh_bearer_security,
     ) -> BaseModel:
-        self._setup_call_function_params(request, response)
-        config = self._get_config()
+        context = self._bind(request, response)
+        config = context._get_config()
 
-        cookie_token = request.cookies.get(config.refresh_token_name)
-        raw_payload = self._get_payload(bearer_token, cookie_token)
+        cookie_token = read_cookie(request.scope, config.refresh_token_name)
+        raw_payload = await context._get_payload(bearer_token, cookie_token)
 
-        return self._payload_model.model_validate(raw_payload, **self._model_validate_kwargs)
+        return validate_payload(self._payload_model, raw_payload, self._model_validate_kwargs, self._trusted)
 
 
 class RefreshJWT(PyJWTEncodeDriverJWT, PyJWTDecodeDriverJWT):
@@ -100,41 +121,49 @@ class RefreshJWT(PyJWTEncodeDriverJWT, PyJWTDecodeDriverJWT):
         response: Response,
         bearer_token: refresh_bearer_security,
     ) -> Self:
-        self._setup_call_function_params(request, response)
-        config = self._get_config()
+        context = self._bind(request, response)
+        config = context._get_config()
 
-        cookie_token = request.cookies.get(config.refresh_token_name)
-        self.payload = self._get_payload(bearer_token, cookie_token)
+        cookie_token = read_cookie(request.scope, config.refresh_token_name)
+        payload = await context._get_payload(bearer_token, cookie_token)
+        if isinstance(payload, bytes):
+            payload = from_json(payload)
+        context.payload = payload
 
-        return self
+        return context
 
 
 class LogoutJWT(BaseJWT):
+    __slots__ = ()
+
     async def __call__(
         self,
         request: Request,
         response: Response,
         bearer_token: access_bearer_security,
     ) -> None:
-        self._setup_call_function_params(request, response)
-        config = self._get_config()
+        plan = self._bind(request, response)._get_config().plan
 
-        response.delete_cookie(config.access_token_name)
-        response.delete_cookie(config.refresh_token_name)
+        plan.access_cookie.delete(response)
+        plan.refresh_cookie.delete(response)
 
 
 class AccessTokenOptionalCheck(PyJWTDecodeDriverJWT):
     __slots__ = (
         '_payload_model',
+        '_trusted',
         '_model_validate_kwargs',
     )
 
     def __init__(
         self,
         payload_model: Type[BaseModel],
+        *,
+        trusted: bool = False,
         **model_validate_kwargs: Unpack[ModelValidateKwargs],
     ) -> None:
         self._payload_model = payload_model
+        self._trusted = trusted
         self._model_validate_kwargs = model_validate_kwargs
 
         super().__init__()
@@ -145,29 +174,33 @@ class AccessTokenOptionalCheck(PyJWTDecodeDriverJWT):
         response: Response,
         bearer_token: access_bearer_security,
     ) -> BaseModel | None:
-        self._setup_call_function_params(request, response)
-        config = self._get_config()
+        context = self._bind(request, response)
+        config = context._get_config()
 
-        cookie_token = request.cookies.get(config.access_token_name)
-        raw_payload = self._get_payload_optional(bearer_token, cookie_token)
+        cookie_token = read_cookie(request.scope, config.access_token_name)
+        raw_payload = await context._get_payload_optional(bearer_token, cookie_token)
         if raw_payload is None:
             return None
 
-        return self._payload_model.model_validate(raw_payload, **self._model_validate_kwargs)
+        return validate_payload(self._payload_model, raw_payload, self._model_validate_kwargs, self._trusted)
 
 
 class RefreshTokenOptionalCheck(PyJWTDecodeDriverJWT):
     __slots__ = (
         '_payload_model',
+        '_trusted',
         '_model_validate_kwargs',
     )
 
     def __init__(
         self,
         payload_model: Type[BaseModel],
+        *,
+        trusted: bool = False,
         **model_validate_kwargs: Unpack[ModelValidateKwargs],
     ) -> None:
         self._payload_model = payload_model
+        self._trusted = trusted
         self._model_validate_kwargs = model_validate_kwargs
 
         super().__init__()
@@ -178,12 +211,130 @@ class RefreshTokenOptionalCheck(PyJWTDecodeDriverJWT):
         response: Response,
         bearer_token: refresh_bearer_security,
     ) -> BaseModel | None:
-        self._setup_call_function_params(request, response)
-        config = self._get_config()
+        context = self._bind(request, response)
+        config = context._get_config()
 
-        cookie_token = request.cookies.get(config.refresh_token_name)
-        raw_payload = self._get_payload_optional(bearer_token, cookie_token)
+        cookie_token = read_cookie(request.scope, config.refresh_token_name)
+        raw_payload = await context._get_payload_optional(bearer_token, cookie_token)
         if raw_payload is None:
             return None
 
-        return self._payload_model.model_validate(raw_payload, **self._model_validate_kwargs)
+        return validate_payload(self._payload_model, raw_payload, self._model_validate_kwargs, self._trusted)
+
+
+class WebSocketAccessTokenCheck(PyJWTDecodeDriverJWT):
+    __slots__ = (
+        '_payload_model',
+        '_watcher',
+        '_trusted',
+        '_model_validate_kwargs',
+    )
+
+    def __init__(
+        self,
+        payload_model: Type[BaseModel],
+        *,
+        watcher: WebSocketWatcher | None = None,
+        trusted: bool = False,
+        **model_validate_kwargs: Unpack[ModelValidateKwargs],
+    ) -> None:
+        self._payload_model = payload_model
+        self._watcher = watcher
+        self._trusted = trusted
+        self._model_validate_kwargs = model_validate_kwargs
+
+        super().__init__()
+
+    async def __call__(self, websocket: WebSocket) -> AsyncIterator[BaseModel]:
+        context = self._bind(websocket, None)
+        config = context._get_config()
+
+        token = read_websocket_token(websocket.scope, config.access_token_name)
+        if token is None:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+        try:
+            raw_payload = await context._decode_once(token)
+        except InvalidTokenError:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+        payload = validate_payload(self._payload_model, raw_payload, self._model_validate_kwargs, self._trusted)
+        watcher = self._watcher
+        if watcher is None:
+            yield payload
+            return
+
+        if isinstance(raw_payload, bytes):
+            raw_payload = from_json(raw_payload)
+        leeway = config.decode_leeway
+        if isinstance(leeway, timedelta):
+            leeway = leeway.total_seconds()
+        watcher.watch(websocket, raw_payload, leeway)
+        try:
+            yield payload
+        finally:
+            watcher.discard(websocket)
+
+
+class LightweightTokenCheck(SecurityBase):
+    """Token check reading the cookie and the ``authorization`` header straight from the ASGI scope.
+
+    The regular checks declare the request, the response and an ``HTTPBearer`` security parameter,
+    which FastAPI solves as separate dependencies on every call. This check is a single dependency
+    with the request as its only parameter. It carries the model and the scheme name of the bearer
+    scheme, so OpenAPI documents the same security scheme.
+
+    Args:
+        payload_model: Model the payload is validated with.
+        bearer: Bearer scheme published in OpenAPI.
+        refresh: Check the refresh token instead of the access token.
+        optional: Return None instead of raising when the token is missing or invalid.
+        trusted: Construct the payload model without a full validation.
+    """
+
+    __slots__ = (
+        '_payload_model',
+        '_refresh',
+        '_optional',
+        '_trusted',
+        '_model_validate_kwargs',
+    )
+
+    def __init__(
+        self,
+        payload_model: Type[BaseModel],
+        bearer: HTTPBearer,
+        *,
+        refresh: bool = False,
+        optional: bool = False,
+        trusted: bool = False,
+        **model_validate_kwargs: Unpack[ModelValidateKwargs],
+    ) -> None:
+        self.model = bearer.model
+        self.scheme_name = bearer.scheme_name
+        self._payload_model = payload_model
+        self._refresh = refresh
+        self._optional = optional
+        self._trusted = trusted
+        self._model_validate_kwargs = model_validate_kwargs
+
+    async def __call__(self, request: Request) -> BaseModel | None:
+        scope = request.scope
+        config = get_config_from_scope(scope)
+        plan = config.plan
+
+        token = read_cookie(scope, plan.refresh_token_name if self._refresh else plan.access_token_name)
+        if token is None:
+            token = read_bearer_token(scope)
+        if token is None:
+            if self._optional:
+                return None
+            raise config.build_unauthorized_http_exception()
+
+        try:
+            raw_payload = await decode_once(plan, scope, token)
+        except InvalidTokenError:
+            if self._optional:
+                return None
+            raise config.build_unauthorized_http_exception()
+
+        return validate_payload(self._payload_model, raw_payload, self._model_validate_kwargs, self._trusted)
@@ -0,0 +1,154 @@
+import math
+from collections import defaultdict
+from functools import partial
+from typing import Iterable, Type, Unpack
+
+from anyio import to_thread
+from jwt import InvalidAlgorithmError, InvalidTokenError, get_unverified_header
+from pydantic import BaseModel, ValidationError
+
+from quick_jwt.config import QuickJWTConfig
+from quick_jwt.core._function_args import ModelValidateKwargs
+from quick_jwt.core.drivers import validate_payload
+from quick_jwt.dto import JWTTokensDTO, TokenVerificationDTO
+
+
+def _rejected(token: str, error: Exception) -> TokenVerificationDTO:
+    return TokenVerificationDTO(token=token, error=type(error).__name__, detail=str(error))
+
+
+def verify_many[PayloadModelType: BaseModel](
+    tokens: Iterable[str],
+    payload_model: Type[PayloadModelType],
+    config: QuickJWTConfig,
+    **model_validate_kwargs: Unpack[ModelValidateKwargs],
+) -> list[TokenVerificationDTO]:
+    """Verify many tokens at once outside of a request, for example to re-check every open session.
+
+    Identical tokens are verified only once. Tokens which fail the pre-check of the config, such as
+    too long tokens or tokens with a forbidden algorithm, are rejected before their header is parsed.
+    The rest are grouped by the ``kid`` and ``alg`` headers. The decode cache and the process pool
+    of the config are used when enabled.
+
+    Args:
+        tokens: Token strings to verify.
+        payload_model: Pydantic model the payload of every valid token is converted into.
+        config: Configuration used to decode the tokens.
+        **model_validate_kwargs: Arguments for the model_validate function of the payload model.
+
+    Returns:
+        A result for every token, in the order of the tokens. Rejected tokens carry the error
+        instead of raising it.
+    """
+    plan = config.plan
+    tokens = list(tokens)
+    results: dict[str, TokenVerificationDTO] = {}
+    groups: defaultdict[tuple[str | None, str], list[str]] = defaultdict(list)
+
+    for token in dict.fromkeys(tokens):
+        try:
+            plan.decode_precheck.check(token)
+            header = get_unverified_header(token)
+        except InvalidTokenError as e:
+            results[token] = _rejected(token, e)
+            continue
+
+        algorithm = header.get('alg')
+        if not isinstance(algorithm, str) or (
+            config.decode_algorithms is not None and algorithm not in config.decode_algorithms
+        ):
+            results[token] = _rejected(token, InvalidAlgorithmError('The specified alg value is not allowed'))
+            continue
+
+        groups[(header.get('kid'), algorithm)].append(token)
+
+    for group in groups.values():
+        for token, (success, value) in zip(group, plan.decode_many(group)):
+            if success is False:
+                if not isinstance(value, InvalidTokenError):
+                    raise value
+                results[token] = _rejected(token, value)
+                continue
+
+            try:
+                payload = validate_payload(payload_model, value, model_validate_kwargs)
+            except ValidationError as e:
+                results[token] = _rejected(token, e)
+                continue
+
+            results[token] = TokenVerificationDTO(token=token, payload=payload)
+
+    return [results[token] for token in tokens]
+
+
+async def verify_many_async[PayloadModelType: BaseModel](
+    tokens: Iterable[str],
+    payload_model: Type[PayloadModelType],
+    config: QuickJWTConfig,
+    **model_validate_kwargs: Unpack[ModelValidateKwargs],
+) -> list[TokenVerificationDTO]:
+    """Asynchronous version of verify_many, the tokens are verified in a worker thread."""
+    function = partial(verify_many, list(tokens), payload_model, config, **model_validate_kwargs)
+    return await to_thread.run_sync(function)
+
+
+def _validate_pairs(
+    payloads: Iterable[tuple[BaseModel, BaseModel]],
+    access_payload: Type[BaseModel],
+    refresh_payload: Type[BaseModel],
+    model_validate_kwargs: ModelValidateKwargs,
+) -> list[BaseModel]:
+    models: list[BaseModel] = []
+    for access, refresh in payloads:
+        models.append(access_payload.model_validate(access, **model_validate_kwargs))
+        models.append(refresh_payload.model_validate(refresh, **model_validate_kwargs))
+    return models
+
+
+def _pair_tokens(tokens: list[str]) -> list[JWTTokensDTO]:
+    return [JWTTokensDTO(access=access, refresh=refresh) for access, refresh in zip(tokens[::2], tokens[1::2])]
+
+
+def mint_many(
+    payloads: Iterable[tuple[BaseModel, BaseModel]],
+    access_payload: Type[BaseModel],
+    refresh_payload: Type[BaseModel],
+    config: QuickJWTConfig,
+    **model_validate_kwargs: Unpack[ModelValidateKwargs],
+) -> list[JWTTokensDTO]:
+    """Issue many access and refresh token pairs at once outside of a request, for example to provision accounts.
+
+    Args:
+        payloads: Access and refresh payload of every pair.
+        access_payload: Pydantic model the access payloads are converted into.
+        refresh_payload: Pydantic model the refresh payloads are converted into.
+        config: Configuration used to encode the tokens.
+        **model_validate_kwargs: Arguments for the model_validate function of the payload models.
+
+    Returns:
+        A token pair for every pair of payloads, in the order of the payloads.
+    """
+    models = _validate_pairs(payloads, access_payload, refresh_payload, model_validate_kwargs)
+    return _pair_tokens(config.plan.encode_models(models))
+
+
+async def mint_many_async(
+    payloads: Iterable[tuple[BaseModel, BaseModel]],
+    access_payload: Type[BaseModel],
+    refresh_payload: Type[BaseModel],
+    config: QuickJWTConfig,
+    **model_validate_kwargs: Unpack[ModelValidateKwargs],
+) -> list[JWTTokensDTO]:
+    """Asynchronous version of mint_many.
+
+    With the crypto executor enabled the tokens are signed concurrently, split evenly between the
+    threads of the executor. Otherwise they are signed in a single worker thread.
+    """
+    plan = config.plan
+    if plan.encode_executor is None:
+        function = partial(mint_many, list(payloads), access_payload, refresh_payload, config, **model_validate_kwargs)
+        return await to_thread.run_sync(function)
+
+    models = _validate_pairs(payloads, access_payload, refresh_payload, model_validate_kwargs)
+    chunk_size = max(1, math.ceil(len(models) / config.crypto_executor_limit))
+    return _pair_tokens(await plan.encode_models_async(models, chunk_size))
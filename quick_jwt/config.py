@@ -1,12 +1,12 @@
 import json
 import typing
 from datetime import timedelta
-from typing import Any, Sequence, Iterable, Annotated
+from typing import Any, Sequence, Iterable, Annotated, Mapping, Self
 from typing_extensions import Doc
 
 from fastapi import HTTPException, status
 from jwt import PyJWT
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from quick_jwt.core._function_args import (
@@ -14,14 +14,19 @@ from quick_jwt.core._function_args import (
     JWTEncodeKwargs,
     SetCookieKwargs,
 )
+from quick_jwt.core.cache import TokenCache
+from quick_jwt.core.plan import QuickJWTPlan
 
 
 class QuickJWTConfig(BaseSettings):
     """Configuration class for QuickJWT settings.
 
+    The configuration is immutable after construction. QuickJWTMiddleware compiles it into
+    a QuickJWTPlan once, so requests never rebuild driver arguments.
+
     Attributes:
-        encode_key: Key used for encoding JWT tokens (required)
-        decode_key: Key used for decoding JWT tokens (required)
+        encode_key: Key used for encoding JWT tokens, a string or a prepared key object (required)
+        decode_key: Key used for decoding JWT tokens, a string or a prepared key object (required)
         driver: JWT library driver instance (default: PyJWT())
 
         access_token_name: Name of the access token cookie (default: 'access')
@@ -53,14 +58,30 @@ class QuickJWTConfig(BaseSettings):
         decode_subject: Expected subject for verification (default: None)
         decode_issuer: Expected issuer for verification (default: None)
         decode_leeway: Leeway time for expiration verification (default: 0)
+        decode_cache_size: Maximum number of verified tokens kept in the decode cache, 0 disables it (default: 0)
+        decode_cache_ttl: Maximum lifetime of a verified token in the decode cache (default: 5 minutes)
+        decode_cache_max_bytes: Approximate memory limit of the decode cache in bytes (default: 16 MiB)
+        crypto_executor: Where signing and verification run, 'inline' or 'thread' (default: 'inline')
+        crypto_executor_limit: Maximum number of concurrent threads of the crypto executor (default: 16)
+        crypto_executor_inline_hmac: Whether HMAC tokens skip the thread pool (default: True)
+        decode_process_workers: Number of worker processes verifying tokens, 0 disables them (default: 0)
+        decode_process_batch_size: Maximum number of tokens sent to a worker process at once (default: 32)
+        decode_process_batch_delay: Maximum time a token waits for its batch to fill up (default: 1 millisecond)
+        decode_max_token_length: Maximum length of a token, longer tokens are rejected before decoding (default: 8192)
+        decode_negative_cache_size: Maximum number of rejected tokens in the negative cache, 0 disables it (default: 0)
+        decode_negative_cache_ttl: Lifetime of a rejected token in the negative cache (default: 10 seconds)
+        decode_negative_cache_max_bytes: Approximate memory limit of the negative cache in bytes (default: 1 MiB)
+        decode_payload_json: Whether payload models are validated straight from the JSON payload (default: False)
+        json_codec: JSON library of token headers and payloads, 'json', 'orjson', 'msgspec' or 'auto' (default: 'json')
+        encode_payload_json: Whether payload models are serialized straight to the JSON payload (default: False)
     """
 
-    model_config = SettingsConfigDict()
+    model_config = SettingsConfigDict(frozen=True)
 
     driver: PyJWT | Any = Field(PyJWT())
 
-    encode_key: str | bytes = Field(...)
-    decode_key: str | bytes = Field(...)
+    encode_key: str | bytes | Any = Field(...)
+    decode_key: str | bytes | Any = Field(...)
 
     access_token_name: str = Field('access')
     access_token_expires: timedelta = Field(timedelta(days=2))
@@ -91,22 +112,48 @@ class QuickJWTConfig(BaseSettings):
     decode_subject: str | None = Field(None)
     decode_issuer: str | Sequence[str] | None = Field(None)
     decode_leeway: float | timedelta = Field(0)
+    decode_cache_size: int = Field(0, ge=0)
+    decode_cache_ttl: timedelta = Field(timedelta(minutes=5))
+    decode_cache_max_bytes: int = Field(16 * 1024 * 1024, ge=0)
+    crypto_executor: typing.Literal['inline', 'thread'] = Field('inline')
+    crypto_executor_limit: int = Field(16, ge=1)
+    crypto_executor_inline_hmac: bool = Field(True)
+    decode_process_workers: int = Field(0, ge=0)
+    decode_process_batch_size: int = Field(32, ge=1)
+    decode_process_batch_delay: timedelta = Field(timedelta(milliseconds=1))
+    decode_max_token_length: int = Field(8192, ge=1)
+    decode_negative_cache_size: int = Field(0, ge=0)
+    decode_negative_cache_ttl: timedelta = Field(timedelta(seconds=10))
+    decode_negative_cache_max_bytes: int = Field(1024 * 1024, ge=0)
+    decode_payload_json: bool = Field(False)
+    json_codec: typing.Literal['json', 'orjson', 'msgspec', 'auto'] = Field('json')
+    encode_payload_json: bool = Field(False)
+
+    _decode_cache: TokenCache | None = PrivateAttr(None)
+    _decode_negative_cache: TokenCache | None = PrivateAttr(None)
+    _plan: QuickJWTPlan | None = PrivateAttr(None)
+
+    _COMPILED_STATE: typing.ClassVar[tuple[str, ...]] = ('_plan', '_decode_cache', '_decode_negative_cache')
 
     def __init__(
         self,
         encode_key: Annotated[
-            str | bytes,
+            str | bytes | Any,
             Doc(
                 """
                     Key used for encoding JWT tokens (required)
+                    PEM strings of asymmetric algorithms are parsed once and reused.
+                    Prepared cryptography key objects are accepted as well.
                     """
             ),
         ],
         decode_key: Annotated[
-            str | bytes,
+            str | bytes | Any,
             Doc(
                 """
                     Key used for decoding JWT tokens (required)
+                    PEM strings of asymmetric algorithms are parsed once and reused.
+                    Prepared cryptography key objects are accepted as well.
                     """
             ),
         ],
@@ -353,6 +400,156 @@ class QuickJWTConfig(BaseSettings):
                     """
             ),
         ] = 0,
+        decode_cache_size: Annotated[
+            int,
+            Doc(
+                """
+                    Maximum number of verified tokens kept in the decode cache, 0 disables it
+                    Default: 0
+                    """
+            ),
+        ] = 0,
+        decode_cache_ttl: Annotated[
+            timedelta,
+            Doc(
+                """
+                    Maximum lifetime of a verified token in the decode cache
+                    Default: 5 minutes
+                    """
+            ),
+        ] = timedelta(minutes=5),
+        decode_cache_max_bytes: Annotated[
+            int,
+            Doc(
+                """
+                    Approximate memory limit of the decode cache in bytes
+                    Default: 16 MiB
+                    """
+            ),
+        ] = 16 * 1024 * 1024,
+        crypto_executor: Annotated[
+            typing.Literal['inline', 'thread'],
+            Doc(
+                """
+                    Where signing and verification run: inline on the event loop or in a thread pool
+                    Default: 'inline'
+                    """
+            ),
+        ] = 'inline',
+        crypto_executor_limit: Annotated[
+            int,
+            Doc(
+                """
+                    Maximum number of threads signing or verifying tokens at the same time
+                    Default: 16
+                    """
+            ),
+        ] = 16,
+        crypto_executor_inline_hmac: Annotated[
+            bool,
+            Doc(
+                """
+                    Whether HS256/HS384/HS512 tokens stay on the event loop when the thread pool is used
+                    Default: True
+                    """
+            ),
+        ] = True,
+        decode_process_workers: Annotated[
+            int,
+            Doc(
+                """
+                    Number of worker processes verifying tokens, 0 disables the process pool
+                    Default: 0
+                    """
+            ),
+        ] = 0,
+        decode_process_batch_size: Annotated[
+            int,
+            Doc(
+                """
+                    Maximum number of tokens sent to a worker process at once
+                    Default: 32
+                    """
+            ),
+        ] = 32,
+        decode_process_batch_delay: Annotated[
+            timedelta,
+            Doc(
+                """
+                    Maximum time a token waits for its batch to fill up
+                    Default: 1 millisecond
+                    """
+            ),
+        ] = timedelta(milliseconds=1),
+        decode_max_token_length: Annotated[
+            int,
+            Doc(
+                """
+                    Maximum length of a token, longer tokens are rejected before decoding
+                    Default: 8192
+                    """
+            ),
+        ] = 8192,
+        decode_negative_cache_size: Annotated[
+            int,
+            Doc(
+                """
+                    Maximum number of recently rejected tokens kept in the negative cache, 0 disables it
+                    Default: 0
+                    """
+            ),
+        ] = 0,
+        decode_negative_cache_ttl: Annotated[
+            timedelta,
+            Doc(
+                """
+                    Lifetime of a rejected token in the negative cache
+                    Default: 10 seconds
+                    """
+            ),
+        ] = timedelta(seconds=10),
+        decode_negative_cache_max_bytes: Annotated[
+            int,
+            Doc(
+                """
+                    Approximate memory limit of the negative cache in bytes
+                    Default: 1 MiB
+                    """
+            ),
+        ] = 1024 * 1024,
+        decode_payload_json: Annotated[
+            bool,
+            Doc(
+                """
+                    Whether the payload model is validated straight from the JSON bytes of the token.
+                    The PyJWT claims are checked from a partial parse of the payload, and the full
+                    payload is never built as a dict. Requires the PyJWT driver.
+                    Default: False
+                    """
+            ),
+        ] = False,
+        json_codec: Annotated[
+            typing.Literal['json', 'orjson', 'msgspec', 'auto'],
+            Doc(
+                """
+                    JSON library used to serialize and parse the header and the payload of tokens.
+                    'auto' selects orjson or msgspec when one of them is installed and falls back to 'json'.
+                    Codecs other than json require the PyJWT driver.
+                    Default: 'json'
+                    """
+            ),
+        ] = 'json',
+        encode_payload_json: Annotated[
+            bool,
+            Doc(
+                """
+                    Whether payload models are serialized straight to the JSON bytes of the token by pydantic,
+                    without an intermediate dict. The header segment is serialized once per config.
+                    Requires the PyJWT driver.
+                    Default: False
+                    """
+            ),
+        ] = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -385,9 +582,100 @@ class QuickJWTConfig(BaseSettings):
             decode_subject=decode_subject,
             decode_issuer=decode_issuer,
             decode_leeway=decode_leeway,
+            decode_cache_size=decode_cache_size,
+            decode_cache_ttl=decode_cache_ttl,
+            decode_cache_max_bytes=decode_cache_max_bytes,
+            crypto_executor=crypto_executor,
+            crypto_executor_limit=crypto_executor_limit,
+            crypto_executor_inline_hmac=crypto_executor_inline_hmac,
+            decode_process_workers=decode_process_workers,
+            decode_process_batch_size=decode_process_batch_size,
+            decode_process_batch_delay=decode_process_batch_delay,
+            decode_max_token_length=decode_max_token_length,
+            decode_negative_cache_size=decode_negative_cache_size,
+            decode_negative_cache_ttl=decode_negative_cache_ttl,
+            decode_negative_cache_max_bytes=decode_negative_cache_max_bytes,
+            decode_payload_json=decode_payload_json,
+            json_codec=json_codec,
+            encode_payload_json=encode_payload_json,
             **kwargs,
         )
 
+    def model_post_init(self, context: Any, /) -> None:
+        self._build_caches()
+
+    def _build_caches(self) -> None:
+        namespace = repr((sorted(self.build_decode_params().items()), getattr(self.driver, 'options', None))).encode()
+        if self.decode_cache_size > 0:
+            self._decode_cache = TokenCache(
+                namespace=namespace,
+                max_size=self.decode_cache_size,
+                max_bytes=self.decode_cache_max_bytes,
+                ttl=self.decode_cache_ttl.total_seconds(),
+            )
+        if self.decode_negative_cache_size > 0:
+            self._decode_negative_cache = TokenCache(
+                namespace=namespace,
+                max_size=self.decode_negative_cache_size,
+                max_bytes=self.decode_negative_cache_max_bytes,
+                ttl=self.decode_negative_cache_ttl.total_seconds(),
+            )
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # The update is applied after the copy hooks ran, the state has to follow the new fields
+        copied._reset_compiled_state()
+        return copied
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        copied._reset_compiled_state()
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        # Compiled state holds prepared keys and worker processes, which are never copied
+        compiled_state = {name: getattr(self, name) for name in self._COMPILED_STATE}
+        for name in compiled_state:
+            setattr(self, name, None)
+        try:
+            copied = super().__deepcopy__(memo)
+        finally:
+            for name, value in compiled_state.items():
+                setattr(self, name, value)
+        copied._reset_compiled_state()
+        return copied
+
+    def _reset_compiled_state(self) -> None:
+        """Drop the state derived from the fields of the config, a copy may have other fields.
+
+        The token caches are created anew: entries verified under the fields of the original must
+        not be served by a copy with another key or other claims.
+        """
+        self._plan = None
+        self._decode_cache = None
+        self._decode_negative_cache = None
+        self._build_caches()
+
+    @property
+    def decode_cache(self) -> TokenCache | None:
+        """Cache of verified tokens, None when ``decode_cache_size`` is 0."""
+        return self._decode_cache
+
+    @property
+    def decode_negative_cache(self) -> TokenCache | None:
+        """Cache of recently rejected tokens, None when ``decode_negative_cache_size`` is 0."""
+        return self._decode_negative_cache
+
+    def compile(self) -> QuickJWTPlan:
+        """Build the immutable plan used on the per-request path, the result is computed only once."""
+        if self._plan is None:
+            self._plan = QuickJWTPlan.compile(self)
+        return self._plan
+
+    @property
+    def plan(self) -> QuickJWTPlan:
+        return self.compile()
+
     def build_encode_params(self) -> JWTEncodeKwargs:
         return {
             'key': self.encode_key,
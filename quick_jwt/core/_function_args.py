@@ -13,7 +13,7 @@ class ModelValidateKwargs(TypedDict, total=False):
 
 
 class JWTEncodeKwargs(TypedDict, total=False):
-    key: str | bytes
+    key: str | bytes | Any
     algorithm: str | None
     headers: dict[str, Any] | None
     json_encoder: type[json.JSONEncoder] | None
@@ -21,7 +21,7 @@ class JWTEncodeKwargs(TypedDict, total=False):
 
 
 class JWTDecodeKwargs(TypedDict, total=False):
-    key: str | bytes
+    key: str | bytes | Any
     algorithms: Sequence[str] | None
     options: dict[str, Any] | None
     verify: bool | None
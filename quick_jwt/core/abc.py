@@ -1,9 +1,12 @@
 import abc
-from typing import Any
+from functools import cache
+from typing import Any, Self
 
-from fastapi import Request, Response
+from fastapi import Response
 from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
+from starlette.requests import HTTPConnection
+from starlette.types import Scope
 
 from quick_jwt import QuickJWTConfig
 from quick_jwt.dto import JWTTokensDTO
@@ -17,8 +20,10 @@ class IDecodeDriverJWT(metaclass=abc.ABCMeta):
     providing methods to extract payloads from both bearer tokens and cookies.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
-    def _get_payload(
+    async def _get_payload(
         self,
         bearer_token: HTTPAuthorizationCredentials | None,
         cookie_token: str | None,
@@ -39,7 +44,7 @@ class IDecodeDriverJWT(metaclass=abc.ABCMeta):
         pass  # pragma: no cover
 
     @abc.abstractmethod
-    def _get_payload_optional(
+    async def _get_payload_optional(
         self,
         bearer_token: HTTPAuthorizationCredentials | None,
         cookie_token: str | None,
@@ -68,6 +73,8 @@ class IEncodeDriverJWT(metaclass=abc.ABCMeta):
     providing methods to create both access and refresh tokens either together or separately.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     async def create_jwt_tokens(self, access_payload: BaseModel, refresh_payload: BaseModel) -> JWTTokensDTO:
         """Create both access and refresh tokens asynchronously.
@@ -124,7 +131,48 @@ class IEncodeDriverJWT(metaclass=abc.ABCMeta):
         pass  # pragma: no cover
 
 
+def get_config_from_scope(scope: Scope) -> QuickJWTConfig:
+    """Return the config written into the scope state by QuickJWTMiddleware."""
+    config: QuickJWTConfig | None = scope.get('state', {}).get('quick_jwt_config')
+    if config is None:
+        raise Exception(
+            """
+            QuickJWTConfig not defined in middleware. Example of definition:'
+            from fastapi import FastAPI
+            from quick_jwt import QuickJWTConfig, QuickJWTMiddleware
+            
+            app = FastAPI()
+            quick_jwt_config = QuickJWTConfig(encode_key='key', decode_key='key')
+            app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+            """
+        )
+    return config
+
+
+_CONTEXT_SLOTS = frozenset(('_config', '_request', '_response', '__dict__', '__weakref__'))
+
+
+@cache
+def _setting_slots(cls: type) -> tuple[str, ...]:
+    """Slots of the class which hold the settings of a dependency, not the request it is bound to."""
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in _CONTEXT_SLOTS)
+    return tuple(names)
+
+
 class BaseJWT(metaclass=abc.ABCMeta):
+    """Base class of the dependencies.
+
+    FastAPI keeps a single instance of every dependency and calls it for every request. The instance
+    only holds the settings of the dependency: ``__call__`` binds a copy of it to the request with
+    ``_bind`` and works on that copy, so concurrent requests never share the request, the response
+    or the config.
+    """
+
     __slots__ = (
         '_config',
         '_request',
@@ -133,10 +181,24 @@ class BaseJWT(metaclass=abc.ABCMeta):
 
     def __init__(self) -> None:
         self._config: QuickJWTConfig | None = None
-        self._request: Request | None = None
+        self._request: HTTPConnection | None = None
         self._response: Response | None = None
 
-    def _setup_call_function_params(self, request: Request, response: Response) -> None:
+    def _bind(self, request: HTTPConnection, response: Response | None) -> Self:
+        """Return a copy of the dependency bound to a single request."""
+        bound = object.__new__(type(self))
+        for name in _setting_slots(type(self)):
+            try:
+                setattr(bound, name, getattr(self, name))
+            except AttributeError:
+                pass
+        state = getattr(self, '__dict__', None)
+        if state:
+            bound.__dict__.update(state)
+        bound._setup_call_function_params(request, response)
+        return bound
+
+    def _setup_call_function_params(self, request: HTTPConnection, response: Response | None) -> None:
         self._request = request
         self._response = response
         self._config = self._get_config_from_request()
@@ -144,28 +206,14 @@ class BaseJWT(metaclass=abc.ABCMeta):
     def _get_config_from_request(self) -> QuickJWTConfig:
         if self._request is None:
             raise AttributeError('_reqeust field not found')
-        try:
-            config: QuickJWTConfig = self._request.state.quick_jwt_config
-            return config
-        except AttributeError:
-            raise Exception(
-                """
-                QuickJWTConfig not defined in middleware. Example of definition:'
-                from fastapi import FastAPI
-                from quick_jwt import QuickJWTConfig, QuickJWTMiddleware
-                
-                app = FastAPI()
-                quick_jwt_config = QuickJWTConfig(encode_key='key', decode_key='key')
-                app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
-                """
-            )
+        return get_config_from_scope(self._request.scope)
 
     def _get_config(self) -> QuickJWTConfig:
         if self._config is None:
             raise Exception('The __call__ function was not called.')
         return self._config
 
-    def _get_request(self) -> Request:
+    def _get_request(self) -> HTTPConnection:
         if self._request is None:
             raise Exception('The __call__ function was not called.')
         return self._request
@@ -0,0 +1,100 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from quick_jwt.dto import TokenCacheStatsDTO
+
+_ENTRY_OVERHEAD = 256
+
+
+class TokenCache:
+    """Bounded LRU cache of decoded tokens keyed by a digest of the token.
+
+    Every entry expires at its own deadline (usually the token ``exp`` claim capped by the
+    configured TTL). The cache is bounded both by the number of entries and by an approximate
+    memory budget, the least recently used entries are evicted first.
+    """
+
+    __slots__ = (
+        '_entries',
+        '_namespace',
+        '_max_size',
+        '_max_bytes',
+        '_ttl',
+        '_memory',
+        '_lock',
+        'hits',
+        'misses',
+    )
+
+    def __init__(self, namespace: bytes, max_size: int, max_bytes: int, ttl: float) -> None:
+        self._entries: OrderedDict[bytes, tuple[Any, float, int]] = OrderedDict()
+        self._namespace = hashlib.blake2b(namespace, digest_size=32).digest()
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._memory = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, token: str) -> bytes:
+        """Build the cache key of the token bound to the decode configuration namespace."""
+        return hashlib.blake2b(token.encode(), digest_size=16, key=self._namespace).digest()
+
+    def get(self, key: bytes) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, size = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._memory -= size
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: bytes, value: Any, size: int, expires_at: float | None = None) -> None:
+        deadline = time.time() + self._ttl
+        if expires_at is not None and expires_at < deadline:
+            deadline = expires_at
+        if deadline <= time.time():
+            return
+
+        size += _ENTRY_OVERHEAD
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory -= previous[2]
+
+            self._entries[key] = (value, deadline, size)
+            self._memory += size
+
+            while len(self._entries) > self._max_size or self._memory > self._max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._memory -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def stats(self) -> TokenCacheStatsDTO:
+        with self._lock:
+            return TokenCacheStatsDTO(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                memory=self._memory,
+            )
@@ -0,0 +1,176 @@
+import time
+from datetime import timedelta
+from typing import Any, Iterable, Mapping
+
+from jwt import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidIssuerError,
+    MissingRequiredClaimError,
+)
+from jwt.exceptions import InvalidJTIError, InvalidSubjectError
+
+
+class ClaimValidator:
+    """The claim validation of PyJWT, compiled once for a set of decode parameters.
+
+    The options are resolved into flags, the audience and the issuer into frozensets and the leeway
+    into seconds, so validating a payload only takes a few set lookups and number comparisons.
+    The same exceptions are raised as by ``PyJWT.decode``, in the same order.
+
+    Args:
+        options: Decode options merged with the default options of the driver.
+        audience: Allowed audience or audiences.
+        issuer: Allowed issuer or issuers.
+        subject: Expected subject.
+        leeway: Leeway for the time claims.
+    """
+
+    __slots__ = (
+        '_require',
+        '_verify_iat',
+        '_verify_nbf',
+        '_verify_exp',
+        '_verify_iss',
+        '_verify_aud',
+        '_verify_sub',
+        '_verify_jti',
+        '_strict_audience',
+        '_audience',
+        '_audiences',
+        '_issuer',
+        '_issuers',
+        '_subject',
+        '_leeway',
+    )
+
+    def __init__(
+        self,
+        options: Mapping[str, Any],
+        audience: str | Iterable[str] | None = None,
+        issuer: str | Iterable[str] | None = None,
+        subject: str | None = None,
+        leeway: float | timedelta = 0,
+    ) -> None:
+        if audience is not None and not isinstance(audience, (str, Iterable)):
+            raise TypeError('audience must be a string, iterable or None')
+
+        self._require = tuple(options.get('require', ()))
+        self._verify_iat = bool(options.get('verify_iat', True))
+        self._verify_nbf = bool(options.get('verify_nbf', True))
+        self._verify_exp = bool(options.get('verify_exp', True))
+        self._verify_iss = bool(options.get('verify_iss', True)) and issuer is not None
+        self._verify_aud = bool(options.get('verify_aud', True))
+        self._verify_sub = bool(options.get('verify_sub', True))
+        self._verify_jti = bool(options.get('verify_jti', True))
+        self._strict_audience = bool(options.get('strict_aud', False))
+
+        self._audience = audience if isinstance(audience, str) else None
+        self._audiences: frozenset[Any] | None = None
+        if audience is not None:
+            self._audiences = frozenset((audience,) if isinstance(audience, str) else audience)
+
+        self._issuer = issuer if isinstance(issuer, str) else None
+        self._issuers: frozenset[Any] | tuple[Any, ...] = ()
+        if issuer is not None and not isinstance(issuer, str):
+            try:
+                self._issuers = frozenset(issuer)
+            except TypeError:
+                self._issuers = tuple(issuer)
+
+        self._subject = subject
+        self._leeway = leeway.total_seconds() if isinstance(leeway, timedelta) else leeway
+
+    def validate(self, payload: dict[str, Any]) -> None:
+        for claim in self._require:
+            if payload.get(claim) is None:
+                raise MissingRequiredClaimError(claim)
+
+        if self._verify_iat or self._verify_nbf or self._verify_exp:
+            self._validate_time(payload)
+        if self._verify_iss:
+            self._validate_issuer(payload)
+        if self._verify_aud:
+            self._validate_audience(payload)
+
+        if self._verify_sub and 'sub' in payload:
+            if not isinstance(payload['sub'], str):
+                raise InvalidSubjectError('Subject must be a string')
+            if self._subject is not None and payload['sub'] != self._subject:
+                raise InvalidSubjectError('Invalid subject')
+
+        if self._verify_jti and 'jti' in payload and not isinstance(payload['jti'], str):
+            raise InvalidJTIError('JWT ID must be a string')
+
+    def _validate_time(self, payload: dict[str, Any]) -> None:
+        now = time.time()
+        not_before_limit = now + self._leeway
+
+        if self._verify_iat and 'iat' in payload:
+            try:
+                issued_at = int(payload['iat'])
+            except ValueError:
+                raise InvalidIssuedAtError('Issued At claim (iat) must be an integer.') from None
+            if issued_at > not_before_limit:
+                raise ImmatureSignatureError('The token is not yet valid (iat)')
+
+        if self._verify_nbf and 'nbf' in payload:
+            try:
+                not_before = int(payload['nbf'])
+            except ValueError:
+                raise DecodeError('Not Before claim (nbf) must be an integer.') from None
+            if not_before > not_before_limit:
+                raise ImmatureSignatureError('The token is not yet valid (nbf)')
+
+        if self._verify_exp and 'exp' in payload:
+            try:
+                expires_at = int(payload['exp'])
+            except ValueError:
+                raise DecodeError('Expiration Time claim (exp) must be an integer.') from None
+            if expires_at <= now - self._leeway:
+                raise ExpiredSignatureError('Signature has expired')
+
+    def _validate_issuer(self, payload: dict[str, Any]) -> None:
+        if 'iss' not in payload:
+            raise MissingRequiredClaimError('iss')
+
+        issuer = payload['iss']
+        if self._issuer is not None:
+            valid = issuer == self._issuer
+        else:
+            try:
+                valid = issuer in self._issuers
+            except TypeError:
+                valid = False
+        if not valid:
+            raise InvalidIssuerError('Invalid issuer')
+
+    def _validate_audience(self, payload: dict[str, Any]) -> None:
+        claims = payload.get('aud')
+        if self._audiences is None:
+            if claims:
+                raise InvalidAudienceError('Invalid audience')
+            return
+        if not claims:
+            raise MissingRequiredClaimError('aud')
+
+        if self._strict_audience:
+            if self._audience is None:
+                raise InvalidAudienceError('Invalid audience (strict)')
+            if not isinstance(claims, str):
+                raise InvalidAudienceError('Invalid claim format in token (strict)')
+            if claims != self._audience:
+                raise InvalidAudienceError("Audience doesn't match (strict)")
+            return
+
+        if isinstance(claims, str):
+            if claims not in self._audiences:
+                raise InvalidAudienceError("Audience doesn't match")
+            return
+        if not isinstance(claims, list) or any(not isinstance(claim, str) for claim in claims):
+            raise InvalidAudienceError('Invalid claim format in token')
+        if self._audiences.isdisjoint(claims):
+            raise InvalidAudienceError("Audience doesn't match")
@@ -0,0 +1,108 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Literal
+
+type JSONCodecName = Literal['json', 'orjson', 'msgspec']
+
+
+class JSONCodec(ABC):
+    """Serializes token headers and payloads to compact JSON bytes and parses them back.
+
+    Every codec produces the same bytes as PyJWT for the same values and key order, except for
+    non-ASCII strings and floats in exponent notation, which PyJWT escapes and formats differently.
+    Parse errors are raised as ``ValueError``.
+    """
+
+    __slots__ = ()
+
+    name: JSONCodecName
+
+    def __reduce__(self) -> tuple[Callable[[str], 'JSONCodec'], tuple[str]]:
+        return get_json_codec, (self.name,)
+
+    @abstractmethod
+    def dumps(self, value: Any, sort_keys: bool = False) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    __slots__ = ()
+
+    name = 'json'
+
+    def dumps(self, value: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(value, separators=(',', ':'), sort_keys=sort_keys).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class ORJSONCodec(JSONCodec):
+    __slots__ = ('_orjson',)
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, value: Any, sort_keys: bool = False) -> bytes:
+        return self._orjson.dumps(value, option=self._orjson.OPT_SORT_KEYS if sort_keys else None)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJSONCodec(JSONCodec):
+    __slots__ = (
+        '_encoder',
+        '_sorted_encoder',
+        '_decoder',
+    )
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._sorted_encoder = msgspec.json.Encoder(order='sorted')
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any, sort_keys: bool = False) -> bytes:
+        return (self._sorted_encoder if sort_keys else self._encoder).encode(value)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    'json': StdlibJSONCodec,
+    'orjson': ORJSONCodec,
+    'msgspec': MsgspecJSONCodec,
+}
+
+
+def get_json_codec(name: str) -> JSONCodec:
+    """Create the JSON codec with the given name.
+
+    ``auto`` selects orjson or msgspec, whichever is installed, and falls back to the standard
+    library json module.
+
+    Raises:
+        ImportError: If the library of the codec is not installed.
+    """
+    if name != 'auto':
+        return _CODECS[name]()
+
+    for codec in (ORJSONCodec, MsgspecJSONCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return StdlibJSONCodec()
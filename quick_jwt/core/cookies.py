@@ -0,0 +1,106 @@
+import re
+from http.cookies import _unquote
+from typing import Any, Mapping
+
+from starlette.responses import Response
+from starlette.types import Scope
+
+# Values made of these characters are written by http.cookies without quoting
+_LEGAL_VALUE = re.compile(r"[\w!#$%&'*+\-.^`|~:]+", re.ASCII)
+_PLACEHOLDER = 'token'
+
+
+def _render(**cookie_params: Any) -> bytes:
+    response = Response()
+    response.set_cookie(**cookie_params)
+    return response.raw_headers[-1][1]
+
+
+class CookieTemplate:
+    """Set-Cookie headers of a token cookie, rendered once from the cookie parameters of the config.
+
+    Starlette builds every cookie with ``http.cookies.SimpleCookie``. The header is rendered once with
+    a placeholder value and split around it, so setting a token only joins the prefix, the token and
+    the attribute suffix. Values that ``SimpleCookie`` would quote fall back to ``set_cookie``.
+
+    Args:
+        cookie_params: Arguments for ``Response.set_cookie`` without the value.
+    """
+
+    __slots__ = (
+        '_params',
+        '_prefix',
+        '_suffix',
+        '_deletion',
+    )
+
+    def __init__(self, cookie_params: Mapping[str, Any]) -> None:
+        self._params = dict(cookie_params)
+
+        # Cookie names cannot contain "=", so the first "=token" follows the name
+        header = _render(**self._params, value=_PLACEHOLDER)
+        name, self._suffix = header.split(f'={_PLACEHOLDER}'.encode(), 1)
+        self._prefix = name + b'='
+
+        deletion_params = {**self._params, 'max_age': 0, 'expires': 0}
+        self._deletion = _render(**deletion_params)
+
+    def set(self, response: Response, value: str) -> None:
+        if _LEGAL_VALUE.fullmatch(value) is None:
+            response.set_cookie(value=value, **self._params)
+            return
+        response.raw_headers.append((b'set-cookie', self._prefix + value.encode('latin-1') + self._suffix))
+
+    def delete(self, response: Response) -> None:
+        """Expire the cookie with the same path and domain it was set with."""
+        response.raw_headers.append((b'set-cookie', self._deletion))
+
+
+def _find_cookie(header: bytes, name: bytes) -> bytes | None:
+    # Search from the end, the last duplicate wins
+    end = len(header)
+    while (index := header.rfind(name, 0, end)) >= 0:
+        end = index
+        chunk_start = header.rfind(b';', 0, index) + 1
+        if header[chunk_start:index].strip():
+            continue
+
+        chunk_end = header.find(b';', index)
+        if chunk_end < 0:
+            chunk_end = len(header)
+        separator = header.find(b'=', index, chunk_end)
+        if separator < 0 or header[index + len(name) : separator].strip():
+            continue
+        return header[separator + 1 : chunk_end]
+    return None
+
+
+def read_cookie(scope: Scope, name: str) -> str | None:
+    """Read a single cookie from the raw ``cookie`` header of the scope.
+
+    ``request.cookies`` parses every cookie of the header into a dict, while only the token cookie
+    is needed. The header is searched for the name instead, with the same rules as Starlette: the
+    first ``cookie`` header is used, whitespace around the name and the value is ignored, the last
+    duplicate wins and quoted values are unquoted.
+
+    Args:
+        scope: ASGI scope of the request.
+        name: Name of the cookie.
+
+    Returns:
+        The value of the cookie or None when it is not set.
+    """
+    for header_name, header_value in scope['headers']:
+        if header_name == b'cookie':
+            break
+    else:
+        return None
+
+    raw_value = _find_cookie(header_value, name.encode('latin-1'))
+    if raw_value is None:
+        return None
+
+    value = raw_value.decode('latin-1').strip()
+    if value[:1] == '"':
+        value = _unquote(value)
+    return value
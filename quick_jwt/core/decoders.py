@@ -0,0 +1,168 @@
+from abc import ABC, abstractmethod
+from typing import Any, Mapping
+
+from jwt import DecodeError, PyJWS, PyJWT
+from pydantic_core import SchemaValidator, ValidationError, core_schema
+
+from quick_jwt.core.claims import ClaimValidator
+from quick_jwt.core.codecs import JSONCodec
+from quick_jwt.core.keys import prepare_driver_key, serialize_key
+
+REGISTERED_CLAIMS = ('exp', 'nbf', 'iat', 'aud', 'iss', 'sub', 'jti')
+
+type DecodeResult = tuple[Any, float | None]
+
+
+def get_expiration(claims: Any) -> float | None:
+    """Return the ``exp`` claim when it is a number, it bounds how long a payload may be cached."""
+    if not isinstance(claims, dict):
+        return None
+
+    expires_at = claims.get('exp')
+    if not isinstance(expires_at, (int, float)) or isinstance(expires_at, bool):
+        return None
+    return expires_at
+
+
+class TokenDecoder(ABC):
+    """Verifies a token and returns its payload together with its expiration time.
+
+    Decoders are pickled as their constructor arguments, with the raw decode parameters, so they
+    can be shipped to worker processes, and prepare the key again when they are unpickled. Key
+    objects are pickled as PEM bytes.
+    """
+
+    __slots__ = (
+        '_arguments',
+        '_driver',
+        '_decode_params',
+    )
+
+    def __init__(self, driver: Any, decode_params: Mapping[str, Any]) -> None:
+        self._arguments: tuple[Any, ...] = (driver, dict(decode_params))
+        self._driver = driver
+        self._decode_params = dict(decode_params)
+        self._decode_params['key'] = prepare_driver_key(driver, decode_params['key'], decode_params.get('algorithms'))
+
+    def __reduce__(self) -> tuple[type['TokenDecoder'], tuple[Any, ...]]:
+        driver, decode_params, *arguments = self._arguments
+        decode_params = {**decode_params, 'key': serialize_key(decode_params['key'])}
+        return type(self), (driver, decode_params, *arguments)
+
+    @abstractmethod
+    def decode(self, token: str) -> DecodeResult:
+        raise NotImplementedError
+
+
+class DriverDecoder(TokenDecoder):
+    """Decodes tokens with the ``decode`` function of any driver."""
+
+    __slots__ = ()
+
+    def decode(self, token: str) -> DecodeResult:
+        payload = self._driver.decode(token, **self._decode_params)
+        return payload, get_expiration(payload)
+
+
+class JWSDecoder(TokenDecoder):
+    """Verifies tokens like PyJWT, leaving the payload parsing to the subclasses.
+
+    The signature is checked with PyJWS. The options of the driver, the audience, the issuer and the
+    leeway are compiled into a ClaimValidator once, which raises the same exceptions as ``PyJWT.decode``
+    without merging and normalizing them on every call.
+    """
+
+    __slots__ = (
+        '_jws',
+        '_jws_options',
+        '_claims_options',
+        '_claim_validator',
+    )
+
+    def __init__(self, driver: PyJWT, decode_params: Mapping[str, Any]) -> None:
+        super().__init__(driver, decode_params)
+
+        options = dict(decode_params.get('options') or {})
+        options.setdefault('verify_signature', True)
+        if not options['verify_signature']:
+            for claim in REGISTERED_CLAIMS:
+                options.setdefault(f'verify_{claim}', False)
+
+        self._jws = PyJWS()
+        self._jws_options = options
+        self._claims_options = {**driver.options, **options}
+        self._claim_validator = ClaimValidator(
+            self._claims_options,
+            audience=decode_params.get('audience'),
+            issuer=decode_params.get('issuer'),
+            subject=decode_params.get('subject'),
+            leeway=decode_params.get('leeway') or 0,
+        )
+
+    def _verify(self, token: str) -> bytes:
+        params = self._decode_params
+        decoded = self._jws.decode_complete(
+            token,
+            key=params['key'],
+            algorithms=params.get('algorithms'),
+            options=self._jws_options,
+            detached_payload=params.get('detached_payload'),
+        )
+        return decoded['payload']  # type: ignore[no-any-return]
+
+    def _validate_claims(self, claims: dict[str, Any]) -> None:
+        self._claim_validator.validate(claims)
+
+
+class CodecDecoder(JWSDecoder):
+    """Verifies tokens like PyJWT and parses the payload with a JSON codec."""
+
+    __slots__ = ('_codec',)
+
+    def __init__(self, driver: PyJWT, decode_params: Mapping[str, Any], codec: JSONCodec) -> None:
+        super().__init__(driver, decode_params)
+        self._arguments = (*self._arguments, codec)
+        self._codec = codec
+
+    def decode(self, token: str) -> DecodeResult:
+        raw_payload = self._verify(token)
+        try:
+            payload = self._codec.loads(raw_payload)
+        except ValueError as e:
+            raise DecodeError(f'Invalid payload string: {e}') from e
+        if not isinstance(payload, dict):
+            raise DecodeError('Invalid payload string: must be a json object')
+
+        self._validate_claims(payload)
+        return payload, get_expiration(payload)
+
+
+class JSONPayloadDecoder(JWSDecoder):
+    """Verifies tokens like PyJWT and returns the payload as raw JSON bytes.
+
+    Only the registered and required claims are parsed to run the claim validation. The payload
+    model is validated later straight from the bytes, without building an intermediate dict of the
+    whole payload.
+    """
+
+    __slots__ = ('_claims_validator',)
+
+    def __init__(self, driver: PyJWT, decode_params: Mapping[str, Any]) -> None:
+        super().__init__(driver, decode_params)
+
+        claims = dict.fromkeys((*REGISTERED_CLAIMS, *self._claims_options.get('require', ())))
+        self._claims_validator = SchemaValidator(
+            core_schema.typed_dict_schema(
+                {claim: core_schema.typed_dict_field(core_schema.any_schema(), required=False) for claim in claims}
+            )
+        )
+
+    def decode(self, token: str) -> DecodeResult:
+        payload = self._verify(token)
+        try:
+            claims = self._claims_validator.validate_json(payload)
+        except ValidationError:
+            raise DecodeError('Invalid payload string: must be a json object') from None
+
+        self._validate_claims(claims)
+        return payload, get_expiration(claims)
@@ -3,19 +3,71 @@ from typing import Any, Type, Unpack
 from fastapi.security import HTTPAuthorizationCredentials
 from jwt import InvalidTokenError
 from pydantic import BaseModel
+from starlette.types import Scope
 
 from quick_jwt.core._function_args import ModelValidateKwargs
 from quick_jwt.core.abc import IDecodeDriverJWT, BaseJWT, IEncodeDriverJWT
+from quick_jwt.core.plan import QuickJWTPlan
+from quick_jwt.core.trusted import TrustedConstructor, get_trusted_constructor
 from quick_jwt.dto import JWTTokensDTO
 
 
+def validate_payload[PayloadModelType: BaseModel](
+    payload_model: Type[PayloadModelType],
+    raw_payload: Any,
+    model_validate_kwargs: ModelValidateKwargs,
+    trusted: bool = False,
+) -> PayloadModelType:
+    """Convert a decoded payload into the payload model.
+
+    Raw JSON payloads, produced when QuickJWTConfig.decode_payload_json is enabled, are validated
+    straight from the bytes by the validator pydantic caches on the model. Trusted payloads are
+    constructed without a full validation.
+    """
+    if trusted and isinstance(raw_payload, (dict, bytes)):
+        constructor: TrustedConstructor[PayloadModelType] = get_trusted_constructor(payload_model)
+        return constructor(raw_payload)
+    if isinstance(raw_payload, bytes):
+        return payload_model.model_validate_json(
+            raw_payload,
+            strict=model_validate_kwargs.get('strict'),
+            context=model_validate_kwargs.get('context'),
+            by_alias=model_validate_kwargs.get('by_alias'),
+            by_name=model_validate_kwargs.get('by_name'),
+        )
+    return payload_model.model_validate(raw_payload, **model_validate_kwargs)
+
+
+async def decode_once(plan: QuickJWTPlan, scope: Scope, token: str) -> Any:
+    """Decode the token with the plan, memoising the result in the state of the scope."""
+    state = scope.setdefault('state', {})
+    memo: dict[tuple[int, str], tuple[bool, Any]] = state.setdefault('quick_jwt_payloads', {})
+
+    key = (id(plan), token)
+    result = memo.get(key)
+    if result is None:
+        try:
+            result = (True, await plan.decode_async(token))
+        except InvalidTokenError as e:
+            result = (False, e)
+        memo[key] = result
+
+    success, payload = result
+    if success is False:
+        raise payload
+    if isinstance(payload, dict):
+        return payload.copy()
+    return payload
+
+
 class PyJWTDecodeDriverJWT(IDecodeDriverJWT, BaseJWT):
-    def _get_payload(
+    __slots__ = ()
+
+    async def _get_payload(
         self,
         bearer_token: HTTPAuthorizationCredentials | None,
         cookie_token: str | None,
     ) -> Any:
-        self._validate_driver()
         config = self._get_config()
 
         token = None
@@ -27,20 +79,17 @@ class PyJWTDecodeDriverJWT(IDecodeDriverJWT, BaseJWT):
             raise config.build_unauthorized_http_exception()
 
         try:
-            payload = config.driver.decode(token, **config.build_decode_params())
+            payload = await self._decode_once(token)
         except InvalidTokenError:
             raise config.build_unauthorized_http_exception()
 
         return payload
 
-    def _get_payload_optional(
+    async def _get_payload_optional(
         self,
         bearer_token: HTTPAuthorizationCredentials | None,
         cookie_token: str | None,
     ) -> Any | None:
-        self._validate_driver()
-        config = self._get_config()
-
         token = None
         if bearer_token is not None and bearer_token.credentials is not None:
             token = bearer_token.credentials
@@ -50,26 +99,28 @@ class PyJWTDecodeDriverJWT(IDecodeDriverJWT, BaseJWT):
             return None
 
         try:
-            payload = config.driver.decode(token, **config.build_decode_params())
+            payload = await self._decode_once(token)
         except InvalidTokenError:
             return None
 
         return payload
 
-    def _validate_driver(self) -> None:
-        config = self._get_config()
+    async def _decode_once(self, token: str) -> Any:
+        """Decode the token at most once per request.
 
-        if hasattr(config.driver, 'decode') is False or hasattr(config.driver, 'encode') is False:
-            raise Exception(
-                """
-                QuickJWTConfig.driver received invalid driver. 
-                Driver should have decode function.
-                Default driver: PyJWT()
-                """
-            )
+        The result is memoised in the request state, so every quick_jwt dependency of the request
+        which receives the same token shares a single verification.
+        """
+        return await decode_once(self._get_config().plan, self._get_request().scope, token)
 
 
 class PyJWTEncodeDriverJWT(IEncodeDriverJWT, BaseJWT):
+    __slots__ = (
+        '_access_payload',
+        '_refresh_payload',
+        '_model_validate_kwargs',
+    )
+
     def __init__(
         self,
         access_payload: Type[BaseModel],
@@ -87,8 +138,14 @@ class PyJWTEncodeDriverJWT(IEncodeDriverJWT, BaseJWT):
         access_payload: BaseModel,
         refresh_payload: BaseModel,
     ) -> JWTTokensDTO:
-        access_token = await self.create_access_token(access_payload)
-        refresh_token = await self.create_refresh_token(refresh_payload)
+        plan = self._get_config().plan
+        response = self._get_response()
+
+        access_payload = self._access_payload.model_validate(access_payload, **self._model_validate_kwargs)
+        refresh_payload = self._refresh_payload.model_validate(refresh_payload, **self._model_validate_kwargs)
+        access_token, refresh_token = await plan.encode_models_async((access_payload, refresh_payload))
+        plan.access_cookie.set(response, access_token)
+        plan.refresh_cookie.set(response, refresh_token)
 
         return JWTTokensDTO(
             access=access_token,
@@ -96,33 +153,19 @@ class PyJWTEncodeDriverJWT(IEncodeDriverJWT, BaseJWT):
         )
 
     async def create_access_token(self, access_payload: BaseModel) -> str:
-        self._validate_driver()
-        config = self._get_config()
+        plan = self._get_config().plan
         response = self._get_response()
 
         access_payload = self._access_payload.model_validate(access_payload, **self._model_validate_kwargs)
-        access_token = config.driver.encode(access_payload.model_dump(mode='json'), **config.build_encode_params())
-        response.set_cookie(value=access_token, **config.build_access_token_params())
+        access_token = await plan.encode_model_async(access_payload)
+        plan.access_cookie.set(response, access_token)
         return access_token
 
     async def create_refresh_token(self, refresh_payload: BaseModel) -> str:
-        self._validate_driver()
-        config = self._get_config()
+        plan = self._get_config().plan
         response = self._get_response()
 
         refresh_payload = self._refresh_payload.model_validate(refresh_payload, **self._model_validate_kwargs)
-        refresh_token = config.driver.encode(refresh_payload.model_dump(mode='json'), **config.build_encode_params())
-        response.set_cookie(value=refresh_token, **config.build_refresh_token_params())
+        refresh_token = await plan.encode_model_async(refresh_payload)
+        plan.refresh_cookie.set(response, refresh_token)
         return refresh_token
-
-    def _validate_driver(self) -> None:
-        config = self._get_config()
-
-        if hasattr(config.driver, 'decode') is False or hasattr(config.driver, 'encode') is False:
-            raise Exception(
-                """
-                QuickJWTConfig.driver received invalid driver. 
-                Driver should have decode function.
-                Default driver: PyJWT()
-                """
-            )
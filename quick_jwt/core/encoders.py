@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Mapping
+
+from jwt import PyJWK, PyJWS
+from jwt.algorithms import Algorithm
+from jwt.utils import base64url_encode
+from pydantic import BaseModel
+
+from quick_jwt.core.codecs import JSONCodec
+from quick_jwt.core.jws import build_header
+
+TIME_CLAIMS = ('exp', 'iat', 'nbf')
+
+
+class TokenEncoder(ABC):
+    """Signs a payload and returns the token."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def encode(self, payload: dict[str, Any]) -> str:
+        raise NotImplementedError
+
+    def encode_model(self, payload: BaseModel) -> str:
+        return self.encode(payload.model_dump(mode='json'))
+
+
+class DriverEncoder(TokenEncoder):
+    """Encodes tokens with the ``encode`` function of any driver."""
+
+    __slots__ = (
+        '_driver',
+        '_encode_params',
+    )
+
+    def __init__(self, driver: Any, encode_params: Mapping[str, Any]) -> None:
+        self._driver = driver
+        self._encode_params = dict(encode_params)
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        return self._driver.encode(payload, **self._encode_params)  # type: ignore[no-any-return]
+
+
+class JWSEncoder(TokenEncoder):
+    """Encodes tokens like PyJWT, with the payload and the header serialized by a JSON codec.
+
+    The header is the same for every token of a config, so its base64url segment is built once,
+    together with the signing algorithm and the prepared key, on the first encode.
+    """
+
+    __slots__ = (
+        '_codec',
+        '_encode_params',
+        '_is_payload_detached',
+        '_signing',
+    )
+
+    def __init__(self, codec: JSONCodec, encode_params: Mapping[str, Any]) -> None:
+        self._codec = codec
+        self._encode_params = dict(encode_params)
+        self._is_payload_detached = False
+        self._signing: tuple[bytes, Algorithm, Any] | None = None
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        if not isinstance(payload, dict):
+            raise TypeError('Expecting a dict object, as JWT only supports JSON objects as payloads.')
+
+        for claim in TIME_CLAIMS:
+            if isinstance(payload.get(claim), datetime):
+                payload = payload.copy()
+                for time_claim in TIME_CLAIMS:
+                    if isinstance(payload.get(time_claim), datetime):
+                        payload[time_claim] = timegm(payload[time_claim].utctimetuple())
+                break
+
+        return self.sign(self._codec.dumps(payload))
+
+    def sign(self, payload: bytes) -> str:
+        """Sign a payload which is already serialized to JSON bytes."""
+        header_segment, algorithm, key = self._signing or self._prepare()
+
+        if self._is_payload_detached:
+            signature = base64url_encode(algorithm.sign(header_segment + b'.' + payload, key))
+            return b'.'.join((header_segment, b'', signature)).decode()
+
+        signing_input = header_segment + b'.' + base64url_encode(payload)
+        return (signing_input + b'.' + base64url_encode(algorithm.sign(signing_input, key))).decode()
+
+    def _prepare(self) -> tuple[bytes, Algorithm, Any]:
+        jws = PyJWS()
+        key = self._encode_params['key']
+        headers = self._encode_params.get('headers')
+        algorithm_name = self._encode_params.get('algorithm')
+        if algorithm_name is None:
+            algorithm_name = key.algorithm_name if isinstance(key, PyJWK) else 'HS256'
+
+        header, algorithm_name, self._is_payload_detached = build_header(algorithm_name, headers)
+
+        sort_headers = self._encode_params.get('sort_headers', True)
+        algorithm = jws.get_algorithm_by_name(algorithm_name)
+        self._signing = (
+            base64url_encode(self._codec.dumps(header, sort_keys=sort_headers)),
+            algorithm,
+            algorithm.prepare_key(key.key if isinstance(key, PyJWK) else key),
+        )
+        return self._signing
+
+
+class ModelJWSEncoder(JWSEncoder):
+    """Encodes payload models straight to the signing input.
+
+    The model is serialized to JSON bytes by its pydantic-core serializer in a single call, instead
+    of dumping it to a dict which is then serialized again, and signed with the cached header segment.
+    """
+
+    __slots__ = ()
+
+    def encode_model(self, payload: BaseModel) -> str:
+        return self.sign(payload.__pydantic_serializer__.to_json(payload))
@@ -0,0 +1,29 @@
+from typing import Callable
+
+from anyio import CapacityLimiter, to_thread
+
+
+class CryptoExecutor:
+    """Runs CPU-heavy signing and verification in a thread pool instead of the event loop.
+
+    The number of threads used at the same time is bounded by a capacity limiter, which is created
+    lazily because it has to be bound to the running event loop.
+    """
+
+    __slots__ = (
+        '_limit',
+        '_limiter',
+    )
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._limiter: CapacityLimiter | None = None
+
+    async def run[ArgumentType, ResultType](
+        self,
+        function: Callable[[ArgumentType], ResultType],
+        argument: ArgumentType,
+    ) -> ResultType:
+        if self._limiter is None:
+            self._limiter = CapacityLimiter(self._limit)
+        return await to_thread.run_sync(function, argument, limiter=self._limiter)
@@ -0,0 +1,116 @@
+import binascii
+import json
+from typing import Any
+
+from jwt import DecodeError, InvalidTokenError
+
+HEADER_TYPE = 'JWT'
+HEADER_CACHE_SIZE = 64
+
+_URLSAFE_TO_STANDARD = bytes.maketrans(b'-_', b'+/')
+
+
+def build_header(algorithm: str, headers: dict[str, Any] | None) -> tuple[dict[str, Any], str, bool]:
+    """Build the JOSE header of a new token the same way as PyJWS.
+
+    Returns:
+        The header, the signing algorithm and whether the payload is detached, which is requested
+        with ``"b64": false``.
+    """
+    is_payload_detached = False
+    if headers:
+        if headers.get('alg'):
+            algorithm = headers['alg']
+        if headers.get('b64') is False:
+            is_payload_detached = True
+
+    header: dict[str, Any] = {'typ': HEADER_TYPE, 'alg': algorithm}
+    if headers:
+        if 'kid' in headers and not isinstance(headers['kid'], str):
+            raise InvalidTokenError('Key ID header parameter must be a string')
+        header.update(headers)
+    if not header['typ']:
+        del header['typ']
+    if is_payload_detached:
+        header['b64'] = False
+    elif 'b64' in header:
+        del header['b64']
+
+    return header, algorithm, is_payload_detached
+
+
+def base64url_decode(segment: bytes) -> bytes:
+    """Decode a base64url segment like ``jwt.utils.base64url_decode``, without the wrappers of the base64 module."""
+    padding = -len(segment) % 4
+    return binascii.a2b_base64(segment.translate(_URLSAFE_TO_STANDARD) + b'=' * padding)
+
+
+def load_token(
+    token: str | bytes,
+    headers: dict[bytes, dict[str, Any]] | None = None,
+) -> tuple[bytes, bytes, dict[str, Any], bytes]:
+    """Split a compact serialization and decode its segments the same way as PyJWS, with the same errors.
+
+    Args:
+        token: Compact serialization of the token.
+        headers: Cache of parsed headers by their segment. Tokens signed with the same key usually
+            share the header, so it is parsed once. The cached headers must not be mutated.
+
+    Returns:
+        The payload, the signing input, the header and the signature.
+    """
+    if isinstance(token, str):
+        token = token.encode()
+    if not isinstance(token, bytes):
+        raise DecodeError(f'Invalid token type. Token must be a {bytes}')
+
+    try:
+        signing_input, crypto_segment = token.rsplit(b'.', 1)
+        header_segment, payload_segment = signing_input.split(b'.', 1)
+    except ValueError as e:
+        raise DecodeError('Not enough segments') from e
+
+    header = None if headers is None else headers.get(header_segment)
+    if header is None:
+        header = load_header(header_segment)
+        if headers is not None:
+            if len(headers) >= HEADER_CACHE_SIZE:
+                headers.clear()
+            headers[header_segment] = header
+
+    try:
+        payload = base64url_decode(payload_segment)
+    except (TypeError, binascii.Error) as e:
+        raise DecodeError('Invalid payload padding') from e
+
+    try:
+        signature = base64url_decode(crypto_segment)
+    except (TypeError, binascii.Error) as e:
+        raise DecodeError('Invalid crypto padding') from e
+
+    return payload, signing_input, header, signature
+
+
+def load_header(header_segment: bytes) -> dict[str, Any]:
+    try:
+        header_data = base64url_decode(header_segment)
+    except (TypeError, binascii.Error) as e:
+        raise DecodeError('Invalid header padding') from e
+
+    try:
+        header = json.loads(header_data)
+    except ValueError as e:
+        raise DecodeError(f'Invalid header string: {e}') from e
+    if not isinstance(header, dict):
+        raise DecodeError('Invalid header string: must be a json object')
+    return header
+
+
+def load_payload(payload: bytes) -> dict[str, Any]:
+    try:
+        claims = json.loads(payload)
+    except ValueError as e:
+        raise DecodeError(f'Invalid payload string: {e}') from e
+    if not isinstance(claims, dict):
+        raise DecodeError('Invalid payload string: must be a json object')
+    return claims
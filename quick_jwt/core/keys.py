@@ -0,0 +1,88 @@
+from functools import lru_cache
+from typing import Any, Iterable
+
+from cryptography.hazmat.primitives import serialization
+from jwt import PyJWK, PyJWT, get_algorithm_by_name
+from jwt.algorithms import requires_cryptography
+from jwt.exceptions import PyJWTError
+
+
+@lru_cache(maxsize=64)
+def _load_key(algorithm: str, key: str | bytes) -> Any:
+    return get_algorithm_by_name(algorithm).prepare_key(key)
+
+
+def prepare_key(key: Any, algorithms: Iterable[str] | None) -> Any:
+    """Parse a PEM or SSH key into a cryptography key object once.
+
+    PyJWT parses string keys with ``cryptography`` on every ``encode`` and ``decode`` call,
+    while already parsed key objects are used as is. The key is prepared only when every
+    algorithm is asymmetric and accepts the same key object, otherwise it is returned untouched
+    and PyJWT keeps its usual behaviour.
+
+    Args:
+        key: The key from QuickJWTConfig.
+        algorithms: Algorithms the key is going to be used with.
+
+    Returns:
+        The parsed key object or the original key.
+    """
+    if not isinstance(key, (str, bytes)) or not algorithms:
+        return key
+
+    algorithms = tuple(algorithms)
+    if any(algorithm not in requires_cryptography for algorithm in algorithms):
+        return key
+
+    try:
+        prepared = _load_key(algorithms[0], key)
+        for algorithm in algorithms[1:]:
+            get_algorithm_by_name(algorithm).prepare_key(prepared)
+    except (PyJWTError, NotImplementedError, TypeError, ValueError):
+        return key
+
+    return prepared
+
+
+def prepare_driver_key(driver: Any, key: Any, algorithms: Iterable[str] | None) -> Any:
+    """Prepare the key with ``prepare_key`` for drivers which accept parsed key objects.
+
+    PyJWT and the native drivers use key objects as they are, other drivers receive the key as it
+    was configured.
+
+    Args:
+        driver: The driver from QuickJWTConfig.
+        key: The key from QuickJWTConfig.
+        algorithms: Algorithms the key is going to be used with.
+
+    Returns:
+        The parsed key object or the original key.
+    """
+    if not isinstance(driver, PyJWT) and getattr(driver, 'accepts_prepared_keys', False) is not True:
+        return key
+    return prepare_key(key, algorithms)
+
+
+def serialize_key(key: Any) -> Any:
+    """Turn a prepared key object into PEM bytes which can be pickled.
+
+    Key objects of ``cryptography`` cannot be pickled, so they are sent to worker processes as PEM
+    and prepared again with ``prepare_key`` there. Other keys are returned untouched.
+
+    Args:
+        key: The key from QuickJWTConfig or a key returned by ``prepare_key``.
+
+    Returns:
+        PEM bytes for key objects, otherwise the original key.
+    """
+    if isinstance(key, PyJWK):
+        key = key.key
+    if hasattr(key, 'private_bytes'):
+        return key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    if hasattr(key, 'public_bytes'):
+        return key.public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+    return key
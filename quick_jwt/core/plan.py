@@ -0,0 +1,311 @@
+import copy
+from dataclasses import dataclass
+from typing import Any, Sequence, TYPE_CHECKING
+
+from anyio import create_task_group
+from jwt import ImmatureSignatureError, InvalidTokenError, PyJWT
+from pydantic import BaseModel
+
+from quick_jwt.core.cache import TokenCache
+from quick_jwt.core.cookies import CookieTemplate
+from quick_jwt.core.codecs import JSONCodec, StdlibJSONCodec, get_json_codec
+from quick_jwt.core.decoders import CodecDecoder, DecodeResult, DriverDecoder, JSONPayloadDecoder, TokenDecoder
+from quick_jwt.core.encoders import DriverEncoder, JWSEncoder, ModelJWSEncoder, TokenEncoder
+from quick_jwt.core.executor import CryptoExecutor
+from quick_jwt.core.keys import prepare_driver_key
+from quick_jwt.core.precheck import TokenPrecheck
+from quick_jwt.core.process_pool import ProcessPoolVerifier
+
+if TYPE_CHECKING:
+    from quick_jwt.config import QuickJWTConfig
+
+HMAC_ALGORITHMS = frozenset(('HS256', 'HS384', 'HS512'))
+
+
+@dataclass(frozen=True, slots=True)
+class QuickJWTPlan:
+    """Immutable state compiled once from QuickJWTConfig.
+
+    The plan holds everything the per-request path needs: the encoder and the decoder built from the
+    validated driver with asymmetric keys already parsed, and derived constants such as cookie max-age values.
+    """
+
+    encoder: TokenEncoder
+    decoder: TokenDecoder
+    access_token_name: str
+    refresh_token_name: str
+    access_cookie: CookieTemplate
+    refresh_cookie: CookieTemplate
+    decode_precheck: TokenPrecheck
+    decode_cache: TokenCache | None
+    decode_negative_cache: TokenCache | None
+    encode_executor: CryptoExecutor | None
+    decode_executor: CryptoExecutor | None
+    decode_process_pool: ProcessPoolVerifier | None
+
+    @classmethod
+    def compile(cls, config: 'QuickJWTConfig') -> 'QuickJWTPlan':
+        driver_encode = getattr(config.driver, 'encode', None)
+        driver_decode = getattr(config.driver, 'decode', None)
+        if not callable(driver_encode) or not callable(driver_decode):
+            raise Exception(
+                """
+                QuickJWTConfig.driver received invalid driver.
+                Driver should have encode and decode functions.
+                Default driver: PyJWT()
+                """
+            )
+
+        codec: JSONCodec | None = None
+        if config.json_codec != 'json':
+            if isinstance(config.driver, PyJWT) and config.encode_json_encoder is None:
+                codec = get_json_codec(config.json_codec)
+            elif config.json_codec != 'auto':
+                raise Exception(
+                    """
+                    QuickJWTConfig.json_codec requires a PyJWT driver and no encode_json_encoder.
+                    Default driver: PyJWT()
+                    """
+                )
+
+        decoder: TokenDecoder
+        if config.decode_payload_json:
+            if not isinstance(config.driver, PyJWT):
+                raise Exception(
+                    """
+                    QuickJWTConfig.decode_payload_json requires a PyJWT driver.
+                    Default driver: PyJWT()
+                    """
+                )
+            decoder = JSONPayloadDecoder(config.driver, config.build_decode_params())
+        elif codec is not None or type(config.driver) is PyJWT:
+            decoder = CodecDecoder(config.driver, config.build_decode_params(), codec or StdlibJSONCodec())
+        else:
+            decoder = DriverDecoder(config.driver, config.build_decode_params())
+
+        encode_params = config.build_encode_params()
+        encode_algorithm = (config.encode_headers or {}).get('alg') or config.encode_algorithm or 'HS256'
+        encode_params['key'] = prepare_driver_key(config.driver, config.encode_key, (encode_algorithm,))
+
+        encoder: TokenEncoder
+        if config.encode_payload_json:
+            if not isinstance(config.driver, PyJWT) or config.encode_json_encoder is not None:
+                raise Exception(
+                    """
+                    QuickJWTConfig.encode_payload_json requires a PyJWT driver and no encode_json_encoder.
+                    Default driver: PyJWT()
+                    """
+                )
+            encoder = ModelJWSEncoder(codec or StdlibJSONCodec(), encode_params)
+        elif codec is not None:
+            encoder = JWSEncoder(codec, encode_params)
+        else:
+            encoder = DriverEncoder(config.driver, encode_params)
+
+        encode_executor = decode_executor = None
+        if config.crypto_executor == 'thread':
+            executor = CryptoExecutor(config.crypto_executor_limit)
+            inline_hmac = config.crypto_executor_inline_hmac
+            if not inline_hmac or encode_algorithm not in HMAC_ALGORITHMS:
+                encode_executor = executor
+            if not inline_hmac or not HMAC_ALGORITHMS.issuperset(config.decode_algorithms or ()):
+                decode_executor = executor
+
+        decode_process_pool = None
+        if config.decode_process_workers > 0:
+            decode_process_pool = ProcessPoolVerifier(
+                decoder=decoder,
+                workers=config.decode_process_workers,
+                batch_size=config.decode_process_batch_size,
+                batch_delay=config.decode_process_batch_delay.total_seconds(),
+            )
+
+        return cls(
+            encoder=encoder,
+            decoder=decoder,
+            access_token_name=config.access_token_name,
+            refresh_token_name=config.refresh_token_name,
+            access_cookie=CookieTemplate(config.build_access_token_params()),
+            refresh_cookie=CookieTemplate(config.build_refresh_token_params()),
+            decode_precheck=TokenPrecheck(config.decode_max_token_length, config.decode_algorithms),
+            decode_cache=config.decode_cache,
+            decode_negative_cache=config.decode_negative_cache,
+            encode_executor=encode_executor,
+            decode_executor=decode_executor,
+            decode_process_pool=decode_process_pool,
+        )
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        return self.encoder.encode(payload)
+
+    async def encode_async(self, payload: dict[str, Any]) -> str:
+        """Encode the payload, in the thread pool when the crypto executor is enabled."""
+        if self.encode_executor is None:
+            return self.encode(payload)
+        return await self.encode_executor.run(self.encode, payload)
+
+    def encode_model(self, payload: BaseModel) -> str:
+        return self.encoder.encode_model(payload)
+
+    async def encode_model_async(self, payload: BaseModel) -> str:
+        """Encode the payload model, in the thread pool when the crypto executor is enabled."""
+        if self.encode_executor is None:
+            return self.encode_model(payload)
+        return await self.encode_executor.run(self.encode_model, payload)
+
+    def encode_models(self, payloads: Sequence[BaseModel]) -> list[str]:
+        return [self.encoder.encode_model(payload) for payload in payloads]
+
+    async def encode_models_async(self, payloads: Sequence[BaseModel], chunk_size: int = 1) -> list[str]:
+        """Encode the payload models concurrently when the crypto executor is enabled.
+
+        The payloads are split into chunks of ``chunk_size`` models, every chunk is signed in its own
+        thread of the executor and the tokens are returned in the order of the payloads.
+        """
+        executor = self.encode_executor
+        if executor is None:
+            return self.encode_models(payloads)
+
+        chunks = [payloads[start : start + chunk_size] for start in range(0, len(payloads), chunk_size)]
+        results: list[list[str]] = [[] for _ in chunks]
+
+        async def encode_chunk(index: int) -> None:
+            results[index] = await executor.run(self.encode_models, chunks[index])
+
+        async with create_task_group() as task_group:
+            for index in range(len(chunks)):
+                task_group.start_soon(encode_chunk, index)
+
+        return [token for tokens in results for token in tokens]
+
+    def decode(self, token: str) -> Any:
+        key, payload = self._lookup(token)
+        if payload is not None:
+            return payload
+
+        self.decode_precheck.check(token)
+        try:
+            payload, expires_at = self._decode(token)
+        except InvalidTokenError as e:
+            self._reject(key, e)
+            raise
+
+        self._store(key, token, payload, expires_at)
+        return payload
+
+    async def decode_async(self, token: str) -> Any:
+        """Decode the token in the process pool or in the thread pool when one of them is enabled."""
+        if self.decode_process_pool is None and self.decode_executor is None:
+            return self.decode(token)
+
+        key, payload = self._lookup(token)
+        if payload is not None:
+            return payload
+
+        self.decode_precheck.check(token)
+        try:
+            if self.decode_process_pool is not None:
+                payload, expires_at = await self.decode_process_pool.decode(token)
+            elif self.decode_executor is not None:
+                payload, expires_at = await self.decode_executor.run(self._decode, token)
+        except InvalidTokenError as e:
+            self._reject(key, e)
+            raise
+
+        self._store(key, token, payload, expires_at)
+        return payload
+
+    def decode_many(self, tokens: Sequence[str]) -> list[tuple[bool, Any]]:
+        """Decode several tokens at once, in the process pool when it is enabled.
+
+        Returns:
+            A ``(True, payload)`` or ``(False, exception)`` pair for every token, in the order of the tokens.
+        """
+        results: list[tuple[bool, Any]] = [(False, None)] * len(tokens)
+        missing: list[tuple[int, bytes | None]] = []
+        for index, token in enumerate(tokens):
+            try:
+                key, payload = self._lookup(token)
+                if payload is None:
+                    self.decode_precheck.check(token)
+            except InvalidTokenError as e:
+                results[index] = (False, e)
+                continue
+
+            if payload is not None:
+                results[index] = (True, payload)
+            else:
+                missing.append((index, key))
+
+        if self.decode_process_pool is not None:
+            decoded = self.decode_process_pool.decode_many(tokens[index] for index, _ in missing)
+        else:
+            decoded = [self._try_decode(tokens[index]) for index, _ in missing]
+
+        for (index, key), (success, value) in zip(missing, decoded):
+            if success:
+                payload, expires_at = value
+                self._store(key, tokens[index], payload, expires_at)
+                results[index] = (True, payload)
+                continue
+
+            if isinstance(value, InvalidTokenError):
+                self._reject(key, value)
+            results[index] = (False, value)
+        return results
+
+    def _try_decode(self, token: str) -> tuple[bool, Any]:
+        try:
+            return True, self._decode(token)
+        except Exception as e:
+            return False, e
+
+    def _decode(self, token: str) -> DecodeResult:
+        return self.decoder.decode(token)
+
+    def _lookup(self, token: str) -> tuple[bytes | None, Any]:
+        """Look the token up in the caches.
+
+        Returns:
+            The cache key and the cached payload, or None when the token is not cached.
+
+        Raises:
+            InvalidTokenError: If the token was recently rejected or is too long.
+        """
+        self.decode_precheck.check_length(token)
+        cache = self.decode_cache or self.decode_negative_cache
+        if cache is None:
+            return None, None
+
+        key = cache.digest(token)
+        if self.decode_negative_cache is not None:
+            error = self.decode_negative_cache.get(key)
+            if error is not None:
+                raise copy.copy(error)
+
+        if self.decode_cache is None:
+            return key, None
+
+        payload = self.decode_cache.get(key)
+        if isinstance(payload, dict):
+            return key, payload.copy()
+        return key, payload
+
+    def _store(self, key: bytes | None, token: str, payload: Any, expires_at: float | None) -> None:
+        if self.decode_cache is None or key is None:
+            return
+
+        if isinstance(payload, dict):
+            payload = payload.copy()
+        elif not isinstance(payload, bytes):
+            return
+        self.decode_cache.set(key, payload, size=len(token), expires_at=expires_at)
+
+    def _reject(self, key: bytes | None, error: InvalidTokenError) -> None:
+        if self.decode_negative_cache is None or key is None:
+            return
+        # A token with ``nbf`` or ``iat`` in the future becomes valid with time, so it is not remembered
+        if isinstance(error, ImmatureSignatureError):
+            return
+
+        self.decode_negative_cache.set(key, copy.copy(error), size=0)
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+import re
+from typing import Iterable
+
+from jwt import DecodeError
+
+_TOKEN_PATTERN = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*')
+
+
+class TokenPrecheckError(DecodeError):
+    """The token was rejected by the structural pre-check, before any signature verification."""
+
+
+class TokenPrecheck:
+    """Cheap structural validation of a token before it reaches the driver.
+
+    Checks run from the cheapest to the most expensive one: the token length, the number of segments
+    with the base64url charset, and the ``alg`` header against the allowed algorithms. This bounds the
+    CPU time spent on garbage tokens, such as multi-megabyte cookies.
+    """
+
+    __slots__ = (
+        '_max_length',
+        '_algorithms',
+    )
+
+    def __init__(self, max_length: int, algorithms: Iterable[str] | None) -> None:
+        self._max_length = max_length
+        self._algorithms = frozenset(algorithms) if algorithms is not None else None
+
+    def check_length(self, token: str) -> None:
+        if len(token) > self._max_length:
+            raise TokenPrecheckError('Token is too long')
+
+    def check(self, token: str) -> None:
+        self.check_length(token)
+
+        if _TOKEN_PATTERN.fullmatch(token) is None:
+            raise TokenPrecheckError('Token is not a base64url encoded JWS compact serialization')
+
+        if self._algorithms is None:
+            return
+
+        header_segment = token[: token.index('.')]
+        try:
+            header = json.loads(base64.urlsafe_b64decode(header_segment + '=' * (-len(header_segment) % 4)))
+        except (binascii.Error, ValueError):
+            raise TokenPrecheckError('Token header is not a valid JSON') from None
+
+        algorithm = header.get('alg') if isinstance(header, dict) else None
+        if not isinstance(algorithm, str) or algorithm not in self._algorithms:
+            raise TokenPrecheckError('Token algorithm is not allowed')
@@ -0,0 +1,147 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable
+
+from quick_jwt.core.decoders import TokenDecoder
+
+_worker_decoder: Any = None
+
+type BatchResult = list[tuple[bool, Any]]
+
+
+def _initialize_worker(decoder: TokenDecoder) -> None:
+    global _worker_decoder
+
+    _worker_decoder = decoder
+
+
+def _decode_batch(tokens: list[str]) -> BatchResult:
+    results: BatchResult = []
+    for token in tokens:
+        try:
+            results.append((True, _worker_decoder.decode(token)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+class ProcessPoolVerifier:
+    """Verifies tokens in a pool of worker processes to use every CPU core.
+
+    The decoder is shipped to each worker once, when it starts.
+    Tokens decoded from coroutines are collected into micro-batches, which are flushed when
+    ``batch_size`` tokens are pending or after ``batch_delay`` seconds, to amortise the IPC cost.
+    """
+
+    __slots__ = (
+        '_decoder',
+        '_workers',
+        '_batch_size',
+        '_batch_delay',
+        '_executor',
+        '_pending',
+        '_flush_handle',
+    )
+
+    def __init__(
+        self,
+        decoder: TokenDecoder,
+        workers: int,
+        batch_size: int,
+        batch_delay: float,
+    ) -> None:
+        self._decoder = decoder
+        self._workers = workers
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[str, asyncio.Future[Any]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def start(self) -> None:
+        """Start every worker process and wait until they are ready.
+
+        Without this call the workers are started lazily by the first decode.
+        """
+        executor = self._get_executor()
+        for future in [executor.submit(_decode_batch, []) for _ in range(self._workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def decode(self, token: str) -> Any:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((token, future))
+
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_delay, self._flush)
+
+        return await future
+
+    def decode_many(self, tokens: Iterable[str]) -> BatchResult:
+        """Decode tokens in batches spread across the workers.
+
+        Returns:
+            A ``(True, (payload, expires_at))`` or ``(False, exception)`` pair for every token, in the order
+            of the tokens.
+        """
+        executor = self._get_executor()
+        tokens = list(tokens)
+        batches = [tokens[i : i + self._batch_size] for i in range(0, len(tokens), self._batch_size)]
+
+        results: BatchResult = []
+        for batch_result in executor.map(_decode_batch, batches):
+            results.extend(batch_result)
+        return results
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize_worker,
+                initargs=(self._decoder,),
+            )
+        return self._executor
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            future = self._get_executor().submit(_decode_batch, [token for token, _ in batch])
+        except Exception as e:
+            for _, waiter in batch:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+
+        asyncio.wrap_future(future).add_done_callback(lambda result: self._resolve(batch, result))
+
+    @staticmethod
+    def _resolve(batch: list[tuple[str, asyncio.Future[Any]]], result: 'asyncio.Future[BatchResult]') -> None:
+        exception = result.exception()
+        for index, (_, waiter) in enumerate(batch):
+            if waiter.done():
+                continue
+            if exception is not None:
+                waiter.set_exception(exception)
+                continue
+
+            success, value = result.result()[index]
+            if success:
+                waiter.set_result(value)
+            else:
+                waiter.set_exception(value)
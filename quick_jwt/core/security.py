@@ -1,28 +1,77 @@
 from typing import Annotated
+from urllib.parse import parse_qsl
 
 from fastapi import Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.types import Scope
 
-access_bearer_security = Annotated[
-    HTTPAuthorizationCredentials | None,
-    Security(
-        HTTPBearer(
-            bearerFormat='Bearer',
-            scheme_name='JWT access token into headers',
-            description='The input value is inserted as follows: "Authorization: Bearer {value}"',
-            auto_error=False,
-        )
-    ),
-]
-
-refresh_bearer_security = Annotated[
-    HTTPAuthorizationCredentials | None,
-    Security(
-        HTTPBearer(
-            bearerFormat='Bearer',
-            scheme_name='JWT refresh token into headers',
-            description='The input value is inserted as follows: "Authorization: Bearer {value}"',
-            auto_error=False,
-        )
-    ),
-]
+from quick_jwt.core.cookies import read_cookie
+
+WEBSOCKET_PROTOCOL_PREFIX = 'bearer.'
+
+access_bearer = HTTPBearer(
+    bearerFormat='Bearer',
+    scheme_name='JWT access token into headers',
+    description='The input value is inserted as follows: "Authorization: Bearer {value}"',
+    auto_error=False,
+)
+
+refresh_bearer = HTTPBearer(
+    bearerFormat='Bearer',
+    scheme_name='JWT refresh token into headers',
+    description='The input value is inserted as follows: "Authorization: Bearer {value}"',
+    auto_error=False,
+)
+
+access_bearer_security = Annotated[HTTPAuthorizationCredentials | None, Security(access_bearer)]
+
+refresh_bearer_security = Annotated[HTTPAuthorizationCredentials | None, Security(refresh_bearer)]
+
+
+def read_bearer_token(scope: Scope) -> str | None:
+    """Read the bearer token from the raw ``authorization`` header of the scope, like ``HTTPBearer``."""
+    for header_name, header_value in scope['headers']:
+        if header_name == b'authorization':
+            break
+    else:
+        return None
+
+    authorization: str = header_value.decode('latin-1')
+    scheme, _, credentials = authorization.partition(' ')
+    if not scheme or not credentials or scheme.lower() != 'bearer':
+        return None
+    return credentials
+
+
+def read_websocket_token(scope: Scope, name: str) -> str | None:
+    """Read the token of a websocket handshake.
+
+    Browsers cannot set headers on a websocket handshake, so the token is looked up in the cookie
+    ``name``, then in a ``bearer.<token>`` entry of the ``Sec-WebSocket-Protocol`` header and last
+    in the query parameter ``name``.
+
+    Args:
+        scope: ASGI scope of the websocket.
+        name: Name of the cookie and of the query parameter.
+
+    Returns:
+        The token or None when the handshake does not carry one.
+    """
+    token = read_cookie(scope, name)
+    if token is not None:
+        return token
+
+    for header_name, header_value in scope['headers']:
+        if header_name == b'sec-websocket-protocol':
+            protocols: str = header_value.decode('latin-1')
+            for protocol in protocols.split(','):
+                protocol = protocol.strip()
+                if protocol.startswith(WEBSOCKET_PROTOCOL_PREFIX) and len(protocol) > len(WEBSOCKET_PROTOCOL_PREFIX):
+                    return protocol[len(WEBSOCKET_PROTOCOL_PREFIX) :]
+
+    query_string: bytes = scope.get('query_string', b'')
+    if name.encode('latin-1') in query_string:
+        for key, value in reversed(parse_qsl(query_string.decode('latin-1'), keep_blank_values=True)):
+            if key == name:
+                return value
+    return None
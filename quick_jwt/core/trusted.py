@@ -0,0 +1,164 @@
+import types
+from functools import lru_cache
+from typing import Any, NotRequired, Type, TypedDict, Union, get_args, get_origin
+
+from pydantic import AliasChoices, AliasPath, BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined, from_json
+
+_JSON_TYPES: frozenset[Any] = frozenset((str, int, float, bool, type(None), Any, object))
+_JSON_CONTAINERS: frozenset[Any] = frozenset((list, dict, Union, types.UnionType))
+
+
+def _is_json_native(annotation: Any) -> bool:
+    """Whether values of the annotation are used as is when they come from JSON."""
+    if annotation in _JSON_TYPES:
+        return True
+
+    origin = get_origin(annotation)
+    if origin not in _JSON_CONTAINERS:
+        return False
+    if origin is dict and get_args(annotation)[:1] != (str,):
+        return False
+    return all(_is_json_native(argument) for argument in get_args(annotation))
+
+
+class TrustedConstructor[PayloadModelType: BaseModel]:
+    """Builds payload models from the payloads of trusted tokens without a full validation.
+
+    JSON-native fields, such as ``str``, ``int`` or ``list[str]``, are assigned as they are. Only the
+    other fields, such as ``UUID``, ``datetime`` or nested models, are converted, with a single
+    validator built once per model. Alias choices, alias paths, ``populate_by_name`` and extra fields
+    with ``extra='allow'`` are resolved from the whole payload as the validation would resolve them.
+    Models with a ``model_post_init`` hook or private attributes get it called after the fields are set.
+    """
+
+    __slots__ = (
+        '_payload_model',
+        '_names',
+        '_keys',
+        '_lookups',
+        '_converter',
+        '_optional_fields',
+        '_extra_allowed',
+        '_post_init',
+        '_use_model_construct',
+    )
+
+    def __init__(self, payload_model: Type[PayloadModelType]) -> None:
+        config = payload_model.model_config
+        self._payload_model = payload_model
+        self._names = frozenset(payload_model.model_fields)
+        self._keys: list[tuple[str, str]] | None = None
+        self._lookups: list[tuple[str, tuple[str | AliasPath, ...]]] | None = None
+        self._optional_fields: list[tuple[str, FieldInfo]] = []
+        self._extra_allowed = config.get('extra') == 'allow'
+        self._post_init = bool(payload_model.__pydantic_post_init__)
+        self._use_model_construct = bool(payload_model.__pydantic_root_model__)
+
+        by_alias = config.get('validate_by_alias', True)
+        by_name = bool(config.get('validate_by_name') or config.get('populate_by_name'))
+        lookups = []
+        converted_fields = {}
+        for name, field in payload_model.model_fields.items():
+            lookups.append((name, _field_keys(name, field, by_alias, by_name)))
+
+            if not _is_json_native(field.annotation):
+                converted_fields[name] = NotRequired[field.annotation]
+            if not field.is_required():
+                self._optional_fields.append((name, field))
+
+        if self._extra_allowed or any(len(keys) != 1 or not isinstance(keys[0], str) for _, keys in lookups):
+            self._lookups = lookups
+        elif any((name,) != keys for name, keys in lookups):
+            self._keys = [(name, keys[0]) for name, keys in lookups if isinstance(keys[0], str)]
+
+        self._converter: TypeAdapter[dict[str, Any]] | None = None
+        if converted_fields:
+            fields_type = TypedDict(f'{payload_model.__name__}Fields', converted_fields)  # type: ignore[misc]
+            self._converter = TypeAdapter(fields_type)
+
+    def __call__(self, raw_payload: Any) -> PayloadModelType:
+        if isinstance(raw_payload, bytes):
+            payload = from_json(raw_payload)
+        else:
+            payload = raw_payload if self._keys is not None or self._lookups is not None else dict(raw_payload)
+
+        extra: dict[str, Any] | None = None
+        if self._lookups is not None:
+            values, extra = self._resolve(self._lookups, payload)
+        elif self._keys is None:
+            values = payload
+            for key in values.keys() - self._names:
+                del values[key]
+        else:
+            values = {name: payload[key] for name, key in self._keys if key in payload}
+
+        if self._converter is not None:
+            values.update(self._converter.validate_python(values))
+
+        if len(values) == len(self._names):
+            fields_set = set(self._names)
+        else:
+            fields_set = set(values)
+            for name, field in self._optional_fields:
+                if name not in values:
+                    values[name] = field.get_default(call_default_factory=True, validated_data=values)
+        if extra:
+            fields_set.update(extra)
+
+        if self._use_model_construct:
+            return self._payload_model.model_construct(fields_set, **values)
+
+        instance = self._payload_model.__new__(self._payload_model)
+        object.__setattr__(instance, '__dict__', values)
+        object.__setattr__(instance, '__pydantic_fields_set__', fields_set)
+        object.__setattr__(instance, '__pydantic_extra__', extra)
+        object.__setattr__(instance, '__pydantic_private__', None)
+        if self._post_init:
+            instance.model_post_init(None)
+        return instance
+
+    def _resolve(
+        self,
+        lookups: list[tuple[str, tuple[str | AliasPath, ...]]],
+        payload: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        values: dict[str, Any] = {}
+        used: set[Any] = set()
+        for name, keys in lookups:
+            for key in keys:
+                if isinstance(key, str):
+                    if key in payload:
+                        values[name] = payload[key]
+                        used.add(key)
+                        break
+                else:
+                    value = key.search_dict_for_path(payload)
+                    if value is not PydanticUndefined:
+                        values[name] = value
+                        used.add(key.path[0])
+                        break
+
+        if not self._extra_allowed:
+            return values, None
+        return values, {key: value for key, value in payload.items() if key not in used}
+
+
+def _field_keys(name: str, field: FieldInfo, by_alias: bool, by_name: bool) -> tuple[str | AliasPath, ...]:
+    """Payload keys of a field, in the order the validation looks them up."""
+    alias = field.validation_alias if field.validation_alias is not None else field.alias
+    if alias is None or not by_alias:
+        return (name,)
+
+    keys: tuple[str | AliasPath, ...] = tuple(alias.choices) if isinstance(alias, AliasChoices) else (alias,)
+    if by_name and name not in keys:
+        keys = (*keys, name)
+    return keys
+
+
+@lru_cache(maxsize=64)
+def get_trusted_constructor[PayloadModelType: BaseModel](
+    payload_model: Type[PayloadModelType],
+) -> TrustedConstructor[PayloadModelType]:
+    return TrustedConstructor(payload_model)
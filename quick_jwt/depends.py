@@ -12,7 +12,11 @@ from quick_jwt.authentication import (
     AccessTokenOptionalCheck,
     RefreshTokenOptionalCheck,
     AccessTokenCheck,
+    WebSocketAccessTokenCheck,
+    LightweightTokenCheck,
 )
+from quick_jwt.core.security import access_bearer, refresh_bearer
+from quick_jwt.websocket import WebSocketWatcher
 
 
 def create_jwt_depends[
@@ -29,17 +33,33 @@ def create_jwt_depends[
 
 def access_check_depends[PayloadModelType: Type[BaseModel]](
     payload_model: PayloadModelType,
+    *,
+    trusted: bool = False,
+    lightweight: bool = False,
     **_model_validate_kwargs: Unpack[ModelValidateKwargs],
 ) -> PayloadModelType:
-    depends = AccessTokenCheck(payload_model, **_model_validate_kwargs)
+    depends: AccessTokenCheck | LightweightTokenCheck
+    if lightweight:
+        depends = LightweightTokenCheck(payload_model, access_bearer, trusted=trusted, **_model_validate_kwargs)
+    else:
+        depends = AccessTokenCheck(payload_model, trusted=trusted, **_model_validate_kwargs)
     return Annotated[PayloadModelType, Depends(depends)]  # type: ignore
 
 
 def refresh_check_depends[PayloadModelType: Type[BaseModel]](
     payload_model: PayloadModelType,
+    *,
+    trusted: bool = False,
+    lightweight: bool = False,
     **_model_validate_kwargs: Unpack[ModelValidateKwargs],
 ) -> PayloadModelType:
-    depends = RefreshTokenCheck(payload_model, **_model_validate_kwargs)
+    depends: RefreshTokenCheck | LightweightTokenCheck
+    if lightweight:
+        depends = LightweightTokenCheck(
+            payload_model, refresh_bearer, refresh=True, trusted=trusted, **_model_validate_kwargs
+        )
+    else:
+        depends = RefreshTokenCheck(payload_model, trusted=trusted, **_model_validate_kwargs)
     return Annotated[PayloadModelType, Depends(depends)]  # type: ignore
 
 
@@ -62,15 +82,44 @@ def logout_depends() -> None:
 
 def access_check_optional_depends[PayloadModelType: Type[BaseModel]](
     payload_model: PayloadModelType,
+    *,
+    trusted: bool = False,
+    lightweight: bool = False,
     **_model_validate_kwargs: Unpack[ModelValidateKwargs],
 ) -> PayloadModelType | None:
-    depends = AccessTokenOptionalCheck(payload_model, **_model_validate_kwargs)
+    depends: AccessTokenOptionalCheck | LightweightTokenCheck
+    if lightweight:
+        depends = LightweightTokenCheck(
+            payload_model, access_bearer, optional=True, trusted=trusted, **_model_validate_kwargs
+        )
+    else:
+        depends = AccessTokenOptionalCheck(payload_model, trusted=trusted, **_model_validate_kwargs)
     return Annotated[PayloadModelType | None, Depends(depends)]  # type: ignore
 
 
 def refresh_check_optional_depends[PayloadModelType: Type[BaseModel]](
     payload_model: PayloadModelType,
+    *,
+    trusted: bool = False,
+    lightweight: bool = False,
     **_model_validate_kwargs: Unpack[ModelValidateKwargs],
 ) -> PayloadModelType | None:
-    depends = RefreshTokenOptionalCheck(payload_model, **_model_validate_kwargs)
+    depends: RefreshTokenOptionalCheck | LightweightTokenCheck
+    if lightweight:
+        depends = LightweightTokenCheck(
+            payload_model, refresh_bearer, refresh=True, optional=True, trusted=trusted, **_model_validate_kwargs
+        )
+    else:
+        depends = RefreshTokenOptionalCheck(payload_model, trusted=trusted, **_model_validate_kwargs)
     return Annotated[PayloadModelType | None, Depends(depends)]  # type: ignore
+
+
+def access_check_websocket_depends[PayloadModelType: Type[BaseModel]](
+    payload_model: PayloadModelType,
+    *,
+    watcher: WebSocketWatcher | None = None,
+    trusted: bool = False,
+    **_model_validate_kwargs: Unpack[ModelValidateKwargs],
+) -> PayloadModelType:
+    depends = WebSocketAccessTokenCheck(payload_model, watcher=watcher, trusted=trusted, **_model_validate_kwargs)
+    return Annotated[PayloadModelType, Depends(depends)]  # type: ignore
@@ -0,0 +1,7 @@
+from quick_jwt.drivers.eddsa import EdDSADriver
+from quick_jwt.drivers.hs import HSDriver
+
+__all__ = (
+    'EdDSADriver',
+    'HSDriver',
+)
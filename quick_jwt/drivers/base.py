@@ -0,0 +1,236 @@
+import json
+from abc import ABC, abstractmethod
+from calendar import timegm
+from datetime import datetime, timedelta
+from typing import Any, ClassVar, Iterable, Sequence
+
+from jwt import DecodeError, InvalidAlgorithmError, InvalidSignatureError, PyJWK
+from jwt.utils import base64url_encode
+
+from quick_jwt.core.claims import ClaimValidator
+from quick_jwt.core.decoders import REGISTERED_CLAIMS
+from quick_jwt.core.jws import build_header, load_payload, load_token
+
+DEFAULT_OPTIONS: dict[str, Any] = {
+    'verify_signature': True,
+    'verify_exp': True,
+    'verify_nbf': True,
+    'verify_iat': True,
+    'verify_aud': True,
+    'verify_iss': True,
+    'verify_sub': True,
+    'verify_jti': True,
+    'require': [],
+}
+
+CACHE_SIZE = 64
+
+type ClaimValidatorEntry = tuple[Any, Any, Any, ClaimValidator]
+
+
+class NativeDriver(ABC):
+    """Base of the drivers that replace PyJWT for a family of algorithms.
+
+    The ``encode`` and ``decode`` functions take the same arguments and raise the same exceptions as
+    the PyJWT ones. Header segments are serialized once, parsed headers are cached by their segment
+    and the claim checks are compiled once for each set of decode arguments, so the options and the
+    audience must not be mutated after they are passed. Subclasses only prepare keys, sign and verify.
+
+    Args:
+        options: Default decode options, the same as for ``PyJWT``.
+    """
+
+    algorithms: ClassVar[frozenset[str]]
+    default_algorithm: ClassVar[str]
+    accepts_prepared_keys: ClassVar[bool] = True
+
+    __slots__ = (
+        'options',
+        '_header_segments',
+        '_headers',
+        '_claim_validators',
+    )
+
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        self.options: dict[str, Any] = {**DEFAULT_OPTIONS, **(options or {})}
+        self._header_segments: dict[tuple[str, bool], bytes] = {}
+        self._headers: dict[bytes, dict[str, Any]] = {}
+        self._claim_validators: dict[tuple[int, int, int, Any, Any], ClaimValidatorEntry] = {}
+
+    def __reduce__(self) -> tuple[type['NativeDriver'], tuple[dict[str, Any]]]:
+        return type(self), (self.options,)
+
+    @abstractmethod
+    def _sign(self, algorithm: str, key: Any, signing_input: bytes) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _verify(self, algorithm: str, key: Any, signing_input: bytes, signature: bytes) -> bool:
+        raise NotImplementedError
+
+    def encode(
+        self,
+        payload: dict[str, Any],
+        key: Any,
+        algorithm: str | None = None,
+        headers: dict[str, Any] | None = None,
+        json_encoder: type[json.JSONEncoder] | None = None,
+        sort_headers: bool = True,
+    ) -> str:
+        if not isinstance(payload, dict):
+            raise TypeError('Expecting a dict object, as JWT only supports JSON objects as payloads.')
+
+        if isinstance(key, PyJWK):
+            algorithm = algorithm or key.algorithm_name
+            key = key.key
+
+        payload = payload.copy()
+        for time_claim in ('exp', 'iat', 'nbf'):
+            if isinstance(payload.get(time_claim), datetime):
+                payload[time_claim] = timegm(payload[time_claim].utctimetuple())
+        json_payload = json.dumps(payload, separators=(',', ':'), cls=json_encoder).encode()
+
+        algorithm = algorithm or self.default_algorithm
+        header_segment = None
+        if headers is None and json_encoder is None:
+            header_segment = self._header_segments.get((algorithm, sort_headers))
+        if header_segment is None:
+            header, algorithm, is_payload_detached = build_header(algorithm, headers)
+            header_json = json.dumps(header, separators=(',', ':'), cls=json_encoder, sort_keys=sort_headers)
+            header_segment = base64url_encode(header_json.encode())
+            if headers is None and json_encoder is None and len(self._header_segments) < CACHE_SIZE:
+                self._header_segments[(algorithm, sort_headers)] = header_segment
+        else:
+            is_payload_detached = False
+
+        if algorithm not in self.algorithms:
+            raise NotImplementedError('Algorithm not supported')
+
+        signing_input = (
+            header_segment + b'.' + (json_payload if is_payload_detached else base64url_encode(json_payload))
+        )
+        signature = base64url_encode(self._sign(algorithm, key, signing_input))
+
+        if is_payload_detached:
+            return b'.'.join((header_segment, b'', signature)).decode()
+        return (signing_input + b'.' + signature).decode()
+
+    def decode_complete(
+        self,
+        jwt: str | bytes,
+        key: Any = '',
+        algorithms: Sequence[str] | None = None,
+        options: dict[str, Any] | None = None,
+        verify: bool | None = None,
+        detached_payload: bytes | None = None,
+        audience: str | Iterable[str] | None = None,
+        subject: str | None = None,
+        issuer: str | Sequence[str] | None = None,
+        leeway: float | timedelta = 0,
+    ) -> dict[str, Any]:
+        verify_signature = True if options is None else options.get('verify_signature', True)
+
+        if isinstance(key, PyJWK):
+            if algorithms is None:
+                algorithms = [key.algorithm_name]
+            key = key.key
+        elif verify_signature and not algorithms:
+            raise DecodeError(
+                'It is required that you pass in a value for the "algorithms" argument when calling decode().'
+            )
+
+        payload, signing_input, header, signature = load_token(jwt, self._headers)
+
+        if header.get('b64', True) is False:
+            if detached_payload is None:
+                raise DecodeError(
+                    'It is required that you pass in a value for the "detached_payload" argument to decode a message '
+                    'having the b64 header set to false.'
+                )
+            payload = detached_payload
+            signing_input = b'.'.join([signing_input.rsplit(b'.', 1)[0], payload])
+
+        if verify_signature:
+            self._verify_signature(signing_input, header, signature, key, algorithms)
+
+        claims = load_payload(payload)
+        self._get_claim_validator(options, audience, issuer, subject, leeway).validate(claims)
+
+        return {
+            'payload': claims,
+            'header': header.copy(),
+            'signature': signature,
+        }
+
+    def decode(
+        self,
+        jwt: str | bytes,
+        key: Any = '',
+        algorithms: Sequence[str] | None = None,
+        options: dict[str, Any] | None = None,
+        verify: bool | None = None,
+        detached_payload: bytes | None = None,
+        audience: str | Iterable[str] | None = None,
+        subject: str | None = None,
+        issuer: str | Sequence[str] | None = None,
+        leeway: float | timedelta = 0,
+    ) -> Any:
+        decoded = self.decode_complete(
+            jwt,
+            key,
+            algorithms,
+            options,
+            verify=verify,
+            detached_payload=detached_payload,
+            audience=audience,
+            subject=subject,
+            issuer=issuer,
+            leeway=leeway,
+        )
+        return decoded['payload']
+
+    def _verify_signature(
+        self,
+        signing_input: bytes,
+        header: dict[str, Any],
+        signature: bytes,
+        key: Any,
+        algorithms: Sequence[str] | None,
+    ) -> None:
+        if 'alg' not in header:
+            raise InvalidAlgorithmError('Algorithm not specified')
+
+        algorithm = header['alg']
+        if not algorithm or (algorithms is not None and algorithm not in algorithms):
+            raise InvalidAlgorithmError('The specified alg value is not allowed')
+        if not isinstance(algorithm, str) or algorithm not in self.algorithms:
+            raise InvalidAlgorithmError('Algorithm not supported')
+
+        if not self._verify(algorithm, key, signing_input, signature):
+            raise InvalidSignatureError('Signature verification failed')
+
+    def _get_claim_validator(
+        self,
+        options: dict[str, Any] | None,
+        audience: str | Iterable[str] | None,
+        issuer: str | Sequence[str] | None,
+        subject: str | None,
+        leeway: float | timedelta,
+    ) -> ClaimValidator:
+        cache_key = (id(options), id(audience), id(issuer), subject, leeway)
+        entry = self._claim_validators.get(cache_key)
+        if entry is not None and entry[0] is options and entry[1] is audience and entry[2] is issuer:
+            return entry[3]
+
+        call_options = dict(options or {})
+        call_options.setdefault('verify_signature', True)
+        if not call_options['verify_signature']:
+            for claim in REGISTERED_CLAIMS:
+                call_options.setdefault(f'verify_{claim}', False)
+        merged_options = {**self.options, **call_options}
+
+        validator = ClaimValidator(merged_options, audience, issuer, subject, leeway)
+        if len(self._claim_validators) >= CACHE_SIZE:
+            self._claim_validators.clear()
+        self._claim_validators[cache_key] = (options, audience, issuer, validator)
+        return validator
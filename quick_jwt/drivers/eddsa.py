@@ -0,0 +1,87 @@
+from typing import Any, ClassVar
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey, Ed448PublicKey
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from jwt import get_algorithm_by_name
+
+from quick_jwt.drivers.base import CACHE_SIZE, NativeDriver
+
+type EdPrivateKey = Ed25519PrivateKey | Ed448PrivateKey
+type EdPublicKey = Ed25519PublicKey | Ed448PublicKey
+
+
+class EdDSADriver(NativeDriver):
+    """Driver for EdDSA tokens signed with Ed25519 or Ed448 keys, a faster drop-in replacement of PyJWT.
+
+    PEM and SSH keys are parsed once, and the public key of a private key used for verification is
+    derived once, so each token only costs the ``sign`` or ``verify`` call of ``cryptography``.
+    Keys may be passed as strings, bytes or ``cryptography`` key objects, like to PyJWT.
+
+    Args:
+        options: Default decode options, the same as for ``PyJWT``.
+    """
+
+    algorithms: ClassVar[frozenset[str]] = frozenset(('EdDSA',))
+    default_algorithm: ClassVar[str] = 'EdDSA'
+
+    __slots__ = (
+        '_signing_keys',
+        '_verifying_keys',
+    )
+
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        super().__init__(options)
+        self._signing_keys: dict[Any, EdPrivateKey] = {}
+        self._verifying_keys: dict[Any, EdPublicKey] = {}
+
+    def _sign(self, algorithm: str, key: Any, signing_input: bytes) -> bytes:
+        if isinstance(key, (Ed25519PrivateKey, Ed448PrivateKey)):
+            return key.sign(signing_input)
+
+        try:
+            private_key = self._signing_keys.get(key)
+        except TypeError:
+            private_key = None
+        if private_key is None:
+            private_key = self._prepare_key(key)
+            self._remember(self._signing_keys, key, private_key)
+        return private_key.sign(signing_input)
+
+    def _verify(self, algorithm: str, key: Any, signing_input: bytes, signature: bytes) -> bool:
+        public_key = self._get_verifying_key(key)
+        try:
+            public_key.verify(signature, signing_input)
+        except InvalidSignature:
+            return False
+        return True
+
+    def _get_verifying_key(self, key: Any) -> EdPublicKey:
+        if isinstance(key, (Ed25519PublicKey, Ed448PublicKey)):
+            return key
+
+        try:
+            public_key = self._verifying_keys.get(key)
+        except TypeError:
+            public_key = None
+        if public_key is None:
+            prepared = self._prepare_key(key)
+            public_key = (
+                prepared.public_key() if isinstance(prepared, (Ed25519PrivateKey, Ed448PrivateKey)) else prepared
+            )
+            self._remember(self._verifying_keys, key, public_key)
+        return public_key
+
+    @staticmethod
+    def _prepare_key(key: Any) -> Any:
+        return get_algorithm_by_name('EdDSA').prepare_key(key)
+
+    @staticmethod
+    def _remember(cache: dict[Any, Any], key: Any, value: Any) -> None:
+        try:
+            hash(key)
+        except TypeError:
+            return
+        if len(cache) >= CACHE_SIZE:
+            cache.clear()
+        cache[key] = value
@@ -0,0 +1,64 @@
+import hashlib
+import hmac
+from typing import Any, Callable, ClassVar
+
+from jwt import InvalidKeyError
+from jwt.utils import force_bytes, is_pem_format, is_ssh_key
+
+from quick_jwt.drivers.base import CACHE_SIZE, NativeDriver
+
+HS_ALGORITHMS: dict[str, Callable[..., Any]] = {
+    'HS256': hashlib.sha256,
+    'HS384': hashlib.sha384,
+    'HS512': hashlib.sha512,
+}
+
+
+class HSDriver(NativeDriver):
+    """Driver for HS256, HS384 and HS512 tokens, a faster drop-in replacement of PyJWT for HMAC keys.
+
+    The HMAC state of every key is computed once and copied for each token, and the signature is
+    compared in constant time.
+
+    Args:
+        options: Default decode options, the same as for ``PyJWT``.
+    """
+
+    algorithms: ClassVar[frozenset[str]] = frozenset(HS_ALGORITHMS)
+    default_algorithm: ClassVar[str] = 'HS256'
+
+    __slots__ = ('_hmac_states',)
+
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        super().__init__(options)
+        self._hmac_states: dict[tuple[str, Any], Any] = {}
+
+    def _sign(self, algorithm: str, key: Any, signing_input: bytes) -> bytes:
+        mac = self._get_hmac_state(algorithm, key).copy()
+        mac.update(signing_input)
+        return mac.digest()  # type: ignore[no-any-return]
+
+    def _verify(self, algorithm: str, key: Any, signing_input: bytes, signature: bytes) -> bool:
+        return hmac.compare_digest(signature, self._sign(algorithm, key, signing_input))
+
+    def _get_hmac_state(self, algorithm: str, key: Any) -> Any:
+        try:
+            state = self._hmac_states.get((algorithm, key))
+        except TypeError:
+            return self._create_hmac_state(algorithm, key)
+
+        if state is None:
+            state = self._create_hmac_state(algorithm, key)
+            if len(self._hmac_states) >= CACHE_SIZE:
+                self._hmac_states.clear()
+            self._hmac_states[(algorithm, key)] = state
+        return state
+
+    @staticmethod
+    def _create_hmac_state(algorithm: str, key: str | bytes) -> Any:
+        key_bytes = force_bytes(key)
+        if is_pem_format(key_bytes) or is_ssh_key(key_bytes):
+            raise InvalidKeyError(
+                'The specified key is an asymmetric key or x509 certificate and should not be used as an HMAC secret.'
+            )
+        return hmac.new(key_bytes, digestmod=HS_ALGORITHMS[algorithm])
@@ -1,6 +1,28 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializeAsAny
 
 
 class JWTTokensDTO(BaseModel):
     access: str = Field(..., description='Access token string')
     refresh: str = Field(..., description='Refresh token string')
+
+
+class TokenCacheStatsDTO(BaseModel):
+    hits: int = Field(..., description='Number of lookups answered from the cache')
+    misses: int = Field(..., description='Number of lookups that fell through to the driver')
+    size: int = Field(..., description='Number of entries currently stored')
+    memory: int = Field(..., description='Approximate memory used by the entries in bytes')
+
+
+class TokenVerificationDTO(BaseModel):
+    token: str = Field(..., description='Verified token string')
+    payload: SerializeAsAny[BaseModel] | None = Field(
+        None, description='Validated payload model, None if the token was rejected'
+    )
+    error: str | None = Field(None, description='Name of the error which rejected the token')
+    detail: str | None = Field(None, description='Description of the error which rejected the token')
+
+
+class WarmUpDTO(BaseModel):
+    steps: dict[str, float] = Field(..., description='Seconds spent in every warm-up step, in the order they ran')
+    total: float = Field(..., description='Seconds spent in the whole warm-up')
+    errors: dict[str, str] = Field(default_factory=dict, description='Errors of the steps which failed, by step name')
@@ -1,25 +1,118 @@
-from fastapi import Request
+import re
+from typing import Any, Iterable
+
+from fastapi import status
+from jwt import InvalidTokenError
+from starlette.responses import JSONResponse
 from starlette.types import ASGIApp, Scope, Receive, Send
 
 from quick_jwt.config import QuickJWTConfig
+from quick_jwt.core.cookies import read_cookie
+from quick_jwt.core.security import read_bearer_token, read_websocket_token
+
+
+def compile_public_paths(public_paths: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile public paths into a single regular expression matched against the request path.
+
+    A path matches itself and everything below it, so ``/docs`` matches ``/docs`` and ``/docs/oauth``
+    but not ``/docsx``. A path ending with ``/`` matches everything that starts with it.
+    """
+    alternatives = []
+    for path in sorted(set(public_paths), key=len, reverse=True):
+        if path.endswith('/'):
+            alternatives.append(re.escape(path))
+        else:
+            alternatives.append(f'{re.escape(path)}(?:/|$)')
+    if not alternatives:
+        return None
+    return re.compile('|'.join(alternatives))
 
 
 class QuickJWTMiddleware:
+    """Makes the config available to the quick_jwt dependencies of every HTTP request and websocket.
+
+    The config is written straight into the state dict of the scope, which backs ``request.state``,
+    so no Request object is built for requests which do not use quick_jwt at all.
+
+    With ``authenticate`` enabled, the access token of every request outside of the public paths is
+    verified before the request reaches the application. Requests without a valid token are
+    answered with the unauthorized response of the config, websockets are closed with the policy
+    violation code before the handshake completes. The verified payload is stored in the
+    scope state as ``quick_jwt_principal`` and shared with the access dependencies, which do not
+    decode the token again.
+
+    Args:
+        app: ASGI application.
+        config: QuickJWTConfig used by the dependencies.
+        authenticate: Verify the access token of every request in the middleware.
+        public_paths: Paths which are not authenticated by the middleware.
+    """
+
     __slots__ = (
         'app',
         'config',
+        'authenticate',
+        '_public_paths',
+        '_unauthorized_response',
     )
 
-    def __init__(self, app: ASGIApp, config: QuickJWTConfig):
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: QuickJWTConfig,
+        authenticate: bool = False,
+        public_paths: Iterable[str] = (),
+    ):
         self.app = app
         if isinstance(config, QuickJWTConfig) is False:
             raise Exception("""Invalid type "config" param in QuickJWTMiddleware""")
         self.config = config
+        self.config.compile()
+
+        self.authenticate = authenticate
+        self._public_paths = compile_public_paths(public_paths)
+        exception = config.build_unauthorized_http_exception()
+        self._unauthorized_response = JSONResponse(
+            {'detail': exception.detail},
+            status_code=exception.status_code,
+            headers=exception.headers,
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope['type'] in ('http',):
-            request = Request(scope, receive)
-            request.state.quick_jwt_config = self.config
-            scope['request'] = request
+        scope_type = scope['type']
+        if scope_type == 'http' or scope_type == 'websocket':
+            state = scope.get('state')
+            if state is None:
+                state = scope['state'] = {}
+            state['quick_jwt_config'] = self.config
+
+            if self.authenticate and (self._public_paths is None or not self._public_paths.match(scope['path'])):
+                if not await self._authenticate(scope, state):
+                    if scope_type == 'http':
+                        await self._unauthorized_response(scope, receive, send)
+                    else:
+                        await send({'type': 'websocket.close', 'code': status.WS_1008_POLICY_VIOLATION, 'reason': ''})
+                    return
 
         await self.app(scope, receive, send)
+
+    async def _authenticate(self, scope: Scope, state: dict[str, Any]) -> bool:
+        plan = self.config.plan
+
+        if scope['type'] == 'websocket':
+            token = read_websocket_token(scope, plan.access_token_name)
+        else:
+            token = read_cookie(scope, plan.access_token_name)
+            if token is None:
+                token = read_bearer_token(scope)
+        if token is None:
+            return False
+
+        try:
+            payload = await plan.decode_async(token)
+        except InvalidTokenError:
+            return False
+
+        state['quick_jwt_principal'] = payload
+        state.setdefault('quick_jwt_payloads', {})[(id(plan), token)] = (True, payload)
+        return True
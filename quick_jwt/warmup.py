@@ -0,0 +1,144 @@
+import json
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Type
+
+from anyio import to_thread
+from fastapi import FastAPI
+from jwt import InvalidTokenError
+from jwt.utils import base64url_encode
+from pydantic import BaseModel
+
+from quick_jwt.config import QuickJWTConfig
+from quick_jwt.core.trusted import get_trusted_constructor
+from quick_jwt.dto import WarmUpDTO
+from quick_jwt.websocket import WebSocketWatcher
+
+WARM_UP_PAYLOAD = {'sub': 'quick-jwt-warm-up'}
+
+
+def _unsigned_token(algorithm: str) -> str:
+    header = base64url_encode(json.dumps({'alg': algorithm, 'typ': 'JWT'}).encode())
+    payload = base64url_encode(json.dumps(WARM_UP_PAYLOAD).encode())
+    return b'.'.join((header, payload, base64url_encode(b'warm-up'))).decode()
+
+
+class _Timer:
+    __slots__ = ('steps',)
+
+    def __init__(self) -> None:
+        self.steps: dict[str, float] = {}
+
+    async def step(self, name: str, function: Callable[[], Awaitable[Any]]) -> None:
+        started = time.perf_counter()
+        await function()
+        self.steps[name] = time.perf_counter() - started
+
+
+async def warm_up(config: QuickJWTConfig, *payload_models: Type[BaseModel]) -> WarmUpDTO:
+    """Do the work of the first requests ahead of time, usually at the startup of the application.
+
+    Steps:
+        plan: Compile the config, parsing the keys and prebuilding the driver arguments and cookie headers.
+        process_pool: Start the worker processes, when ``decode_process_workers`` is set.
+        encode: Sign a token, which fills the key caches of the driver and starts the crypto executor.
+        decode: Verify that token, which fills the header and claim caches of the driver.
+        models: Build the validators and the trusted constructors of the payload models.
+
+    The warm-up token is verified without the token caches, so it never shows up in them. Its claim
+    checks may fail, e.g. when ``decode_audience`` is set, after the signature was already verified.
+
+    When the config cannot sign, e.g. in a service which only verifies tokens with a public key, the
+    encode step is recorded in ``WarmUpDTO.errors`` and the decode step verifies a token with an
+    invalid signature instead, which still goes through the key and the signature check.
+
+    Args:
+        config: QuickJWTConfig of the application.
+        payload_models: Payload models used by the dependencies.
+
+    Returns:
+        WarmUpDTO with the seconds spent in every step and the errors of the steps which failed.
+    """
+    timer = _Timer()
+    started = time.perf_counter()
+
+    async def compile_plan() -> None:
+        config.compile()
+
+    await timer.step('plan', compile_plan)
+    plan = config.plan
+
+    process_pool = plan.decode_process_pool
+    if process_pool is not None:
+
+        async def start_process_pool() -> None:
+            await to_thread.run_sync(process_pool.start)
+
+        await timer.step('process_pool', start_process_pool)
+
+    errors: dict[str, str] = {}
+    token = ''
+
+    async def encode() -> None:
+        nonlocal token
+        try:
+            token = await plan.encode_async(dict(WARM_UP_PAYLOAD))
+        except Exception as e:
+            # Services which only verify tokens may configure no usable signing key
+            errors['encode'] = f'{type(e).__name__}: {e}'
+            token = _unsigned_token((config.decode_algorithms or ['HS256'])[0])
+
+    async def decode() -> None:
+        try:
+            if plan.decode_executor is not None:
+                await plan.decode_executor.run(plan.decoder.decode, token)
+            else:
+                plan.decoder.decode(token)
+        except InvalidTokenError:
+            pass
+
+    await timer.step('encode', encode)
+    await timer.step('decode', decode)
+
+    async def build_models() -> None:
+        for payload_model in payload_models:
+            if not payload_model.__pydantic_complete__:
+                payload_model.model_rebuild()
+            get_trusted_constructor(payload_model)
+
+    await timer.step('models', build_models)
+
+    return WarmUpDTO(steps=timer.steps, total=time.perf_counter() - started, errors=errors)
+
+
+def quick_jwt_lifespan(
+    config: QuickJWTConfig,
+    *payload_models: Type[BaseModel],
+    watcher: WebSocketWatcher | None = None,
+) -> Callable[[FastAPI], Any]:
+    """Build a lifespan for FastAPI which warms quick_jwt up before the first request.
+
+    The report of ``warm_up`` is stored as ``app.state.quick_jwt_warm_up``. The websocket watcher runs
+    for the lifetime of the application, and the worker processes are stopped at shutdown.
+
+    Example:
+        app = FastAPI(lifespan=quick_jwt_lifespan(config, UserScheme))
+
+    Args:
+        config: QuickJWTConfig of the application.
+        payload_models: Payload models used by the dependencies.
+        watcher: WebSocketWatcher to run while the application is running.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with AsyncExitStack() as stack:
+            app.state.quick_jwt_warm_up = await warm_up(config, *payload_models)
+            process_pool = config.plan.decode_process_pool
+            if process_pool is not None:
+                stack.callback(process_pool.shutdown)
+            if watcher is not None:
+                await stack.enter_async_context(watcher)
+            yield
+
+    return lifespan
@@ -0,0 +1,181 @@
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping, Self
+
+from anyio import create_task_group, sleep
+from anyio.abc import TaskGroup
+from fastapi import WebSocket, status
+from starlette.websockets import WebSocketState
+
+
+class _Session:
+    __slots__ = (
+        'websocket',
+        'claim',
+    )
+
+    def __init__(self, websocket: WebSocket, claim: Hashable | None) -> None:
+        self.websocket = websocket
+        self.claim = claim
+
+
+class WebSocketWatcher:
+    """Closes open websockets when their access token expires or is revoked.
+
+    A single task checks every connection on a timer. Expiry deadlines are kept in a heap, so a
+    check only touches the connections which expire, and revoked tokens are looked up in an index of
+    the ``revocation_claim`` values, so a check only touches the connections which are revoked.
+
+    The watcher runs while it is entered, usually in the lifespan of the application:
+
+        watcher = WebSocketWatcher(revoked=fetch_revoked_token_ids)
+
+        @asynccontextmanager
+        async def lifespan(app):
+            async with watcher:
+                yield
+
+    Args:
+        interval: Seconds between two checks.
+        revoked: Coroutine function returning the ``revocation_claim`` values revoked since its last call.
+        revocation_claim: Payload claim identifying the connections of a revoked token, e.g. ``jti`` or ``sub``.
+        close_code: Close code sent to expired and revoked connections.
+    """
+
+    __slots__ = (
+        'interval',
+        'revocation_claim',
+        'close_code',
+        '_revoked',
+        '_sessions',
+        '_claims',
+        '_deadlines',
+        '_counter',
+        '_task_group',
+    )
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        revoked: Callable[[], Awaitable[Iterable[Hashable]]] | None = None,
+        revocation_claim: str = 'jti',
+        close_code: int = status.WS_1008_POLICY_VIOLATION,
+    ) -> None:
+        if interval <= 0:
+            raise Exception("""Invalid "interval" param in WebSocketWatcher, must be greater than 0""")
+        self.interval = interval
+        self.revocation_claim = revocation_claim
+        self.close_code = close_code
+        self._revoked = revoked
+
+        # WebSocket is a Mapping and cannot be hashed, sessions are keyed by its id
+        self._sessions: dict[int, _Session] = {}
+        self._claims: dict[Hashable, set[_Session]] = {}
+        self._deadlines: list[tuple[float, int, _Session]] = []
+        self._counter = itertools.count()
+        self._task_group: TaskGroup | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def __aenter__(self) -> Self:
+        self._task_group = create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._run)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool | None:
+        task_group = self._task_group
+        if task_group is None:
+            return None
+        self._task_group = None
+        task_group.cancel_scope.cancel()
+        return await task_group.__aexit__(*exc_info)
+
+    def watch(self, websocket: WebSocket, payload: Mapping[str, Any], leeway: float = 0) -> None:
+        """Watch a connection authenticated with the decoded payload.
+
+        Args:
+            websocket: Authenticated websocket.
+            payload: Decoded payload of its access token.
+            leeway: Seconds the connection stays open after the ``exp`` claim.
+        """
+        self.discard(websocket)
+
+        claim = payload.get(self.revocation_claim)
+        if not isinstance(claim, Hashable):
+            claim = None
+        session = _Session(websocket, claim)
+        self._sessions[id(websocket)] = session
+        if claim is not None:
+            self._claims.setdefault(claim, set()).add(session)
+
+        exp = payload.get('exp')
+        if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+            heapq.heappush(self._deadlines, (exp + leeway, next(self._counter), session))
+            self._compact()
+
+    def discard(self, websocket: WebSocket) -> None:
+        """Stop watching a connection, usually once it is closed."""
+        session = self._sessions.pop(id(websocket), None)
+        if session is not None:
+            self._forget_claim(session)
+
+    def revoke(self, claim: Hashable) -> None:
+        """Close the connections whose ``revocation_claim`` equals ``claim``."""
+        for session in self._claims.pop(claim, ()):
+            if self._sessions.get(id(session.websocket)) is session:
+                del self._sessions[id(session.websocket)]
+                self._close_soon(session.websocket)
+
+    async def check(self) -> None:
+        """Close the connections whose tokens are expired or revoked."""
+        now = time.time()
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _, _, session = heapq.heappop(deadlines)
+            if self._sessions.get(id(session.websocket)) is session:
+                del self._sessions[id(session.websocket)]
+                self._forget_claim(session)
+                self._close_soon(session.websocket)
+
+        if self._revoked is not None:
+            for claim in await self._revoked():
+                self.revoke(claim)
+
+    async def _run(self) -> None:
+        while True:
+            await sleep(self.interval)
+            await self.check()
+
+    def _forget_claim(self, session: _Session) -> None:
+        if session.claim is None:
+            return
+        sessions = self._claims.get(session.claim)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._claims[session.claim]
+
+    def _compact(self) -> None:
+        # Closed connections leave their deadlines behind until they expire, drop them once they dominate the heap
+        if len(self._deadlines) > 2 * len(self._sessions) + 64:
+            self._deadlines = [
+                entry for entry in self._deadlines if self._sessions.get(id(entry[2].websocket)) is entry[2]
+            ]
+            heapq.heapify(self._deadlines)
+
+    def _close_soon(self, websocket: WebSocket) -> None:
+        if self._task_group is None:
+            raise Exception("""WebSocketWatcher is not running. Enter it with "async with watcher:" first""")
+        self._task_group.start_soon(self._close, websocket)
+
+    async def _close(self, websocket: WebSocket) -> None:
+        if websocket.application_state == WebSocketState.DISCONNECTED:
+            return
+        try:
+            await websocket.close(code=self.close_code)
+        except (RuntimeError, OSError):
+            # The client disconnected while the close was scheduled
+            pass
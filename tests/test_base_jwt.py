@@ -44,3 +44,28 @@ def test_base_jwt_config_some_args_is_none(_request, response, config):
             Children().some_args_is_none(_request, response, config)
 
         assert e.value.args[0] == 'The __call__ function was not called.'
+
+
+def test_base_jwt_bind_returns_request_copy():
+    from pydantic import BaseModel
+
+    from quick_jwt import QuickJWTConfig
+    from quick_jwt.authentication import RefreshJWT
+
+    class Payload(BaseModel):
+        sub: str
+
+    config = QuickJWTConfig(encode_key='key', decode_key='key')
+    request = Request({'type': 'http', 'headers': [], 'state': {'quick_jwt_config': config}})
+    depends = RefreshJWT(Payload, Payload, strict=True)
+
+    bound = depends._bind(request, None)
+
+    assert type(bound) is RefreshJWT
+    assert bound is not depends
+    assert bound._get_request() is request
+    assert bound._get_config() is config
+    assert bound._access_payload is Payload
+    assert bound._model_validate_kwargs == {'strict': True}
+    assert depends._request is None
+    assert depends._config is None
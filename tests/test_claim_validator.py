@@ -0,0 +1,77 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from quick_jwt import QuickJWTConfig
+from quick_jwt.core.claims import ClaimValidator
+
+KEY = 'Some1! Key'
+
+
+def raised(function, *args, **kwargs) -> tuple[type[Exception], str] | None:
+    try:
+        function(*args, **kwargs)
+    except Exception as e:
+        return type(e), str(e)
+    return None
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        {'sub': 'user', 'aud': 'api', 'iss': 'sso'},
+        {'sub': 'user', 'aud': ['web'], 'iss': 'sso'},
+        {'sub': 'user', 'aud': 'api', 'iss': 'other'},
+        {'sub': 'user', 'iss': 'sso'},
+        {'sub': 'user', 'aud': 'api'},
+        {'aud': 'api', 'iss': 'sso'},
+        {'sub': 'user', 'aud': 'api', 'iss': 'sso', 'exp': -1},
+        {'sub': 'user', 'aud': 'api', 'iss': 'sso', 'exp': int(time.time()) - 5},
+        {'sub': 'user', 'aud': 'api', 'iss': 'sso', 'nbf': int(time.time()) + 5},
+        {'sub': 'user', 'aud': 'api', 'iss': 'sso', 'iat': int(time.time()) + 60},
+    ],
+)
+def test_compiled_claims_match_pyjwt(payload):
+    config = QuickJWTConfig(
+        encode_key=KEY,
+        decode_key=KEY,
+        decode_audience=['web', 'api'],
+        decode_issuer=['auth', 'sso'],
+        decode_leeway=timedelta(seconds=30),
+        decode_options={'require': ['sub']},
+    )
+    token = jwt.encode(payload, KEY)
+
+    expected = raised(
+        jwt.decode,
+        token,
+        KEY,
+        algorithms=['HS256'],
+        audience=['web', 'api'],
+        issuer=['auth', 'sso'],
+        leeway=timedelta(seconds=30),
+        options={'require': ['sub']},
+    )
+    for _ in range(2):
+        assert raised(config.plan.decode, token) == expected
+
+
+def test_compiled_audience_is_reusable():
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, decode_audience=iter(['web', 'api']))
+    token = jwt.encode({'aud': 'api'}, KEY)
+
+    for _ in range(3):
+        assert config.plan.decode(token) == {'aud': 'api'}
+
+
+def test_compiled_claims_follow_driver_options():
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, driver=jwt.PyJWT(options={'verify_exp': False}))
+
+    assert config.plan.decode(jwt.encode({'exp': -1}, KEY)) == {'exp': -1}
+
+
+def test_claim_validator_rejects_invalid_audience():
+    with pytest.raises(TypeError):
+        ClaimValidator({}, audience=1)
@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+import jwt
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from quick_jwt import (
+    QuickJWTConfig,
+    QuickJWTMiddleware,
+    access_check_depends,
+    create_jwt_depends,
+    refresh_jwt_depends,
+)
+
+KEY = 'Some1! Key'
+REQUESTS = 1000
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post('/login/{sub}')
+    async def login(sub: str, jwt_: create_jwt_depends(Payload, Payload)):
+        # Let every other request resolve its dependencies before the tokens are created
+        await asyncio.sleep(0.01)
+        return await jwt_.create_access_token(Payload(sub=sub))
+
+    @app.get('/me')
+    async def me(payload: access_check_depends(Payload)):
+        await asyncio.sleep(0.01)
+        return payload
+
+    @app.post('/refresh')
+    async def refresh(jwt_: refresh_jwt_depends(Payload, Payload)):
+        await asyncio.sleep(0.01)
+        return jwt_.payload
+
+    app.add_middleware(QuickJWTMiddleware, QuickJWTConfig(encode_key=KEY, decode_key=KEY))
+    return app
+
+
+async def run_concurrently(method: str, urls: list[str], tokens: list[str | None]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        return await asyncio.gather(
+            *(
+                client.request(method, url, headers={} if token is None else {'Authorization': f'Bearer {token}'})
+                for url, token in zip(urls, tokens)
+            )
+        )
+
+
+def test_concurrent_create_jwt_sets_cookies_on_own_response():
+    subs = [str(i) for i in range(REQUESTS)]
+
+    responses = asyncio.run(run_concurrently('POST', [f'/login/{sub}' for sub in subs], [None] * REQUESTS))
+
+    for sub, response in zip(subs, responses):
+        assert response.status_code == 200
+        cookies = response.headers.get_list('set-cookie')
+        assert len(cookies) == 1
+        assert jwt.decode(response.cookies['access'], KEY, algorithms=['HS256']) == {'sub': sub}
+        assert jwt.decode(response.json(), KEY, algorithms=['HS256']) == {'sub': sub}
+
+
+def test_concurrent_checks_return_own_payload():
+    subs = [str(i) for i in range(REQUESTS)]
+    tokens: list[str | None] = [jwt.encode({'sub': sub}, KEY) for sub in subs]
+
+    for method, url in (('GET', '/me'), ('POST', '/refresh')):
+        responses = asyncio.run(run_concurrently(method, [url] * REQUESTS, tokens))
+
+        assert [response.json() for response in responses] == [{'sub': sub} for sub in subs]
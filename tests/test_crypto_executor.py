@@ -0,0 +1,104 @@
+import asyncio
+from uuid import UUID
+
+from fastapi import FastAPI, status
+from httpx import QueryParams
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, create_jwt_depends
+
+
+def _in_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class LoopRecordingDriver(PyJWT):
+    def __init__(self):
+        super().__init__()
+        self.calls_in_event_loop = []
+
+    def encode(self, *args, **kwargs):
+        self.calls_in_event_loop.append(_in_event_loop())
+        return super().encode(*args, **kwargs)
+
+    def decode(self, *args, **kwargs):
+        self.calls_in_event_loop.append(_in_event_loop())
+        return super().decode(*args, **kwargs)
+
+
+def test_crypto_executor_runs_driver_in_thread_pool():
+    key = 'Some1! Key'
+    driver = LoopRecordingDriver()
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        driver=driver,
+        crypto_executor='thread',
+        crypto_executor_inline_hmac=False,
+    )
+
+    class Payload(BaseModel):
+        sub: UUID
+
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create_endpoint(sub: UUID, create_jwt: create_jwt_depends(Payload, Payload)):
+        return await create_jwt.create_access_token(Payload(sub=sub))  # pragma: no cover
+
+    @app.get('/check')
+    async def check_endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+
+    access = client.get('/create', params=QueryParams(sub=sub)).json()
+    response = client.get('/check', headers={'Authorization': f'Bearer {access}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': sub}
+    assert driver.calls_in_event_loop == [False, False]
+
+
+def test_crypto_executor_keeps_hmac_inline():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, crypto_executor='thread')
+
+    plan = quick_jwt_config.compile()
+
+    assert plan.encode_executor is None
+    assert plan.decode_executor is None
+
+
+def test_crypto_executor_disabled_by_default():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, encode_algorithm='RS256')
+
+    plan = quick_jwt_config.compile()
+
+    assert plan.encode_executor is None
+    assert plan.decode_executor is None
+
+
+def test_crypto_executor_offloads_asymmetric_algorithms():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        encode_algorithm='RS256',
+        decode_algorithms=['RS256', 'HS256'],
+        crypto_executor='thread',
+    )
+
+    plan = quick_jwt_config.compile()
+
+    assert plan.encode_executor is not None
+    assert plan.decode_executor is plan.encode_executor
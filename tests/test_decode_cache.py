@@ -0,0 +1,153 @@
+import time
+from uuid import UUID
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, access_check_depends, QuickJWTMiddleware
+from quick_jwt.core.cache import TokenCache
+
+
+def test_decode_cache_hits():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        decode_cache_size=10,
+    )
+
+    class Payload(BaseModel):
+        sub: UUID
+
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    access = jwt.encode({'sub': sub, 'exp': int(time.time()) + 60}, key)
+    headers = {'Authorization': f'Bearer {access}'}
+
+    for _ in range(3):
+        response = client.get('/', headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {'sub': sub}
+
+    stats = quick_jwt_config.decode_cache.stats()
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_decode_cache_disabled_by_default():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+
+    assert quick_jwt_config.decode_cache is None
+
+
+def test_decode_cache_skips_invalid_tokens():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        decode_cache_size=10,
+    )
+
+    class Payload(BaseModel):
+        sub: UUID
+
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    access = jwt.encode({'sub': '73031704-0799-4c4e-8689-3b91d35c2d18', 'exp': int(time.time()) - 1}, key)
+    headers = {'Authorization': f'Bearer {access}'}
+
+    for _ in range(2):
+        response = client.get('/', headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    stats = quick_jwt_config.decode_cache.stats()
+    assert stats.hits == 0
+    assert stats.size == 0
+
+
+def test_token_cache_expires_entries():
+    cache = TokenCache(namespace=b'', max_size=10, max_bytes=1024 * 1024, ttl=60)
+    key = cache.digest('token')
+
+    cache.set(key, {'sub': '1'}, size=5, expires_at=time.time() - 1)
+    assert cache.get(key) is None
+
+    cache.set(key, {'sub': '1'}, size=5, expires_at=time.time() + 0.05)
+    assert cache.get(key) == {'sub': '1'}
+    time.sleep(0.06)
+    assert cache.get(key) is None
+    assert cache.stats().size == 0
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = TokenCache(namespace=b'', max_size=2, max_bytes=1024 * 1024, ttl=60)
+    first, second, third = cache.digest('first'), cache.digest('second'), cache.digest('third')
+
+    cache.set(first, 1, size=1)
+    cache.set(second, 2, size=1)
+    assert cache.get(first) == 1
+    cache.set(third, 3, size=1)
+
+    assert cache.get(second) is None
+    assert cache.get(first) == 1
+    assert cache.get(third) == 3
+
+
+def test_token_cache_memory_limit():
+    cache = TokenCache(namespace=b'', max_size=100, max_bytes=1024, ttl=60)
+
+    for index in range(10):
+        cache.set(cache.digest(str(index)), index, size=100)
+
+    stats = cache.stats()
+    assert stats.memory <= 1024
+    assert stats.size < 10
+    assert cache.get(cache.digest('9')) == 9
+
+
+def test_token_cache_digest_depends_on_namespace():
+    first = TokenCache(namespace=b'first', max_size=1, max_bytes=1024, ttl=60)
+    second = TokenCache(namespace=b'second', max_size=1, max_bytes=1024, ttl=60)
+
+    assert first.digest('token') != second.digest('token')
+
+
+@pytest.mark.parametrize(
+    'update, error',
+    [
+        ({'decode_key': 'Other1! Key'}, jwt.InvalidSignatureError),
+        ({'decode_audience': 'other'}, jwt.InvalidAudienceError),
+    ],
+)
+@pytest.mark.parametrize('deep', [False, True])
+def test_decode_cache_is_not_shared_with_copies(update, error, deep):
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, decode_audience='api', decode_cache_size=10)
+    token = jwt.encode({'sub': 'user', 'aud': 'api'}, key)
+    assert quick_jwt_config.plan.decode(token) == {'sub': 'user', 'aud': 'api'}
+
+    copied_config = quick_jwt_config.model_copy(update=update, deep=deep)
+
+    assert copied_config.decode_cache is not quick_jwt_config.decode_cache
+    assert copied_config.decode_cache.stats().size == 0
+    with pytest.raises(error):
+        copied_config.plan.decode(token)
+    assert quick_jwt_config.decode_cache.stats().size == 1
@@ -0,0 +1,135 @@
+import pickle
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed448, ed25519
+from fastapi import FastAPI, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, create_jwt_depends
+from quick_jwt.drivers import EdDSADriver
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def raised(function, *args, **kwargs) -> tuple[type[Exception], str] | None:
+    try:
+        function(*args, **kwargs)
+    except Exception as e:
+        return type(e), str(e)
+    return None
+
+
+def pem_pair(private_key: ed25519.Ed25519PrivateKey | ed448.Ed448PrivateKey) -> tuple[bytes, bytes]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+@pytest.fixture(params=[ed25519.Ed25519PrivateKey, ed448.Ed448PrivateKey], ids=['Ed25519', 'Ed448'])
+def private_key(request):
+    return request.param.generate()
+
+
+@pytest.mark.parametrize('as_pem', [False, True], ids=['objects', 'pem'])
+def test_eddsa_driver_matches_pyjwt(private_key, as_pem):
+    payload = {'sub': 'user', 'exp': int(time.time()) + 60, 'roles': ['admin']}
+    encode_key, decode_key = pem_pair(private_key) if as_pem else (private_key, private_key.public_key())
+    driver = EdDSADriver()
+
+    for _ in range(2):
+        token = driver.encode(payload, encode_key, 'EdDSA', headers={'kid': 'key-1'})
+        assert token == jwt.encode(payload, encode_key, 'EdDSA', headers={'kid': 'key-1'})
+        assert driver.decode_complete(token, decode_key, ['EdDSA']) == jwt.decode_complete(token, decode_key, ['EdDSA'])
+        assert driver.decode(token, encode_key, ['EdDSA']) == payload
+
+
+def test_eddsa_driver_errors_match_pyjwt(private_key):
+    public_key = private_key.public_key()
+    other_key = ed25519.Ed25519PrivateKey.generate().public_key()
+    token = jwt.encode({'sub': 'user', 'exp': int(time.time()) + 60}, private_key, 'EdDSA')
+    header, payload, signature = token.split('.')
+    driver = EdDSADriver()
+
+    cases = [
+        ((token, other_key), {'algorithms': ['EdDSA']}),
+        ((token, public_key), {'algorithms': ['HS256']}),
+        ((token, public_key), {}),
+        ((token, 'secret'), {'algorithms': ['EdDSA']}),
+        ((f'{header}.{payload}.{signature}!', public_key), {'algorithms': ['EdDSA']}),
+        ((f'{header}.{payload[:-2]}.{signature}', public_key), {'algorithms': ['EdDSA']}),
+        ((jwt.encode({'exp': -1}, private_key, 'EdDSA'), public_key), {'algorithms': ['EdDSA']}),
+        ((jwt.encode({'aud': 'web'}, private_key, 'EdDSA'), public_key), {'algorithms': ['EdDSA'], 'audience': 'api'}),
+    ]
+    for args, kwargs in cases:
+        assert raised(driver.decode, *args, **kwargs) == raised(jwt.decode, *args, **kwargs), args
+
+    assert raised(driver.encode, {'sub': 'user'}, 'secret', 'EdDSA')[0] is jwt.InvalidKeyError
+
+
+def test_eddsa_driver_rejects_other_algorithms(private_key):
+    driver = EdDSADriver()
+
+    with pytest.raises(NotImplementedError):
+        driver.encode({'sub': 'user'}, private_key, 'HS256')
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        driver.decode(jwt.encode({'sub': 'user'}, 'secret'), private_key.public_key(), algorithms=['HS256'])
+
+
+def test_eddsa_driver_is_picklable(private_key):
+    driver = pickle.loads(pickle.dumps(EdDSADriver(options={'verify_exp': False})))
+
+    token = driver.encode({'exp': -1}, private_key)
+
+    assert driver.decode(token, private_key.public_key(), ['EdDSA']) == {'exp': -1}
+
+
+def test_eddsa_driver_endpoints():
+    private_pem, public_pem = pem_pair(ed25519.Ed25519PrivateKey.generate())
+    config = QuickJWTConfig(
+        encode_key=private_pem,
+        decode_key=public_pem,
+        encode_algorithm='EdDSA',
+        decode_algorithms=['EdDSA'],
+        driver=EdDSADriver(),
+    )
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create(jwt_tokens: create_jwt_depends(Payload, Payload)):
+        return await jwt_tokens.create_jwt_tokens(Payload(sub='user'), Payload(sub='user'))
+
+    @app.get('/check')
+    async def check(payload: access_check_depends(Payload)):
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, config)
+    client = TestClient(app)
+
+    response = client.get('/create')
+    assert response.status_code == status.HTTP_200_OK
+    access = response.json()['access']
+    assert jwt.decode(access, public_pem, algorithms=['EdDSA'])['sub'] == 'user'
+
+    client.cookies.clear()
+    response = client.get('/check', headers={'Authorization': f'Bearer {access}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': 'user'}
+
+    other_key = ed25519.Ed25519PrivateKey.generate()
+    response = client.get(
+        '/check', headers={'Authorization': f'Bearer {jwt.encode({"sub": "user"}, other_key, "EdDSA")}'}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
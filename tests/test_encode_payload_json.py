@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, create_jwt_depends
+
+
+class Payload(BaseModel):
+    sub: UUID
+    created_at: datetime
+    roles: list[str]
+    score: float
+
+
+@pytest.fixture(params=['json', 'orjson'])
+def quick_jwt_config(request) -> QuickJWTConfig:
+    pytest.importorskip(request.param)
+    key = 'Some1! Key'
+    return QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        encode_headers={'kid': 'key-1'},
+        encode_payload_json=True,
+        json_codec=request.param,
+    )
+
+
+def test_encode_payload_json_matches_pyjwt(quick_jwt_config):
+    payload = Payload(
+        sub=UUID('73031704-0799-4c4e-8689-3b91d35c2d18'),
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        roles=['admin'],
+        score=0.5,
+    )
+
+    token = quick_jwt_config.plan.encode_model(payload)
+
+    assert token == jwt.encode(payload.model_dump(mode='json'), 'Some1! Key', headers={'kid': 'key-1'})
+
+
+def test_encode_payload_json_endpoints(quick_jwt_config):
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create(jwt_tokens: create_jwt_depends(Payload, Payload)):
+        payload = Payload(
+            sub=UUID('73031704-0799-4c4e-8689-3b91d35c2d18'),
+            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            roles=['admin'],
+            score=0.5,
+        )
+        return await jwt_tokens.create_jwt_tokens(payload, payload)
+
+    @app.get('/check')
+    async def check(payload: access_check_depends(Payload)):
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+
+    response = client.get('/create')
+    assert response.status_code == status.HTTP_200_OK
+    response = client.get('/check', headers={'Authorization': f'Bearer {response.json()["access"]}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        'sub': '73031704-0799-4c4e-8689-3b91d35c2d18',
+        'created_at': '2025-01-01T00:00:00Z',
+        'roles': ['admin'],
+        'score': 0.5,
+    }
+
+
+def test_encode_payload_json_requires_pyjwt_driver():
+    class Driver:
+        def encode(self, *args, **kwargs):
+            return ''  # pragma: no cover
+
+        def decode(self, *args, **kwargs):
+            return {}  # pragma: no cover
+
+    config = QuickJWTConfig(encode_key='key', decode_key='key', driver=Driver(), encode_payload_json=True)
+
+    with pytest.raises(Exception):
+        config.compile()
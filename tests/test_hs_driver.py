@@ -0,0 +1,211 @@
+import pickle
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, create_jwt_depends
+from quick_jwt.drivers import HSDriver
+
+KEY = 'Some1! Key with enough length for HS512'
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def raised(function, *args, **kwargs) -> tuple[type[Exception], str] | None:
+    try:
+        function(*args, **kwargs)
+    except Exception as e:
+        return type(e), str(e)
+    return None
+
+
+@pytest.mark.parametrize('algorithm', ['HS256', 'HS384', 'HS512'])
+@pytest.mark.parametrize(
+    'headers',
+    [None, {'kid': 'key-1'}, {'typ': None}, {'cty': 'JWT', 'alg': 'HS384'}],
+)
+@pytest.mark.parametrize('sort_headers', [True, False])
+def test_hs_driver_encode_matches_pyjwt(algorithm, headers, sort_headers):
+    payload = {
+        'sub': 'user',
+        'exp': datetime(2100, 1, 1, tzinfo=timezone.utc),
+        'iat': datetime(2000, 1, 1, tzinfo=timezone.utc),
+        'profile': {'roles': ['admin'], 'score': 0.5, 'active': True, 'manager': None},
+    }
+    driver = HSDriver()
+
+    for _ in range(2):
+        token = driver.encode(payload, KEY, algorithm, headers=headers, sort_headers=sort_headers)
+        assert token == jwt.encode(payload, KEY, algorithm, headers=headers, sort_headers=sort_headers)
+
+    algorithms = ['HS256', 'HS384', 'HS512']
+    assert driver.decode_complete(token, KEY, algorithms) == jwt.decode_complete(token, KEY, algorithms)
+
+
+def test_hs_driver_encode_errors_match_pyjwt():
+    driver = HSDriver()
+
+    cases = [
+        ((['sub'], KEY), {}),
+        (({'sub': 'user'}, KEY), {'headers': {'kid': 1}}),
+        (({'sub': 'user'}, '-----BEGIN PUBLIC KEY-----\nkey\n-----END PUBLIC KEY-----'), {}),
+        (({'sub': 'user'}, 1), {}),
+    ]
+    for args, kwargs in cases:
+        assert raised(driver.encode, *args, **kwargs)[0] is raised(jwt.encode, *args, **kwargs)[0]
+
+
+def test_hs_driver_detached_payload_matches_pyjwt():
+    driver = HSDriver()
+    token = driver.encode({'sub': 'user'}, KEY, headers={'b64': False})
+
+    assert token == jwt.encode({'sub': 'user'}, KEY, headers={'b64': False})
+    detached_payload = b'{"sub":"user"}'
+    assert driver.decode(token, KEY, ['HS256'], detached_payload=detached_payload) == {'sub': 'user'}
+    assert raised(driver.decode, token, KEY, ['HS256']) == raised(jwt.decode, token, KEY, ['HS256'])
+
+
+def test_hs_driver_decode_errors_match_pyjwt():
+    now = int(time.time())
+    token = jwt.encode({'sub': 'user', 'exp': now + 60}, KEY)
+    header, payload, signature = token.split('.')
+    no_alg_token = jwt.api_jws.encode(b'{}', KEY, headers={'alg': None, 'typ': 'JWT'})
+
+    cases = [
+        ((token, KEY), {}),
+        ((token, 'Wrong key'), {'algorithms': ['HS256']}),
+        ((token, KEY), {'algorithms': ['HS512']}),
+        ((no_alg_token, KEY), {'algorithms': ['HS256']}),
+        ((f'{header}.{payload}', KEY), {'algorithms': ['HS256']}),
+        ((f'{header}!.{payload}.{signature}', KEY), {'algorithms': ['HS256']}),
+        ((f'{header}.{payload}!.{signature}', KEY), {'algorithms': ['HS256']}),
+        ((f'{header}.{payload}.{signature}!', KEY), {'algorithms': ['HS256']}),
+        ((f'e30.{payload}.{signature}', KEY), {'algorithms': ['HS256']}),
+        ((f'W10.{payload}.{signature}', KEY), {'algorithms': ['HS256']}),
+        ((1, KEY), {'algorithms': ['HS256']}),
+        ((jwt.api_jws.encode(b'[]', KEY), KEY), {'algorithms': ['HS256']}),
+        ((jwt.api_jws.encode(b'{"sub":', KEY), KEY), {'algorithms': ['HS256']}),
+        ((token, '-----BEGIN PUBLIC KEY-----\nkey\n-----END PUBLIC KEY-----'), {'algorithms': ['HS256']}),
+    ]
+    driver = HSDriver()
+    for args, kwargs in cases:
+        assert raised(driver.decode, *args, **kwargs) == raised(jwt.decode, *args, **kwargs), args
+
+
+def test_hs_driver_rejects_other_algorithms():
+    driver = HSDriver()
+
+    with pytest.raises(NotImplementedError):
+        driver.encode({'sub': 'user'}, KEY, 'RS256')
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        driver.decode(jwt.encode({'sub': 'user'}, None, algorithm='none'), KEY, algorithms=['none'])
+
+
+@pytest.mark.parametrize(
+    ('payload', 'kwargs'),
+    [
+        ({'exp': -1}, {}),
+        ({'exp': 'never'}, {}),
+        ({'exp': -1}, {'leeway': timedelta(days=365 * 100)}),
+        ({'nbf': 4102444800}, {}),
+        ({'nbf': 'later'}, {}),
+        ({'iat': 4102444800}, {}),
+        ({'iat': 'later'}, {}),
+        ({'iat': 4102444800}, {'options': {'verify_iat': False}}),
+        ({'exp': -1}, {'options': {'verify_signature': False}}),
+        ({'sub': 'user'}, {'options': {'require': ['exp', 'iss']}}),
+        ({'aud': 'api'}, {}),
+        ({'aud': 'api'}, {'audience': 'api'}),
+        ({'aud': 'api'}, {'audience': ['web', 'api']}),
+        ({'aud': ['web', 'api']}, {'audience': 'api'}),
+        ({'aud': ['web']}, {'audience': 'api'}),
+        ({'aud': [1]}, {'audience': 'api'}),
+        ({'aud': 1}, {'audience': 'api'}),
+        ({}, {'audience': 'api'}),
+        ({'aud': ['api']}, {'audience': 'api', 'options': {'strict_aud': True}}),
+        ({'aud': 'api'}, {'audience': 'api', 'options': {'strict_aud': True}}),
+        ({'aud': 'web'}, {'audience': 'api', 'options': {'strict_aud': True}}),
+        ({'aud': 'api'}, {'audience': 'web', 'options': {'verify_aud': False}}),
+        ({'iss': 'auth'}, {'issuer': 'auth'}),
+        ({'iss': 'auth'}, {'issuer': ['auth', 'sso']}),
+        ({'iss': 'other'}, {'issuer': 'auth'}),
+        ({'iss': ['auth']}, {'issuer': ['auth']}),
+        ({}, {'issuer': 'auth'}),
+        ({'sub': 'user'}, {'subject': 'user'}),
+        ({'sub': 'user'}, {'subject': 'admin'}),
+        ({'sub': 1}, {}),
+        ({'jti': 1}, {}),
+        ({'jti': '1'}, {}),
+    ],
+)
+def test_hs_driver_claims_match_pyjwt(payload, kwargs):
+    token = jwt.encode(payload, KEY)
+    driver = HSDriver()
+
+    expected = raised(jwt.decode, token, KEY, ['HS256'], **kwargs)
+    for _ in range(2):
+        assert raised(driver.decode, token, KEY, ['HS256'], **kwargs) == expected
+    if expected is None:
+        assert driver.decode(token, KEY, ['HS256'], **kwargs) == jwt.decode(token, KEY, ['HS256'], **kwargs)
+
+
+def test_hs_driver_default_options():
+    token = jwt.encode({'exp': -1}, KEY)
+
+    driver = HSDriver(options={'verify_exp': False})
+
+    assert driver.decode(token, KEY, ['HS256']) == {'exp': -1}
+    with pytest.raises(jwt.ExpiredSignatureError):
+        driver.decode(token, KEY, ['HS256'], options={'verify_exp': True})
+
+
+def test_hs_driver_pyjwk():
+    jwk = jwt.PyJWK({'kty': 'oct', 'k': jwt.utils.base64url_encode(KEY.encode()).decode(), 'alg': 'HS384'})
+    driver = HSDriver()
+
+    token = driver.encode({'sub': 'user'}, jwk, None)
+
+    assert token == jwt.encode({'sub': 'user'}, jwk, None)
+    assert driver.decode(token, jwk) == {'sub': 'user'}
+
+
+def test_hs_driver_is_picklable():
+    driver = pickle.loads(pickle.dumps(HSDriver(options={'verify_exp': False})))
+
+    assert driver.decode(jwt.encode({'exp': -1}, KEY), KEY, ['HS256']) == {'exp': -1}
+
+
+def test_hs_driver_endpoints():
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, driver=HSDriver())
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create(jwt_tokens: create_jwt_depends(Payload, Payload)):
+        return await jwt_tokens.create_jwt_tokens(Payload(sub='user'), Payload(sub='user'))
+
+    @app.get('/check')
+    async def check(payload: access_check_depends(Payload)):
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, config)
+    client = TestClient(app)
+
+    response = client.get('/create')
+    assert response.status_code == status.HTTP_200_OK
+    access = response.json()['access']
+    assert jwt.decode(access, KEY, algorithms=['HS256'])['sub'] == 'user'
+
+    response = client.get('/check', headers={'Authorization': f'Bearer {access}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': 'user'}
+
+    client.cookies.clear()
+    response = client.get('/check', headers={'Authorization': f'Bearer {jwt.encode({"sub": "user"}, "Wrong key")}'})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,106 @@
+import json
+import pickle
+from datetime import datetime, timezone
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, create_jwt_depends
+from quick_jwt.core.codecs import get_json_codec
+
+
+class Payload(BaseModel):
+    sub: str
+    roles: list[str]
+
+
+@pytest.fixture(params=['json', 'orjson', 'msgspec'])
+def codec_name(request) -> str:
+    pytest.importorskip(request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('sort_headers', [True, False])
+def test_json_codec_tokens_match_pyjwt(codec_name, sort_headers):
+    key = 'Some1! Key'
+    headers = {'kid': 'key-1', 'cty': 'JWT'}
+    config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        encode_headers=headers,
+        encode_sort_headers=sort_headers,
+        json_codec=codec_name,
+    )
+    payload = {
+        'sub': '73031704-0799-4c4e-8689-3b91d35c2d18',
+        'exp': datetime(2100, 1, 1, tzinfo=timezone.utc),
+        'roles': ['admin', 'user'],
+        'profile': {'age': 30, 'score': 0.5, 'active': True, 'manager': None},
+    }
+
+    token = config.plan.encode(payload)
+
+    assert token == jwt.encode(payload, key, headers=headers, sort_headers=sort_headers)
+    assert config.plan.decode(token) == jwt.decode(token, key, algorithms=['HS256'])
+
+
+def test_json_codec_rejects_invalid_payload(codec_name):
+    config = QuickJWTConfig(encode_key='Some1! Key', decode_key='Some1! Key', json_codec=codec_name)
+
+    for payload in (b'[1, 2, 3]', b'{"sub":'):
+        with pytest.raises(jwt.DecodeError):
+            config.plan.decode(jwt.api_jws.encode(payload, 'Some1! Key'))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        config.plan.decode(jwt.encode({'exp': 1}, 'Some1! Key'))
+
+
+def test_json_codec_endpoints(codec_name):
+    key = 'Some1! Key'
+    config = QuickJWTConfig(encode_key=key, decode_key=key, json_codec=codec_name)
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create(jwt_tokens: create_jwt_depends(Payload, Payload)):
+        payload = Payload(sub='user', roles=['admin'])
+        return await jwt_tokens.create_jwt_tokens(payload, payload)
+
+    @app.get('/check')
+    async def check(payload: access_check_depends(Payload)):
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, config)
+    client = TestClient(app)
+
+    response = client.get('/create')
+    assert response.status_code == status.HTTP_200_OK
+    response = client.get('/check', headers={'Authorization': f'Bearer {response.json()["access"]}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': 'user', 'roles': ['admin']}
+
+
+def test_json_codec_decoder_is_picklable(codec_name):
+    config = QuickJWTConfig(encode_key='Some1! Key', decode_key='Some1! Key', json_codec=codec_name)
+    token = config.plan.encode({'sub': 'user'})
+
+    decoder = pickle.loads(pickle.dumps(config.plan.decoder))
+
+    assert decoder.decode(token) == ({'sub': 'user'}, None)
+
+
+def test_json_codec_auto():
+    assert get_json_codec('auto').name in ('json', 'orjson', 'msgspec')
+
+
+def test_json_codec_rejects_json_encoder():
+    class Encoder(json.JSONEncoder):
+        pass
+
+    config = QuickJWTConfig(encode_key='key', decode_key='key', json_codec='json', encode_json_encoder=Encoder)
+    config.compile()
+
+    config = QuickJWTConfig(encode_key='key', decode_key='key', json_codec='orjson', encode_json_encoder=Encoder)
+    with pytest.raises(Exception):
+        config.compile()
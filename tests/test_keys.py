@@ -0,0 +1,146 @@
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import QueryParams
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, create_jwt_depends
+from quick_jwt.core.keys import prepare_key
+
+pytest.importorskip('cryptography')
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, rsa  # noqa: E402
+
+
+def _pem_pair(private_key):
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+@pytest.fixture(scope='module')
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope='module')
+def ec_key():
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def test_prepare_key_parses_asymmetric_keys(rsa_key):
+    _, public_pem = _pem_pair(rsa_key)
+
+    prepared = prepare_key(public_pem, ['RS256', 'PS256'])
+
+    assert isinstance(prepared, rsa.RSAPublicKey)
+    assert prepare_key(public_pem, ['RS256']) is prepared
+
+
+def test_prepare_key_keeps_symmetric_keys():
+    assert prepare_key('Some1! Key', ['HS256']) == 'Some1! Key'
+
+
+def test_prepare_key_keeps_incompatible_algorithms(rsa_key):
+    _, public_pem = _pem_pair(rsa_key)
+
+    assert prepare_key(public_pem, ['RS256', 'ES256']) == public_pem
+    assert prepare_key(public_pem, ['RS256', 'HS256']) == public_pem
+
+
+def test_prepare_key_keeps_invalid_keys():
+    assert prepare_key('invalid key', ['RS256']) == 'invalid key'
+
+
+@pytest.mark.parametrize('algorithm', ['RS256', 'ES256'])
+def test_asymmetric_plan_uses_prepared_keys(algorithm, rsa_key, ec_key):
+    private_key = rsa_key if algorithm == 'RS256' else ec_key
+    private_pem, public_pem = _pem_pair(private_key)
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=private_pem,
+        decode_key=public_pem,
+        encode_algorithm=algorithm,
+        decode_algorithms=[algorithm],
+    )
+
+    plan = quick_jwt_config.compile()
+
+    assert not isinstance(plan.encoder._encode_params['key'], bytes)
+    assert not isinstance(plan.decoder._decode_params['key'], bytes)
+    assert plan.decode(plan.encode({'sub': '1'})) == {'sub': '1'}
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.keys = []
+        self._driver = PyJWT()
+
+    def encode(self, payload, key, **kwargs):
+        self.keys.append(key)
+        return self._driver.encode(payload, key, **kwargs)
+
+    def decode(self, jwt, key, **kwargs):
+        self.keys.append(key)
+        return self._driver.decode(jwt, key, **kwargs)
+
+
+def test_custom_driver_receives_configured_keys(rsa_key):
+    private_pem, public_pem = _pem_pair(rsa_key)
+    private_key, public_key = private_pem.decode(), public_pem.decode()
+    driver = RecordingDriver()
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=private_key,
+        decode_key=public_key,
+        encode_algorithm='RS256',
+        decode_algorithms=['RS256'],
+        driver=driver,
+    )
+    plan = quick_jwt_config.compile()
+
+    assert plan.decode(plan.encode({'sub': '1'})) == {'sub': '1'}
+    assert driver.keys == [private_key, public_key]
+    assert all(type(key) is str for key in driver.keys)
+
+
+def test_asymmetric_create_and_check(ec_key):
+    private_pem, public_pem = _pem_pair(ec_key)
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=private_pem,
+        decode_key=ec_key.public_key(),
+        encode_algorithm='ES256',
+        decode_algorithms=['ES256'],
+    )
+
+    class Payload(BaseModel):
+        sub: UUID
+
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create_endpoint(sub: UUID, create_jwt: create_jwt_depends(Payload, Payload)):
+        return await create_jwt.create_access_token(Payload(sub=sub))  # pragma: no cover
+
+    @app.get('/check')
+    async def check_endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+
+    access = client.get('/create', params=QueryParams(sub=sub)).json()
+    response = client.get('/check', headers={'Authorization': f'Bearer {access}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': sub}
@@ -0,0 +1,85 @@
+import jwt
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from quick_jwt import (
+    QuickJWTConfig,
+    QuickJWTMiddleware,
+    access_check_depends,
+    access_check_optional_depends,
+    refresh_check_depends,
+    refresh_check_optional_depends,
+)
+
+KEY = 'Some1! Key'
+TOKEN = jwt.encode({'sub': 'user'}, KEY)
+OTHER_TOKEN = jwt.encode({'sub': 'other'}, KEY)
+WRONG_TOKEN = jwt.encode({'sub': 'user'}, 'Wrong key')
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def build_app(depends_function) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/regular')
+    async def regular(payload: depends_function(Payload)):
+        return payload
+
+    @app.get('/lightweight')
+    async def lightweight(payload: depends_function(Payload, lightweight=True)):
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, QuickJWTConfig(encode_key=KEY, decode_key=KEY))
+    return app
+
+
+DEPENDS_FUNCTIONS = [
+    (access_check_depends, 'access'),
+    (refresh_check_depends, 'refresh'),
+    (access_check_optional_depends, 'access'),
+    (refresh_check_optional_depends, 'refresh'),
+]
+
+
+@pytest.mark.parametrize('depends_function, cookie_name', DEPENDS_FUNCTIONS)
+@pytest.mark.parametrize(
+    'authorization, cookie',
+    [
+        (None, None),
+        (f'Bearer {TOKEN}', None),
+        (f'bearer {TOKEN}', None),
+        (f'Basic {TOKEN}', None),
+        ('Bearer', None),
+        (f'Bearer {WRONG_TOKEN}', None),
+        (None, TOKEN),
+        (None, WRONG_TOKEN),
+        (f'Bearer {OTHER_TOKEN}', TOKEN),
+    ],
+)
+def test_lightweight_matches_regular(depends_function, cookie_name, authorization, cookie):
+    client = TestClient(build_app(depends_function))
+    headers = {} if authorization is None else {'Authorization': authorization}
+    if cookie is not None:
+        client.cookies.set(cookie_name, cookie)
+
+    regular = client.get('/regular', headers=headers)
+    lightweight = client.get('/lightweight', headers=headers)
+
+    assert lightweight.status_code == regular.status_code
+    assert lightweight.json() == regular.json()
+    assert lightweight.headers.get('www-authenticate') == regular.headers.get('www-authenticate')
+
+
+@pytest.mark.parametrize('depends_function, cookie_name', DEPENDS_FUNCTIONS)
+def test_lightweight_publishes_same_security_scheme(depends_function, cookie_name):
+    openapi = build_app(depends_function).openapi()
+
+    regular = openapi['paths']['/regular']['get']
+    lightweight = openapi['paths']['/lightweight']['get']
+    assert lightweight['security'] == regular['security']
+    assert list(openapi['components']['securitySchemes']) == [f'JWT {cookie_name} token into headers']
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fastapi import FastAPI, Request, status
 from fastapi.testclient import TestClient
@@ -52,6 +54,22 @@ def test_valid_config_definition():
         'decode_subject': None,
         'decode_issuer': None,
         'decode_leeway': 0.0,
+        'decode_cache_size': 0,
+        'decode_cache_ttl': 'PT5M',
+        'decode_cache_max_bytes': 16777216,
+        'crypto_executor': 'inline',
+        'crypto_executor_limit': 16,
+        'crypto_executor_inline_hmac': True,
+        'decode_process_workers': 0,
+        'decode_process_batch_size': 32,
+        'decode_process_batch_delay': 'PT0.001S',
+        'decode_max_token_length': 8192,
+        'decode_negative_cache_size': 0,
+        'decode_negative_cache_ttl': 'PT10S',
+        'decode_negative_cache_max_bytes': 1048576,
+        'decode_payload_json': False,
+        'json_codec': 'json',
+        'encode_payload_json': False,
     }
     assert response.json() == expected_response
 
@@ -82,3 +100,21 @@ def test_invalid_config_type():
     with pytest.raises(Exception) as e:
         client.get('/')
     assert e.value.args[0] == 'Invalid type "config" param in QuickJWTMiddleware'
+
+
+def test_middleware_writes_config_to_scope_state():
+    quick_jwt_config = QuickJWTConfig(encode_key='key', decode_key='key')
+    scopes = []
+
+    async def app(scope, receive, send):
+        scopes.append(scope)
+
+    middleware = QuickJWTMiddleware(app, quick_jwt_config)
+    asyncio.run(middleware({'type': 'http', 'state': {'existing': 1}}, None, None))
+    asyncio.run(middleware({'type': 'http'}, None, None))
+    asyncio.run(middleware({'type': 'lifespan'}, None, None))
+
+    assert scopes[0]['state'] == {'existing': 1, 'quick_jwt_config': quick_jwt_config}
+    assert scopes[1]['state'] == {'quick_jwt_config': quick_jwt_config}
+    assert 'request' not in scopes[0]
+    assert 'state' not in scopes[2]
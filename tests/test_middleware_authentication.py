@@ -0,0 +1,97 @@
+import jwt
+import pytest
+from fastapi import FastAPI, Request, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends
+from quick_jwt.middleware import compile_public_paths
+
+KEY = 'Some1! Key'
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+class CountingDriver(jwt.PyJWT):
+    def __init__(self):
+        super().__init__()
+        self.decode_calls = 0
+
+    def decode(self, *args, **kwargs):
+        self.decode_calls += 1
+        return super().decode(*args, **kwargs)
+
+
+@pytest.fixture
+def driver() -> CountingDriver:
+    return CountingDriver()
+
+
+@pytest.fixture
+def client(driver) -> TestClient:
+    app = FastAPI()
+
+    @app.get('/profile')
+    async def profile(request: Request, payload: access_check_depends(Payload)):
+        assert request.state.quick_jwt_principal == {'sub': payload.sub}
+        return payload
+
+    @app.get('/health')
+    async def health():
+        return 'ok'
+
+    @app.get('/static/{name}')
+    async def static(name: str):
+        return name
+
+    @app.get('/healthz')
+    async def healthz():
+        return 'ok'
+
+    quick_jwt_config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, driver=driver)
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config, authenticate=True, public_paths=['/health', '/static/'])
+    return TestClient(app)
+
+
+def test_middleware_authentication_rejects_early(client):
+    for headers in ({}, {'Authorization': f'Bearer {jwt.encode({"sub": "user"}, "Wrong key")}'}):
+        response = client.get('/profile', headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json() == {'detail': 'Unauthorized'}
+
+    assert client.get('/healthz').status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_middleware_authentication_skips_public_paths(client):
+    assert client.get('/health').json() == 'ok'
+    assert client.get('/static/app.js').json() == 'app.js'
+
+
+@pytest.mark.parametrize('use_cookie', [False, True])
+def test_middleware_authentication_decodes_once(client, driver, use_cookie):
+    token = jwt.encode({'sub': 'user'}, KEY)
+    if use_cookie:
+        client.cookies.set('access', token)
+        headers = {}
+    else:
+        headers = {'Authorization': f'Bearer {token}'}
+
+    response = client.get('/profile', headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': 'user'}
+    assert driver.decode_calls == 1
+
+
+def test_compile_public_paths():
+    pattern = compile_public_paths(['/docs', '/static/', '/docs/private'])
+
+    assert pattern.match('/docs')
+    assert pattern.match('/docs/oauth2-redirect')
+    assert pattern.match('/static/app.js')
+    assert not pattern.match('/docsx')
+    assert not pattern.match('/static')
+    assert not pattern.match('/api/docs')
+    assert compile_public_paths([]) is None
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import jwt
+from fastapi import FastAPI, status
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, create_jwt_depends, mint_many, mint_many_async
+
+
+class AccessPayload(BaseModel):
+    sub: str
+    role: str
+
+
+class RefreshPayload(BaseModel):
+    sub: str
+
+
+class BarrierDriver(PyJWT):
+    """Signs only when two tokens are being signed at the same time."""
+
+    def __init__(self):
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def encode(self, *args, **kwargs):
+        self.barrier.wait()
+        return super().encode(*args, **kwargs)
+
+
+def test_create_jwt_tokens_signs_concurrently():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        driver=BarrierDriver(),
+        crypto_executor='thread',
+        crypto_executor_inline_hmac=False,
+    )
+    app = FastAPI()
+
+    @app.get('/create')
+    async def create(jwt_tokens: create_jwt_depends(AccessPayload, RefreshPayload)):
+        return await jwt_tokens.create_jwt_tokens(AccessPayload(sub='user', role='admin'), RefreshPayload(sub='user'))
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+
+    response = client.get('/create')
+
+    assert response.status_code == status.HTTP_200_OK
+    tokens = response.json()
+    assert jwt.decode(tokens['access'], key, algorithms=['HS256']) == {'sub': 'user', 'role': 'admin'}
+    assert jwt.decode(tokens['refresh'], key, algorithms=['HS256']) == {'sub': 'user'}
+    assert response.cookies['access'] == tokens['access']
+    assert response.cookies['refresh'] == tokens['refresh']
+
+
+def test_mint_many():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    payloads = [({'sub': f'user-{i}', 'role': 'service'}, {'sub': f'user-{i}'}) for i in range(5)]
+
+    results = mint_many(payloads, AccessPayload, RefreshPayload, quick_jwt_config)
+
+    assert len(results) == 5
+    for i, result in enumerate(results):
+        assert jwt.decode(result.access, key, algorithms=['HS256']) == {'sub': f'user-{i}', 'role': 'service'}
+        assert jwt.decode(result.refresh, key, algorithms=['HS256']) == {'sub': f'user-{i}'}
+
+
+def test_mint_many_async():
+    key = 'Some1! Key'
+    payloads = [(AccessPayload(sub=f'user-{i}', role='service'), RefreshPayload(sub=f'user-{i}')) for i in range(9)]
+
+    for crypto_executor in ('inline', 'thread'):
+        quick_jwt_config = QuickJWTConfig(
+            encode_key=key,
+            decode_key=key,
+            crypto_executor=crypto_executor,
+            crypto_executor_limit=4,
+            crypto_executor_inline_hmac=False,
+        )
+
+        results = asyncio.run(mint_many_async(payloads, AccessPayload, RefreshPayload, quick_jwt_config))
+
+        assert results == mint_many(payloads, AccessPayload, RefreshPayload, quick_jwt_config)
+        assert [jwt.decode(result.refresh, key, algorithms=['HS256'])['sub'] for result in results] == [
+            f'user-{i}' for i in range(9)
+        ]
@@ -0,0 +1,141 @@
+import time
+from datetime import timedelta
+from uuid import UUID
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, access_check_optional_depends
+
+
+class CountingDriver(PyJWT):
+    def __init__(self):
+        super().__init__()
+        self.decode_calls = 0
+
+    def decode(self, *args, **kwargs):
+        self.decode_calls += 1
+        return super().decode(*args, **kwargs)
+
+
+class Payload(BaseModel):
+    sub: UUID
+
+
+def test_negative_cache_rejects_replayed_tokens():
+    key = 'Some1! Key'
+    driver = CountingDriver()
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, driver=driver, decode_negative_cache_size=10)
+
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    @app.get('/optional')
+    async def optional_endpoint(payload: access_check_optional_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    forged = jwt.encode({'sub': '73031704-0799-4c4e-8689-3b91d35c2d18'}, 'Another key')
+    headers = {'Authorization': f'Bearer {forged}'}
+
+    for _ in range(3):
+        response = client.get('/', headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.get('/optional', headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() is None
+
+    assert driver.decode_calls == 1
+    stats = quick_jwt_config.decode_negative_cache.stats()
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_negative_cache_keeps_error_type():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, decode_negative_cache_size=10)
+    plan = quick_jwt_config.compile()
+    expired = jwt.encode({'sub': '1', 'exp': int(time.time()) - 10}, key)
+
+    for _ in range(2):
+        with pytest.raises(jwt.ExpiredSignatureError):
+            plan.decode(expired)
+
+    assert quick_jwt_config.decode_negative_cache.stats().hits == 1
+
+
+@pytest.mark.parametrize('claim', ['nbf', 'iat'])
+def test_negative_cache_skips_immature_tokens(claim):
+    key = 'Some1! Key'
+    driver = CountingDriver()
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, driver=driver, decode_negative_cache_size=10)
+    plan = quick_jwt_config.compile()
+    immature = jwt.encode({'sub': '1', claim: int(time.time()) + 60}, key)
+
+    for _ in range(2):
+        with pytest.raises(jwt.ImmatureSignatureError):
+            plan.decode(immature)
+
+    assert driver.decode_calls == 2
+    assert quick_jwt_config.decode_negative_cache.stats().size == 0
+
+
+def test_negative_cache_entries_expire():
+    key = 'Some1! Key'
+    driver = CountingDriver()
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        driver=driver,
+        decode_negative_cache_size=10,
+        decode_negative_cache_ttl=timedelta(milliseconds=50),
+    )
+    plan = quick_jwt_config.compile()
+    forged = jwt.encode({'sub': '1'}, 'Another key')
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        plan.decode(forged)
+    time.sleep(0.06)
+    with pytest.raises(jwt.InvalidSignatureError):
+        plan.decode(forged)
+
+    assert driver.decode_calls == 2
+
+
+def test_negative_cache_skips_valid_tokens():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        decode_cache_size=10,
+        decode_negative_cache_size=10,
+    )
+    plan = quick_jwt_config.compile()
+    token = jwt.encode({'sub': '1'}, key)
+
+    assert plan.decode(token) == {'sub': '1'}
+    assert plan.decode(token) == {'sub': '1'}
+    assert quick_jwt_config.decode_negative_cache.stats().size == 0
+    assert quick_jwt_config.decode_cache.stats().hits == 1
+
+
+def test_negative_cache_is_not_shared_with_copies():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, decode_negative_cache_size=10)
+    token = jwt.encode({'sub': 'user'}, 'Other1! Key')
+    with pytest.raises(jwt.InvalidSignatureError):
+        quick_jwt_config.plan.decode(token)
+
+    copied_config = quick_jwt_config.model_copy(update={'decode_key': 'Other1! Key'})
+
+    assert copied_config.decode_negative_cache is not quick_jwt_config.decode_negative_cache
+    assert copied_config.plan.decode(token) == {'sub': 'user'}
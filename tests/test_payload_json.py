@@ -0,0 +1,161 @@
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import (
+    QuickJWTConfig,
+    QuickJWTMiddleware,
+    access_check_depends,
+    refresh_jwt_depends,
+    verify_many,
+)
+
+
+class Payload(BaseModel):
+    sub: UUID
+    created_at: datetime
+
+
+class CustomDriver:
+    def encode(self, payload: dict[str, Any], **kwargs: Any) -> str:
+        return jwt.encode(payload, **kwargs)  # pragma: no cover
+
+    def decode(self, token: str, **kwargs: Any) -> Any:
+        return jwt.decode(token, **kwargs)  # pragma: no cover
+
+
+@pytest.fixture
+def quick_jwt_config() -> QuickJWTConfig:
+    key = 'Some1! Key'
+    return QuickJWTConfig(encode_key=key, decode_key=key, decode_payload_json=True, decode_cache_size=10)
+
+
+def test_payload_json_access_check(quick_jwt_config):
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    token = jwt.encode({'sub': sub, 'created_at': '2025-01-01T00:00:00Z', 'exp': int(time.time()) + 60}, 'Some1! Key')
+
+    assert isinstance(quick_jwt_config.plan.decode(token), bytes)
+    for _ in range(2):
+        response = client.get('/', headers={'Authorization': f'Bearer {token}'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {'sub': sub, 'created_at': '2025-01-01T00:00:00Z'}
+
+    assert quick_jwt_config.decode_cache.stats().hits == 2
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        {'sub': '73031704-0799-4c4e-8689-3b91d35c2d18', 'created_at': '2025-01-01T00:00:00Z', 'exp': 1},
+        {'sub': 'not an uuid', 'created_at': '2025-01-01T00:00:00Z'},
+    ],
+)
+def test_payload_json_rejects_invalid_payload(quick_jwt_config, payload):
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app, raise_server_exceptions=False)
+    token = jwt.encode(payload, 'Some1! Key')
+
+    response = client.get('/', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code != status.HTTP_200_OK
+
+
+def test_payload_json_validates_claims_like_pyjwt():
+    key = 'Some1! Key'
+    options = {'require': ['role', 'exp']}
+    driver = PyJWT()
+    config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        decode_payload_json=True,
+        decode_options=options,
+        decode_audience='api',
+        decode_issuer='quick_jwt',
+    )
+    payloads = [
+        {'role': 'admin', 'exp': int(time.time()) + 60, 'aud': 'api', 'iss': 'quick_jwt'},
+        {'role': 'admin', 'exp': int(time.time()) + 60, 'aud': 'web', 'iss': 'quick_jwt'},
+        {'role': 'admin', 'exp': int(time.time()) + 60, 'aud': 'api', 'iss': 'other'},
+        {'exp': int(time.time()) + 60, 'aud': 'api', 'iss': 'quick_jwt'},
+        {'role': 'admin', 'exp': 'tomorrow', 'aud': 'api', 'iss': 'quick_jwt'},
+        {'role': 'admin', 'exp': int(time.time()) - 60, 'aud': 'api', 'iss': 'quick_jwt'},
+    ]
+
+    for payload in payloads:
+        token = jwt.encode(payload, key)
+        try:
+            expected: Any = driver.decode(
+                token, key, algorithms=['HS256'], options=options, audience='api', issuer='quick_jwt'
+            )
+        except jwt.InvalidTokenError as e:
+            expected = type(e)
+
+        try:
+            result: Any = json.loads(config.plan.decode(token))
+        except jwt.InvalidTokenError as e:
+            result = type(e)
+
+        assert result == expected
+
+
+def test_payload_json_rejects_non_object_payload(quick_jwt_config):
+    token = jwt.api_jws.encode(b'[1, 2, 3]', 'Some1! Key')
+
+    with pytest.raises(jwt.DecodeError):
+        quick_jwt_config.plan.decode(token)
+
+
+def test_payload_json_refresh_payload_is_dict(quick_jwt_config):
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(refresh: refresh_jwt_depends(Payload, Payload)):
+        return {'is_dict': isinstance(refresh.payload, dict), 'sub': refresh.payload['sub']}
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    token = jwt.encode({'sub': sub, 'created_at': datetime.now(timezone.utc).isoformat()}, 'Some1! Key')
+
+    response = client.get('/', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'is_dict': True, 'sub': sub}
+
+
+def test_payload_json_verify_many(quick_jwt_config):
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    token = jwt.encode({'sub': sub, 'created_at': '2025-01-01T00:00:00Z'}, 'Some1! Key')
+
+    valid, invalid = verify_many([token, 'invalid_token'], Payload, quick_jwt_config)
+
+    assert valid.payload == Payload(sub=UUID(sub), created_at=datetime(2025, 1, 1, tzinfo=timezone.utc))
+    assert invalid.payload is None
+
+
+def test_payload_json_requires_pyjwt_driver():
+    with pytest.raises(Exception):
+        QuickJWTConfig(encode_key='key', decode_key='key', driver=CustomDriver(), decode_payload_json=True).compile()
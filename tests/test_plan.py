@@ -0,0 +1,78 @@
+import copy
+
+import jwt
+import pytest
+from pydantic import ValidationError
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware
+
+
+def test_config_is_frozen():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+
+    with pytest.raises(ValidationError):
+        quick_jwt_config.access_token_name = 'new_access'
+
+
+def test_plan_is_compiled_once():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+
+    plan = quick_jwt_config.compile()
+
+    assert quick_jwt_config.plan is plan
+    assert quick_jwt_config.compile() is plan
+    assert plan.access_token_name == quick_jwt_config.access_token_name
+    assert plan.refresh_token_name == quick_jwt_config.refresh_token_name
+
+
+def test_plan_is_immutable():
+    key = 'Some1! Key'
+    plan = QuickJWTConfig(encode_key=key, decode_key=key).compile()
+
+    with pytest.raises(AttributeError):
+        plan.access_token_name = 'new_access'  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        plan.decoder = plan.decoder  # type: ignore[misc]
+
+
+def test_plan_invalid_driver():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, driver=None)
+
+    with pytest.raises(Exception) as e:
+        QuickJWTMiddleware(app=None, config=quick_jwt_config)
+
+    assert 'QuickJWTConfig.driver received invalid driver' in e.value.args[0]
+
+
+@pytest.mark.parametrize(
+    'copy_config',
+    [
+        lambda config: config.model_copy(update={'decode_key': 'Other1! Key'}),
+        lambda config: config.model_copy(update={'decode_key': 'Other1! Key'}, deep=True),
+    ],
+)
+def test_plan_is_not_shared_with_copies(copy_config):
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    plan = quick_jwt_config.compile()
+
+    copied_config = copy_config(quick_jwt_config)
+
+    assert quick_jwt_config.plan is plan
+    assert copied_config.plan is not plan
+    assert copied_config.plan.decode(jwt.encode({'sub': 'user'}, 'Other1! Key')) == {'sub': 'user'}
+    with pytest.raises(jwt.InvalidSignatureError):
+        copied_config.plan.decode(jwt.encode({'sub': 'user'}, key))
+
+
+def test_plan_is_not_shared_with_shallow_and_deep_copies():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    plan = quick_jwt_config.compile()
+
+    assert copy.copy(quick_jwt_config).plan is not plan
+    assert copy.deepcopy(quick_jwt_config).plan is not plan
+    assert quick_jwt_config.plan is plan
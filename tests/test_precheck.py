@@ -0,0 +1,79 @@
+from uuid import UUID
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends
+from quick_jwt.core.precheck import TokenPrecheck, TokenPrecheckError
+
+VALID_TOKEN = (
+    'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.'
+    'eyJzdWIiOiI3MzAzMTcwNC0wNzk5LTRjNGUtODY4OS0zYjkxZDM1YzJkMTgifQ.'
+    'rs-zlSQ6wuNFQY7Unpt02iM1qNCqOc1uYu42F-VuAz8'
+)
+
+
+class CountingDriver(PyJWT):
+    def __init__(self):
+        super().__init__()
+        self.decode_calls = 0
+
+    def decode(self, *args, **kwargs):
+        self.decode_calls += 1
+        return super().decode(*args, **kwargs)
+
+
+def test_precheck_accepts_valid_token():
+    TokenPrecheck(max_length=8192, algorithms=['HS256']).check(VALID_TOKEN)
+
+
+@pytest.mark.parametrize(
+    'token, message',
+    [
+        ('a' * 100, 'Token is too long'),
+        ('invalid_token', 'Token is not a base64url encoded JWS compact serialization'),
+        ('a.b.c.d', 'Token is not a base64url encoded JWS compact serialization'),
+        ('eyJhbGciOiJIUzI1NiJ9.e30.a+b', 'Token is not a base64url encoded JWS compact serialization'),
+        ('bm90IGpzb24.e30.abc', 'Token header is not a valid JSON'),
+        ('eyJhbGciOiJIUzUxMiJ9.e30.abc', 'Token algorithm is not allowed'),
+        ('eyJhbGciOlsiSFMyNTYiXX0.e30.abc', 'Token algorithm is not allowed'),
+        ('W10.e30.abc', 'Token algorithm is not allowed'),
+    ],
+)
+def test_precheck_rejects_malformed_token(token, message):
+    with pytest.raises(TokenPrecheckError) as e:
+        TokenPrecheck(max_length=64, algorithms=['HS256']).check(token)
+
+    assert e.value.args[0] == message
+    assert isinstance(e.value, jwt.InvalidTokenError)
+
+
+def test_precheck_skips_driver():
+    key = 'Some1! Key'
+    driver = CountingDriver()
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, driver=driver, decode_max_token_length=1024)
+
+    class Payload(BaseModel):
+        sub: UUID
+
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+
+    for token in ('a' * 2048, 'invalid_token', 'eyJhbGciOiJub25lIn0.e30.'):
+        response = client.get('/', headers={'Authorization': f'Bearer {token}'})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert driver.decode_calls == 0
+
+    response = client.get('/', headers={'Authorization': f'Bearer {VALID_TOKEN}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert driver.decode_calls == 1
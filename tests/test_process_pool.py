@@ -0,0 +1,92 @@
+import asyncio
+import pickle
+from uuid import UUID
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from fastapi import FastAPI, status
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, access_check_depends, verify_many
+
+
+@pytest.fixture
+def quick_jwt_config():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=key,
+        decode_key=key,
+        decode_process_workers=1,
+        decode_process_batch_size=4,
+    )
+    yield quick_jwt_config
+    quick_jwt_config.plan.decode_process_pool.shutdown()
+
+
+def test_process_pool_access_check(quick_jwt_config):
+    class Payload(BaseModel):
+        sub: UUID
+
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload)):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    access = jwt.encode({'sub': sub}, 'Some1! Key')
+
+    response = client.get('/', headers={'Authorization': f'Bearer {access}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'sub': sub}
+
+    response = client.get('/', headers={'Authorization': 'Bearer invalid_token'})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_process_pool_decode_many(quick_jwt_config):
+    process_pool = quick_jwt_config.plan.decode_process_pool
+    process_pool.start()
+    tokens = [jwt.encode({'sub': str(index)}, 'Some1! Key') for index in range(10)]
+    tokens.insert(3, 'invalid_token')
+
+    results = process_pool.decode_many(tokens)
+
+    assert len(results) == 11
+    assert results[3][0] is False
+    assert isinstance(results[3][1], jwt.InvalidTokenError)
+    assert [value[0]['sub'] for success, value in results if success] == [str(index) for index in range(10)]
+
+
+class SubPayload(BaseModel):
+    sub: str
+
+
+@pytest.mark.parametrize('algorithm', ['ES256', 'EdDSA'])
+def test_process_pool_prepared_key(algorithm):
+    if algorithm == 'ES256':
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    quick_jwt_config = QuickJWTConfig(
+        encode_key=private_key,
+        decode_key=private_key.public_key(),
+        encode_algorithm=algorithm,
+        decode_algorithms=[algorithm],
+        decode_process_workers=1,
+    )
+    token = jwt.encode({'sub': 'user'}, private_key, algorithm=algorithm)
+    forged = jwt.encode({'sub': 'user'}, ec.generate_private_key(ec.SECP256R1()), algorithm='ES256')
+    try:
+        assert pickle.loads(pickle.dumps(quick_jwt_config.plan.decoder)).decode(token)[0] == {'sub': 'user'}
+        assert asyncio.run(quick_jwt_config.plan.decode_async(token)) == {'sub': 'user'}
+
+        results = verify_many([token, forged], SubPayload, quick_jwt_config)
+        assert results[0].error is None
+        assert results[1].payload is None
+    finally:
+        quick_jwt_config.plan.decode_process_pool.shutdown()
@@ -0,0 +1,93 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, FastAPI, status
+from jwt import PyJWT
+from pydantic import BaseModel
+from starlette.testclient import TestClient
+
+from quick_jwt import (
+    QuickJWTConfig,
+    QuickJWTMiddleware,
+    access_check_depends,
+    access_check_optional_depends,
+    refresh_check_depends,
+)
+from quick_jwt.authentication import AccessTokenCheck
+
+ACCESS = (
+    'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.'
+    'eyJzdWIiOiI3MzAzMTcwNC0wNzk5LTRjNGUtODY4OS0zYjkxZDM1YzJkMTgifQ.'
+    'rs-zlSQ6wuNFQY7Unpt02iM1qNCqOc1uYu42F-VuAz8'
+)
+
+
+class CountingDriver(PyJWT):
+    def __init__(self):
+        super().__init__()
+        self.decode_calls = 0
+
+    def decode(self, *args, **kwargs):
+        self.decode_calls += 1
+        return super().decode(*args, **kwargs)
+
+
+class Payload(BaseModel):
+    sub: UUID
+
+
+class SubjectPayload(BaseModel):
+    sub: str
+
+
+def test_token_is_decoded_once_per_request():
+    key = 'Some1! Key'
+    driver = CountingDriver()
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, driver=driver)
+
+    app = FastAPI()
+    router = APIRouter(dependencies=[Depends(AccessTokenCheck(Payload))])
+
+    @router.get('/')
+    async def endpoint(
+        payload: access_check_depends(Payload),
+        subject: access_check_depends(SubjectPayload),
+        optional: access_check_optional_depends(Payload),
+        refresh: refresh_check_depends(Payload),
+    ):
+        return [payload, subject, optional, refresh]  # pragma: no cover
+
+    app.include_router(router)
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+
+    response = client.get('/', headers={'Authorization': f'Bearer {ACCESS}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{'sub': sub}] * 4
+    assert driver.decode_calls == 1
+
+    response = client.get('/', headers={'Authorization': f'Bearer {ACCESS}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert driver.decode_calls == 2
+
+
+def test_invalid_token_is_decoded_once_per_request():
+    driver = CountingDriver()
+    quick_jwt_config = QuickJWTConfig(encode_key='Another key', decode_key='Another key', driver=driver)
+
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(
+        optional: access_check_optional_depends(Payload),
+        subject: access_check_optional_depends(SubjectPayload),
+        payload: access_check_depends(Payload),
+    ):
+        return payload  # pragma: no cover
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+
+    response = client.get('/', headers={'Authorization': f'Bearer {ACCESS}'})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert driver.decode_calls == 1
@@ -0,0 +1,160 @@
+import json
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+import jwt
+import pytest
+from fastapi import FastAPI, status
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field, PrivateAttr, create_model
+from starlette.testclient import TestClient
+
+from quick_jwt import (
+    QuickJWTConfig,
+    QuickJWTMiddleware,
+    access_check_depends,
+    refresh_check_optional_depends,
+)
+from quick_jwt.core.trusted import get_trusted_constructor
+
+
+class Profile(BaseModel):
+    name: str
+    tags: list[str]
+
+
+class Payload(BaseModel):
+    sub: UUID
+    created_at: datetime
+    user_name: str = Field(alias='userName')
+    roles: list[str] = []
+    profile: Profile | None = None
+
+
+@pytest.fixture(params=[False, True], ids=['dict', 'json'])
+def quick_jwt_config(request) -> QuickJWTConfig:
+    key = 'Some1! Key'
+    return QuickJWTConfig(encode_key=key, decode_key=key, decode_payload_json=request.param)
+
+
+def test_trusted_access_check(quick_jwt_config):
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(payload: access_check_depends(Payload, trusted=True)):
+        assert isinstance(payload.sub, UUID)
+        assert isinstance(payload.created_at, datetime)
+        assert isinstance(payload.profile, Profile)
+        return payload
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    payload = {
+        'sub': '73031704-0799-4c4e-8689-3b91d35c2d18',
+        'created_at': '2025-01-01T00:00:00Z',
+        'userName': 'user',
+        'profile': {'name': 'User', 'tags': ['a']},
+    }
+    token = jwt.encode(payload, 'Some1! Key')
+
+    response = client.get('/', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        'sub': '73031704-0799-4c4e-8689-3b91d35c2d18',
+        'created_at': '2025-01-01T00:00:00Z',
+        'userName': 'user',
+        'roles': [],
+        'profile': {'name': 'User', 'tags': ['a']},
+    }
+
+    response = client.get('/', headers={'Authorization': 'Bearer invalid_token'})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_trusted_matches_validated_payload(quick_jwt_config):
+    app = FastAPI()
+
+    @app.get('/')
+    async def endpoint(
+        trusted: refresh_check_optional_depends(Payload, trusted=True),
+        validated: refresh_check_optional_depends(Payload),
+    ):
+        return trusted == validated
+
+    app.add_middleware(QuickJWTMiddleware, quick_jwt_config)
+    client = TestClient(app)
+    payload = {
+        'sub': '73031704-0799-4c4e-8689-3b91d35c2d18',
+        'created_at': datetime(2025, 1, 1, tzinfo=timezone.utc).isoformat(),
+        'userName': 'user',
+        'roles': ['admin'],
+        'exp': int(time.time()) + 60,
+    }
+    token = jwt.encode(payload, 'Some1! Key')
+
+    response = client.get('/', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() is True
+
+
+def test_trusted_constructors_are_bounded():
+    for index in range(100):
+        get_trusted_constructor(create_model(f'Model{index}', sub=(str, ...)))
+
+    assert get_trusted_constructor.cache_info().currsize == get_trusted_constructor.cache_info().maxsize == 64
+
+
+class ChoicesPayload(BaseModel):
+    uid: UUID = Field(validation_alias=AliasChoices('user_id', 'uid'))
+    team: str = Field('none', validation_alias=AliasPath('org', 'team'))
+
+
+class ExtraPayload(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    sub: UUID
+    user_name: str = Field(alias='userName')
+
+
+class ByNamePayload(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    sub: UUID
+    user_name: str = Field(alias='userName')
+
+
+class PostInitPayload(BaseModel):
+    sub: UUID
+    _role: str = PrivateAttr('user')
+
+    def model_post_init(self, context):
+        self._role = 'admin'
+
+
+SUB = '73031704-0799-4c4e-8689-3b91d35c2d18'
+
+
+@pytest.mark.parametrize(
+    'payload_model, payload',
+    [
+        (ChoicesPayload, {'user_id': SUB}),
+        (ChoicesPayload, {'uid': SUB, 'org': {'team': 'core'}}),
+        (ChoicesPayload, {'user_id': SUB, 'uid': '00000000-0000-0000-0000-000000000000'}),
+        (ExtraPayload, {'sub': SUB, 'userName': 'user', 'iat': 1, 'roles': ['admin']}),
+        (ByNamePayload, {'sub': SUB, 'user_name': 'user'}),
+        (ByNamePayload, {'sub': SUB, 'userName': 'user', 'iat': 1}),
+        (PostInitPayload, {'sub': SUB}),
+    ],
+)
+@pytest.mark.parametrize('raw', [False, True], ids=['dict', 'json'])
+def test_trusted_matches_validation_of_aliases_and_extras(payload_model, payload, raw):
+    constructor = get_trusted_constructor(payload_model)
+
+    trusted = constructor(json.dumps(payload).encode() if raw else dict(payload))
+    validated = payload_model.model_validate(payload)
+
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_extra == validated.model_extra
+    assert trusted.model_dump() == validated.model_dump()
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import time
+from uuid import UUID
+
+import jwt
+from pydantic import BaseModel
+
+from quick_jwt import QuickJWTConfig, verify_many, verify_many_async
+
+
+class Payload(BaseModel):
+    sub: UUID
+
+
+def test_verify_many():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    valid = jwt.encode({'sub': sub}, key)
+    expired = jwt.encode({'sub': sub, 'exp': int(time.time()) - 10}, key)
+    forged = jwt.encode({'sub': sub}, 'Another key')
+    invalid_payload = jwt.encode({'sub': 'not uuid'}, key)
+
+    results = verify_many([valid, expired, 'invalid_token', forged, invalid_payload, valid], Payload, quick_jwt_config)
+
+    assert [result.token for result in results] == [valid, expired, 'invalid_token', forged, invalid_payload, valid]
+    assert results[0].payload == Payload(sub=sub)
+    assert results[0].error is None
+    assert results[1].error == 'ExpiredSignatureError'
+    assert results[2].error == 'TokenPrecheckError'
+    assert results[3].error == 'InvalidSignatureError'
+    assert results[4].error == 'ValidationError'
+    assert results[5] is results[0]
+
+
+def test_verify_many_results_serialize_payload():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    token = jwt.encode({'sub': sub}, key)
+
+    result = verify_many([token], Payload, quick_jwt_config)[0]
+
+    assert result.model_dump()['payload'] == {'sub': UUID(sub)}
+    assert json.loads(result.model_dump_json()) == {
+        'token': token,
+        'payload': {'sub': sub},
+        'error': None,
+        'detail': None,
+    }
+
+
+def test_verify_many_rejects_forbidden_algorithm():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    token = jwt.encode({'sub': '73031704-0799-4c4e-8689-3b91d35c2d18'}, key, algorithm='HS512')
+
+    results = verify_many([token], Payload, quick_jwt_config)
+
+    assert results[0].payload is None
+    assert results[0].error == 'TokenPrecheckError'
+    assert results[0].detail == 'Token algorithm is not allowed'
+
+
+def test_verify_many_prechecks_before_parsing_header(monkeypatch):
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, decode_max_token_length=256)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    valid = jwt.encode({'sub': sub}, key)
+    too_long = jwt.encode({'sub': sub, 'data': 'x' * 256}, key)
+    parsed: list[str] = []
+
+    def get_unverified_header(token):
+        parsed.append(token)
+        return jwt.get_unverified_header(token)
+
+    monkeypatch.setattr('quick_jwt.batch.get_unverified_header', get_unverified_header)
+    results = verify_many([too_long, valid], Payload, quick_jwt_config)
+
+    assert results[0].error == 'TokenPrecheckError'
+    assert results[0].detail == 'Token is too long'
+    assert results[1].payload == Payload(sub=sub)
+    assert parsed == [valid]
+
+
+def test_verify_many_deduplicates_tokens():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key, decode_cache_size=10)
+    token = jwt.encode({'sub': '73031704-0799-4c4e-8689-3b91d35c2d18'}, key)
+
+    results = verify_many([token] * 100, Payload, quick_jwt_config)
+
+    assert len(results) == 100
+    stats = quick_jwt_config.decode_cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 0
+
+
+def test_verify_many_async():
+    key = 'Some1! Key'
+    quick_jwt_config = QuickJWTConfig(encode_key=key, decode_key=key)
+    sub = '73031704-0799-4c4e-8689-3b91d35c2d18'
+    tokens = (jwt.encode({'sub': sub, 'jti': str(index)}, key) for index in range(3))
+
+    results = asyncio.run(verify_many_async(tokens, Payload, quick_jwt_config, strict=False))
+
+    assert [result.payload for result in results] == [Payload(sub=sub)] * 3
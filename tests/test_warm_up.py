@@ -0,0 +1,100 @@
+import asyncio
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from quick_jwt import (
+    HSDriver,
+    QuickJWTConfig,
+    QuickJWTMiddleware,
+    WarmUpDTO,
+    WebSocketWatcher,
+    quick_jwt_lifespan,
+    warm_up,
+)
+from quick_jwt.core.trusted import get_trusted_constructor
+
+KEY = 'Some1! Key'
+
+
+class WarmUpPayload(BaseModel):
+    sub: str
+
+
+def test_warm_up_reports_steps():
+    driver = HSDriver()
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, driver=driver, decode_cache_size=16)
+    get_trusted_constructor.cache_clear()
+
+    report = asyncio.run(warm_up(config, WarmUpPayload))
+
+    assert isinstance(report, WarmUpDTO)
+    assert list(report.steps) == ['plan', 'encode', 'decode', 'models']
+    assert all(seconds >= 0 for seconds in report.steps.values())
+    assert report.total >= sum(report.steps.values())
+    assert driver._hmac_states
+    assert get_trusted_constructor.cache_info().currsize == 1
+    assert report.errors == {}
+    assert config.decode_cache.stats().size == 0
+
+
+def test_warm_up_ignores_failing_claims():
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, decode_audience='api', crypto_executor='thread')
+
+    report = asyncio.run(warm_up(config))
+
+    assert 'decode' in report.steps
+
+
+def test_quick_jwt_lifespan():
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY)
+    watcher = WebSocketWatcher()
+    app = FastAPI(lifespan=quick_jwt_lifespan(config, WarmUpPayload, watcher=watcher))
+
+    @app.get('/')
+    async def index(request: Request):
+        return request.app.state.quick_jwt_warm_up
+
+    app.add_middleware(QuickJWTMiddleware, config)
+    with TestClient(app) as client:
+        assert watcher._task_group is not None
+        assert set(client.get('/').json()['steps']) == {'plan', 'encode', 'decode', 'models'}
+    assert watcher._task_group is None
+
+
+def test_warm_up_starts_process_pool():
+    config = QuickJWTConfig(encode_key=KEY, decode_key=KEY, decode_process_workers=1)
+    app = FastAPI(lifespan=quick_jwt_lifespan(config))
+
+    with TestClient(app):
+        assert 'process_pool' in app.state.quick_jwt_warm_up.steps
+        assert config.plan.decode_process_pool._executor is not None
+    assert config.plan.decode_process_pool._executor is None
+
+
+@pytest.mark.parametrize('encode_key', ['', 'public'])
+def test_warm_up_verify_only_config(encode_key):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    config = QuickJWTConfig(
+        encode_key=public_pem if encode_key == 'public' else encode_key,
+        decode_key=public_pem,
+        encode_algorithm='RS256',
+        decode_algorithms=['RS256'],
+    )
+    app = FastAPI(lifespan=quick_jwt_lifespan(config))
+
+    with TestClient(app):
+        report = app.state.quick_jwt_warm_up
+        assert list(report.steps) == ['plan', 'encode', 'decode', 'models']
+        assert list(report.errors) == ['encode']
+
+    token = jwt.encode({'sub': 'user'}, private_key, algorithm='RS256')
+    assert config.plan.decode(token) == {'sub': 'user'}
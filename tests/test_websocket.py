@@ -0,0 +1,125 @@
+import time
+from contextlib import asynccontextmanager
+
+import jwt
+import pytest
+from fastapi import FastAPI, WebSocket, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.websockets import WebSocketDisconnect
+
+from quick_jwt import QuickJWTConfig, QuickJWTMiddleware, WebSocketWatcher, access_check_websocket_depends
+from quick_jwt.core.security import read_websocket_token
+
+KEY = 'Some1! Key'
+
+
+class Payload(BaseModel):
+    sub: str
+
+
+def build_client(watcher: WebSocketWatcher | None = None, authenticate: bool = False) -> TestClient:
+    @asynccontextmanager
+    async def lifespan(app):
+        if watcher is None:
+            yield
+            return
+        async with watcher:
+            yield
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.websocket('/ws')
+    async def ws_endpoint(websocket: WebSocket, payload: access_check_websocket_depends(Payload, watcher=watcher)):
+        await websocket.accept(subprotocol='chat' if 'chat' in websocket.scope['subprotocols'] else None)
+        await websocket.send_json(payload.model_dump())
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+
+    app.add_middleware(QuickJWTMiddleware, QuickJWTConfig(encode_key=KEY, decode_key=KEY), authenticate=authenticate)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize('authenticate', [False, True])
+@pytest.mark.parametrize('transport', ['cookie', 'protocol', 'query'])
+def test_websocket_token_transports(transport, authenticate):
+    token = jwt.encode({'sub': 'user'}, KEY)
+    client = build_client(authenticate=authenticate)
+    url, kwargs = '/ws', {}
+    if transport == 'cookie':
+        client.cookies.set('access', token)
+    elif transport == 'protocol':
+        kwargs['subprotocols'] = ['chat', f'bearer.{token}']
+    else:
+        url = f'/ws?access={token}'
+
+    with client.websocket_connect(url, **kwargs) as websocket:
+        assert websocket.receive_json() == {'sub': 'user'}
+
+
+@pytest.mark.parametrize('authenticate', [False, True])
+@pytest.mark.parametrize('token', [None, jwt.encode({'sub': 'user'}, 'Wrong key')])
+def test_websocket_rejects_invalid_token(token, authenticate):
+    client = build_client(authenticate=authenticate)
+    url = '/ws' if token is None else f'/ws?access={token}'
+
+    with pytest.raises(WebSocketDisconnect) as e:
+        with client.websocket_connect(url):
+            pass  # pragma: no cover
+    assert e.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_websocket_closed_on_expiry():
+    watcher = WebSocketWatcher(interval=0.05)
+    token = jwt.encode({'sub': 'user', 'exp': time.time() + 1}, KEY)
+
+    with build_client(watcher) as client:
+        with client.websocket_connect(f'/ws?access={token}') as websocket:
+            assert websocket.receive_json() == {'sub': 'user'}
+            assert len(watcher) == 1
+            with pytest.raises(WebSocketDisconnect) as e:
+                websocket.receive_text()
+            assert e.value.code == status.WS_1008_POLICY_VIOLATION
+            assert len(watcher) == 0
+
+
+def test_websocket_closed_on_revocation():
+    revoked = []
+
+    async def fetch_revoked():
+        ids = list(revoked)
+        revoked.clear()
+        return ids
+
+    watcher = WebSocketWatcher(interval=0.05, revoked=fetch_revoked)
+    first = jwt.encode({'sub': 'user', 'jti': 'first'}, KEY)
+    second = jwt.encode({'sub': 'user', 'jti': 'second'}, KEY)
+
+    with build_client(watcher) as client:
+        with client.websocket_connect(f'/ws?access={first}') as first_websocket:
+            with client.websocket_connect(f'/ws?access={second}') as second_websocket:
+                first_websocket.receive_json()
+                second_websocket.receive_json()
+                assert len(watcher) == 2
+
+                revoked.append('first')
+                with pytest.raises(WebSocketDisconnect) as e:
+                    first_websocket.receive_text()
+                assert e.value.code == status.WS_1008_POLICY_VIOLATION
+                assert len(watcher) == 1
+        assert len(watcher) == 0
+
+
+def test_read_websocket_token():
+    def scope(headers=(), query_string=b''):
+        return {'type': 'websocket', 'headers': list(headers), 'query_string': query_string}
+
+    assert read_websocket_token(scope(), 'access') is None
+    assert read_websocket_token(scope([(b'cookie', b'access=a')], b'access=c'), 'access') == 'a'
+    assert read_websocket_token(scope([(b'sec-websocket-protocol', b'chat, bearer.b')], b'access=c'), 'access') == 'b'
+    assert read_websocket_token(scope([(b'sec-websocket-protocol', b'chat, bearer.')]), 'access') is None
+    assert read_websocket_token(scope(query_string=b'x=1&access=c'), 'access') == 'c'
+    assert read_websocket_token(scope(query_string=b'access_token=c'), 'access') is None